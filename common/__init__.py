@@ -0,0 +1 @@
+# Общие инструменты для всех лабораторных работ
@@ -0,0 +1,134 @@
+"""
+Общий модуль для микробенчмарков всех лабораторных работ.
+
+Каждое измерение делается по одной схеме: прогревочные запуски, несколько
+повторов с отключенным сборщиком мусора, подготовка входных данных (setup)
+перед каждым повтором вне измеряемого участка и сводная статистика
+(min/median/p95/stddev) с поиском выбросов.
+"""
+
+import gc
+import math
+import statistics
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+
+def percentile(sorted_times: List[float], q: float) -> float:
+    """
+    Перцентиль с линейной интерполяцией между соседними значениями.
+
+    Args:
+        sorted_times: Отсортированный список значений
+        q: Уровень перцентиля от 0 до 100
+
+    Returns:
+        Значение перцентиля
+    """
+    if not sorted_times:
+        raise ValueError("Пустой список значений")
+    position = (len(sorted_times) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    fraction = position - lower
+    return sorted_times[lower] + (sorted_times[upper] - sorted_times[lower]) * fraction
+
+
+class BenchmarkResult:
+    """Распределение времени повторов одного измерения (секунды на один вызов)."""
+
+    def __init__(self, name: str, times: List[float], number: int, value: Any = None) -> None:
+        self.name = name
+        self.times = times
+        self.number = number
+        self.value = value  # Результат последнего вызова функции
+        self._sorted = sorted(times)
+
+    @property
+    def min(self) -> float:
+        return self._sorted[0]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self._sorted)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self._sorted)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self._sorted, 95)
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self._sorted) if len(self._sorted) > 1 else 0.0
+
+    @property
+    def outliers(self) -> List[float]:
+        """Повторы за пределами границ Тьюки (1.5 межквартильного размаха)."""
+        if len(self._sorted) < 4:
+            return []
+        q1 = percentile(self._sorted, 25)
+        q3 = percentile(self._sorted, 75)
+        spread = 1.5 * (q3 - q1)
+        return [t for t in self.times if t < q1 - spread or t > q3 + spread]
+
+    def summary(self) -> str:
+        """Однострочная сводка для печати."""
+        line = (f"{self.name}: median {self.median:.6f}с, min {self.min:.6f}с, "
+                f"p95 {self.p95:.6f}с, stddev {self.stddev:.6f}с, повторов {len(self.times)}")
+        if self.outliers:
+            line += f", выбросов {len(self.outliers)}"
+        return line
+
+    def __repr__(self) -> str:
+        return f"BenchmarkResult({self.summary()})"
+
+
+def benchmark(func: Callable, *args, setup: Optional[Callable[[], Tuple]] = None,
+              repeat: int = 5, warmup: int = 1, number: int = 1,
+              disable_gc: bool = True, name: Optional[str] = None) -> BenchmarkResult:
+    """
+    Измерение времени выполнения функции.
+
+    Args:
+        func: Функция для измерения
+        *args: Аргументы функции, если setup не задан
+        setup: Функция без аргументов, возвращающая кортеж аргументов для func;
+            вызывается перед каждым повтором вне измеряемого участка, поэтому
+            подходит для функций, изменяющих вход (сортировки на месте и т.п.)
+        repeat: Количество измеряемых повторов
+        warmup: Количество прогревочных запусков (не учитываются)
+        number: Количество вызовов func в одном повторе (для очень быстрых функций)
+        disable_gc: Отключать ли сборщик мусора на время измерения
+        name: Имя измерения для сводки (по умолчанию имя функции)
+
+    Returns:
+        BenchmarkResult с временем одного вызова в каждом повторе
+    """
+    if repeat < 1 or number < 1:
+        raise ValueError("repeat и number должны быть положительными")
+
+    gc_was_enabled = gc.isenabled()
+    times = []
+    value = None
+    try:
+        for run in range(warmup + repeat):
+            call_args = setup() if setup is not None else args
+            gc.collect()
+            if disable_gc:
+                gc.disable()
+            start = time.perf_counter()
+            for _ in range(number):
+                value = func(*call_args)
+            elapsed = time.perf_counter() - start
+            if gc_was_enabled:
+                gc.enable()
+            if run >= warmup:
+                times.append(elapsed / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return BenchmarkResult(name or getattr(func, '__name__', 'func'), times, number, value)
@@ -0,0 +1,234 @@
+"""
+Хранилище результатов бенчмарков и поиск регрессий производительности.
+
+Каждое измерение дописывается строкой JSON в файл (по умолчанию
+benchmark_results/results.jsonl в корне репозитория, путь можно
+переопределить переменной окружения BENCHMARK_RESULTS): лабораторная
+работа, алгоритм, семейство входных данных, размер, отпечаток машины
+и все времена повторов. Все записи одного запуска скрипта имеют общий run_id.
+
+Командная строка:
+    python common/results_store.py list
+    python common/results_store.py compare BASELINE_RUN [CURRENT_RUN]
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'benchmark_results', 'results.jsonl'
+)
+
+
+def machine_fingerprint() -> Dict[str, Any]:
+    """Описание машины и интерпретатора; поле id - короткий хеш остальных полей."""
+    info = {
+        'system': platform.system(),
+        'release': platform.release(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+    }
+    digest = hashlib.sha1(json.dumps(info, sort_keys=True).encode()).hexdigest()
+    info['id'] = digest[:12]
+    return info
+
+
+class ResultsStore:
+    """Хранилище результатов в формате JSON lines."""
+
+    def __init__(self, path: Optional[str] = None, lab: str = '', run_id: Optional[str] = None) -> None:
+        self.path = path or os.environ.get('BENCHMARK_RESULTS', DEFAULT_PATH)
+        self.lab = lab
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d-%H%M%S-') + uuid.uuid4().hex[:6]
+        self._machine = machine_fingerprint()
+
+    def record(self, result, algorithm: Optional[str] = None, family: str = '',
+               size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Сохранение одного измерения.
+
+        Args:
+            result: BenchmarkResult из common.benchmark
+            algorithm: Имя алгоритма (по умолчанию result.name)
+            family: Семейство входных данных (random, sorted, ...)
+            size: Размер входа
+
+        Returns:
+            Записанная запись
+        """
+        entry = {
+            'run_id': self.run_id,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'lab': self.lab,
+            'algorithm': algorithm or result.name,
+            'family': family,
+            'size': size,
+            'machine': self._machine,
+            'number': result.number,
+            'times': result.times,
+            'median': result.median,
+            'min': result.min,
+            'p95': result.p95,
+            'stddev': result.stddev,
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        return entry
+
+    def load(self, run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Все записи хранилища или записи одного запуска."""
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    if run_id is None or entry['run_id'] == run_id:
+                        entries.append(entry)
+        return entries
+
+    def runs(self) -> List[Tuple[str, str, str, int]]:
+        """Список запусков: (run_id, время первой записи, лабораторная, число записей)."""
+        runs: Dict[str, list] = {}
+        for entry in self.load():
+            if entry['run_id'] not in runs:
+                runs[entry['run_id']] = [entry['run_id'], entry['timestamp'], entry['lab'], 0]
+            runs[entry['run_id']][3] += 1
+        return [tuple(run) for run in runs.values()]
+
+
+def mann_whitney_greater(baseline: List[float], current: List[float]) -> float:
+    """
+    Односторонний критерий Манна-Уитни: p-значение гипотезы, что current
+    систематически больше baseline (нормальное приближение с поправкой на связи).
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    combined = sorted([(t, 0) for t in current] + [(t, 1) for t in baseline])
+
+    # Ранги с усреднением для одинаковых значений
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)  # 0.5 - поправка на непрерывность
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_runs(baseline: List[Dict[str, Any]], current: List[Dict[str, Any]],
+                 alpha: float = 0.05, threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Сравнение двух запусков по совпадающим (алгоритм, семейство, размер).
+
+    Регрессия фиксируется, если медиана выросла больше чем на threshold
+    и рост статистически значим (p < alpha по критерию Манна-Уитни).
+    Повторы внутри одного запуска не видят дрейфа между запусками (частота
+    процессора, фоновая нагрузка), поэтому одного критерия мало и порог
+    threshold отсекает такие колебания.
+
+    Returns:
+        Список сравнений, отсортированный по росту медианы
+    """
+    def key(entry):
+        return entry['lab'], entry['algorithm'], entry['family'], entry['size']
+
+    baseline_by_key = {key(entry): entry for entry in baseline}
+    comparisons = []
+    for entry in current:
+        base = baseline_by_key.get(key(entry))
+        if base is None:
+            continue
+        base_median = statistics.median(base['times'])
+        current_median = statistics.median(entry['times'])
+        change = current_median / base_median - 1 if base_median > 0 else 0.0
+        p_value = mann_whitney_greater(base['times'], entry['times'])
+        comparisons.append({
+            'lab': entry['lab'],
+            'algorithm': entry['algorithm'],
+            'family': entry['family'],
+            'size': entry['size'],
+            'baseline': base_median,
+            'current': current_median,
+            'change': change,
+            'p_value': p_value,
+            'regression': change > threshold and p_value < alpha,
+        })
+    comparisons.sort(key=lambda c: c['change'], reverse=True)
+    return comparisons
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Командная строка: list и compare. Код возврата 1, если найдены регрессии."""
+    parser = argparse.ArgumentParser(description='Хранилище результатов бенчмарков')
+    parser.add_argument('--path', default=None, help='Файл хранилища')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('list', help='Список запусков')
+    compare = commands.add_parser('compare', help='Сравнение запуска с базовым')
+    compare.add_argument('baseline', help='run_id базового запуска')
+    compare.add_argument('current', nargs='?', help='run_id текущего запуска (по умолчанию последний)')
+    compare.add_argument('--alpha', type=float, default=0.05, help='Уровень значимости')
+    compare.add_argument('--threshold', type=float, default=0.10, help='Минимальный относительный рост медианы')
+    args = parser.parse_args(argv)
+
+    store = ResultsStore(args.path)
+    runs = store.runs()
+
+    if args.command == 'list':
+        for run_id, timestamp, lab, count in runs:
+            print(f"{run_id}  {timestamp}  {lab:8s}  записей: {count}")
+        return 0
+
+    current_id = args.current or (runs[-1][0] if runs else None)
+    baseline = store.load(args.baseline)
+    current = store.load(current_id) if current_id else []
+    if not baseline or not current:
+        print("Запуск не найден в хранилище")
+        return 2
+    if baseline[0]['machine']['id'] != current[0]['machine']['id']:
+        print("Внимание: запуски сделаны на разных машинах, сравнение может быть некорректным")
+
+    comparisons = compare_runs(baseline, current, args.alpha, args.threshold)
+    regressions = 0
+    for c in comparisons:
+        mark = 'РЕГРЕССИЯ' if c['regression'] else ''
+        regressions += c['regression']
+        print(f"{c['lab']:6s} {c['algorithm']:20s} {c['family']:14s} {str(c['size']):>8s} | "
+              f"{c['baseline']:.6f}с -> {c['current']:.6f}с ({c['change']:+.1%}, p={c['p_value']:.3f}) {mark}")
+    print(f"Сравнено измерений: {len(comparisons)}, регрессий: {regressions}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Тесты для общего модуля микробенчмарков.
+"""
+
+import gc
+import time
+
+import pytest
+
+from common.benchmark import BenchmarkResult, benchmark, percentile
+
+
+def test_percentile():
+    """Тест перцентиля с линейной интерполяцией."""
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 100) == 5.0
+    assert percentile(values, 25) == 2.0
+    assert percentile([1.0, 2.0], 50) == 1.5
+    assert percentile([10.0, 20.0, 30.0, 40.0], 95) == pytest.approx(38.5)
+    assert percentile([7.0], 95) == 7.0
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_result_statistics():
+    """Тест сводной статистики по повторам."""
+    result = BenchmarkResult('f', [3.0, 1.0, 2.0], 1)
+    assert result.min == 1.0
+    assert result.median == 2.0
+    assert result.mean == 2.0
+    assert result.stddev == 1.0
+    assert BenchmarkResult('f', [1.0], 1).stddev == 0.0
+
+
+def test_tukey_outliers():
+    """Тест поиска выбросов по границам Тьюки."""
+    result = BenchmarkResult('f', [1.0, 1.1, 0.9, 1.0, 1.05, 10.0, 0.01], 1)
+    assert sorted(result.outliers) == [0.01, 10.0]
+    assert 'выбросов 2' in result.summary()
+    assert BenchmarkResult('f', [1.0, 1.1, 1.2, 1.3, 1.4], 1).outliers == []
+    # Меньше четырех повторов - квартили не считаются
+    assert BenchmarkResult('f', [1.0, 1.0, 100.0], 1).outliers == []
+
+
+def test_setup_outside_timed_region():
+    """Тест: setup вызывается перед каждым повтором и не входит в измерение."""
+    calls = []
+
+    def setup():
+        calls.append(1)
+        time.sleep(0.05)
+        return ([3, 1, 2],)
+
+    result = benchmark(sorted, setup=setup, repeat=3, warmup=2)
+    assert len(calls) == 5
+    assert len(result.times) == 3
+    assert max(result.times) < 0.05
+    assert result.value == [1, 2, 3]
+    assert result.name == 'sorted'
+
+
+def test_number_divides_time():
+    """Тест: время повтора делится на число вызовов number."""
+    calls = []
+    result = benchmark(calls.append, 1, repeat=2, warmup=0, number=10, name='append')
+    assert len(calls) == 20
+    assert result.number == 10
+    assert result.name == 'append'
+    with pytest.raises(ValueError):
+        benchmark(calls.append, 1, repeat=0)
+
+
+def test_gc_disabled_during_measurement():
+    """Тест: сборщик мусора отключен во время измерения и включен после."""
+    states = []
+    benchmark(lambda: states.append(gc.isenabled()), repeat=2, warmup=1)
+    assert states == [False, False, False]
+    assert gc.isenabled()
+    benchmark(lambda: states.append(gc.isenabled()), repeat=1, warmup=0, disable_gc=False)
+    assert states[-1] is True
+
+
+def test_gc_restored_after_exception():
+    """Тест: состояние сборщика мусора восстанавливается после исключения."""
+    def fail():
+        raise RuntimeError("ошибка")
+
+    assert gc.isenabled()
+    with pytest.raises(RuntimeError):
+        benchmark(fail)
+    assert gc.isenabled()
+
+    gc.disable()
+    try:
+        with pytest.raises(RuntimeError):
+            benchmark(fail)
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
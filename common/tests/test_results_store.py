@@ -0,0 +1,44 @@
+"""
+Тесты для хранилища результатов бенчмарков.
+"""
+
+from common.benchmark import BenchmarkResult
+from common.results_store import ResultsStore, compare_runs, mann_whitney_greater
+
+
+def test_record_and_load(tmp_path):
+    """Тест записи и чтения результатов по run_id."""
+    path = str(tmp_path / 'results.jsonl')
+    first = ResultsStore(path, lab='lab04', run_id='first')
+    second = ResultsStore(path, lab='lab04', run_id='second')
+    first.record(BenchmarkResult('merge_sort', [0.1, 0.2, 0.3], 1), family='random', size=100)
+    second.record(BenchmarkResult('merge_sort', [0.1, 0.2], 1), family='random', size=100)
+
+    entries = first.load('first')
+    assert len(entries) == 1
+    assert entries[0]['algorithm'] == 'merge_sort'
+    assert entries[0]['median'] == 0.2
+    assert 'id' in entries[0]['machine']
+    assert [run[0] for run in first.runs()] == ['first', 'second']
+
+
+def test_mann_whitney():
+    """Тест критерия Манна-Уитни."""
+    assert mann_whitney_greater([1.0, 1.1, 1.2, 0.9, 1.0], [2.0, 2.1, 2.2, 1.9, 2.0]) < 0.01
+    assert mann_whitney_greater([2.0, 2.1, 2.2, 1.9, 2.0], [1.0, 1.1, 1.2, 0.9, 1.0]) > 0.5
+    assert mann_whitney_greater([], [1.0]) == 1.0
+
+
+def test_compare_runs():
+    """Тест поиска регрессий между запусками."""
+    def entry(algorithm, times):
+        return {'lab': 'lab04', 'algorithm': algorithm, 'family': 'random', 'size': 100, 'times': times}
+
+    baseline = [entry('fast', [1.0, 1.01, 0.99, 1.0, 1.02]), entry('same', [1.0, 1.01, 0.99, 1.0, 1.02])]
+    current = [entry('fast', [2.0, 2.01, 1.99, 2.0, 2.02]), entry('same', [1.01, 1.0, 0.99, 1.02, 1.0]),
+               entry('new', [1.0])]
+
+    comparisons = {c['algorithm']: c for c in compare_runs(baseline, current)}
+    assert set(comparisons) == {'fast', 'same'}
+    assert comparisons['fast']['regression']
+    assert not comparisons['same']['regression']
@@ -1,23 +1,76 @@
 """
 Основной модуль для сравнения производительности алгоритмов поиска
 """
+import os
+import sys
 import time
 import random
-from search_algorithms import linear_search, binary_search
+from bisect import bisect_left
+import numpy as np
+from search_algorithms import (
+    linear_search,
+    binary_search,
+    binary_search_many,
+    binary_search_many_sorted,
+    search,
+)
+from static_index import StaticSortedIndex
 import matplotlib.pyplot as plt
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.benchmark import benchmark
+
 
 def generate_sorted_array(size: int) -> list:
     """Генерация отсортированного массива"""
     return sorted(random.sample(range(size * 10), size))
 
 
+def generate_sorted_ndarray(size: int) -> np.ndarray:
+    """Генерация отсортированного массива без повторов в виде непрерывного буфера int64"""
+    rng = np.random.default_rng()
+    return np.cumsum(rng.integers(1, 20, size=size, dtype=np.int64))
+
+
+def generate_distribution(kind: str, size: int) -> list:
+    """
+    Генерация отсортированного массива с заданным распределением ключей
+
+    uniform - равномерные ключи, zipf - интервалы между ключами по закону Ципфа
+    (редкие огромные скачки), clustered - несколько плотных кластеров с большими
+    промежутками между ними
+    """
+    rng = np.random.default_rng()
+    if kind == 'uniform':
+        return generate_sorted_array(size)
+    if kind == 'zipf':
+        gaps = np.minimum(rng.zipf(1.5, size=size), size * 100)
+        return np.cumsum(gaps).tolist()
+    if kind == 'clustered':
+        centers = rng.integers(0, size * 1000, size=10)
+        keys = centers[rng.integers(0, 10, size=size)] + rng.integers(0, size, size=size)
+        return np.sort(keys).tolist()
+    raise ValueError(f"Неизвестное распределение: {kind}")
+
+
+class ProbeCounter:
+    """Обертка над массивом, подсчитывающая обращения к элементам (пробы)"""
+
+    def __init__(self, arr: list):
+        self.arr = arr
+        self.probes = 0
+
+    def __len__(self) -> int:
+        return len(self.arr)
+
+    def __getitem__(self, index: int):
+        self.probes += 1
+        return self.arr[index]
+
+
 def measure_time(search_func, arr: list, target: int) -> float:
-    """Измерение времени выполнения поиска"""
-    start_time = time.perf_counter()
-    search_func(arr, target)
-    end_time = time.perf_counter()
-    return end_time - start_time
+    """Измерение времени выполнения поиска (медиана нескольких повторов)"""
+    return benchmark(search_func, arr, target).median
 
 
 def main():
@@ -79,5 +132,159 @@ def main():
     plt.show()
 
 
+def compare_strategies():
+    """Сравнение стратегий поиска по числу проб и времени на разных распределениях"""
+    sizes = [1000, 2000, 5000, 10000, 20000, 50000, 100000]
+    kinds = ['uniform', 'zipf', 'clustered']
+    strategies = ['binary', 'interpolation', 'exponential']
+    test_cases = 100
+
+    probes = {kind: {strategy: [] for strategy in strategies} for kind in kinds}
+    times = {kind: {strategy: [] for strategy in strategies} for kind in kinds}
+
+    print("\nСравнение стратегий поиска (пробы на поиск / время):")
+    for kind in kinds:
+        for size in sizes:
+            arr = generate_distribution(kind, size)
+            counter = ProbeCounter(arr)
+            targets = [random.choice(arr) for _ in range(test_cases)]
+
+            line = f"{kind:>9} | {size:6d}"
+            for strategy in strategies:
+                counter.probes = 0
+                for target in targets:
+                    search(counter, target, strategy=strategy)
+                avg_probes = counter.probes / test_cases
+
+                time_total = 0
+                for target in targets:
+                    start_time = time.perf_counter()
+                    search(arr, target, strategy=strategy)
+                    time_total += time.perf_counter() - start_time
+                avg_time = time_total / test_cases
+
+                probes[kind][strategy].append(avg_probes)
+                times[kind][strategy].append(avg_time)
+                line += f" | {strategy}: {avg_probes:5.1f} / {avg_time:.2e}с"
+            print(line)
+
+    # Столбец графиков - распределение, верхний ряд - пробы, нижний - время
+    plt.figure(figsize=(15, 8))
+    for column, kind in enumerate(kinds):
+        plt.subplot(2, len(kinds), column + 1)
+        for strategy in strategies:
+            plt.semilogx(sizes, probes[kind][strategy], 'o-', label=strategy)
+        plt.xlabel('Размер массива')
+        plt.ylabel('Проб на поиск')
+        plt.title(f'Распределение: {kind}')
+        plt.legend()
+        plt.grid(True)
+
+        plt.subplot(2, len(kinds), len(kinds) + column + 1)
+        for strategy in strategies:
+            plt.loglog(sizes, times[kind][strategy], 's-', label=strategy)
+        plt.xlabel('Размер массива')
+        plt.ylabel('Время (секунды) - log scale')
+        plt.legend()
+        plt.grid(True)
+
+    plt.tight_layout()
+    plt.savefig('strategies_plot.png', dpi=300, bbox_inches='tight')
+    plt.show()
+
+
+def benchmark_batched_search():
+    """Сравнение пропускной способности поштучного и пакетного бинарного поиска"""
+    sizes = [1000, 2000, 5000, 10000, 20000, 50000, 100000, 10_000_000]
+    per_call_queries = 10_000  # Поштучные вызовы медленные, берем меньше запросов
+    batch_queries = 1_000_000
+
+    print("\nПропускная способность бинарного поиска (запросов в секунду):")
+    print(f"{'Размер':>10} | {'Поштучно':>12} | {'Пакетно':>12} | {'Слияние':>12} | {'Ускорение':>9}")
+
+    for size in sizes:
+        data = generate_sorted_ndarray(size)
+        arr = data.tolist()
+        targets = np.random.default_rng().integers(0, int(data[-1]) + 1, size=batch_queries)
+
+        # Поштучные вызовы binary_search из Python
+        sample = targets[:per_call_queries].tolist()
+        start_time = time.perf_counter()
+        for target in sample:
+            binary_search(arr, target)
+        per_call_rate = per_call_queries / (time.perf_counter() - start_time)
+
+        # Один векторизованный проход по всем запросам
+        start_time = time.perf_counter()
+        binary_search_many(data, targets)
+        batched_rate = batch_queries / (time.perf_counter() - start_time)
+
+        # Слияние с заранее отсортированными запросами
+        sorted_sample = sorted(targets[:per_call_queries * 10].tolist())
+        start_time = time.perf_counter()
+        binary_search_many_sorted(arr, sorted_sample)
+        merge_rate = len(sorted_sample) / (time.perf_counter() - start_time)
+
+        print(f"{size:10d} | {per_call_rate:12.0f} | {batched_rate:12.0f} | "
+              f"{merge_rate:12.0f} | {batched_rate / per_call_rate:8.1f}x")
+
+
+def benchmark_static_index(sizes: list = None):
+    """Сравнение StaticSortedIndex с обычным бинарным поиском на массивах int64"""
+    if sizes is None:
+        sizes = [1_000_000, 10_000_000, 100_000_000]
+    num_queries = 1_000_000
+    scalar_queries = 100_000
+    list_limit = 10_000_000  # Выше этого размера список Python не помещается в разумный объем памяти
+
+    print("\nStaticSortedIndex против бинарного поиска (запросов в секунду):")
+    print(f"{'Размер':>11} | {'Построение':>10} | {'binary_search':>13} | {'bisect':>10} | "
+          f"{'index.contains':>14} | {'searchsorted':>12} | {'contains_many':>13}")
+
+    for size in sizes:
+        data = generate_sorted_ndarray(size)
+        targets = np.random.default_rng().integers(0, int(data[-1]) + 1, size=num_queries)
+        sample = targets[:scalar_queries].tolist()
+
+        start_time = time.perf_counter()
+        index = StaticSortedIndex(data)
+        build_time = time.perf_counter() - start_time
+
+        if size <= list_limit:
+            arr = data.tolist()
+            start_time = time.perf_counter()
+            for target in sample:
+                binary_search(arr, target)
+            binary_rate = f"{scalar_queries / (time.perf_counter() - start_time):13.0f}"
+
+            start_time = time.perf_counter()
+            for target in sample:
+                bisect_left(arr, target)
+            bisect_rate = f"{scalar_queries / (time.perf_counter() - start_time):10.0f}"
+            del arr
+        else:
+            binary_rate = f"{'-':>13}"
+            bisect_rate = f"{'-':>10}"
+
+        start_time = time.perf_counter()
+        for target in sample:
+            index.contains(target)
+        scalar_rate = scalar_queries / (time.perf_counter() - start_time)
+
+        start_time = time.perf_counter()
+        binary_search_many(data, targets)
+        searchsorted_rate = num_queries / (time.perf_counter() - start_time)
+
+        start_time = time.perf_counter()
+        index.contains_many(targets)
+        batch_rate = num_queries / (time.perf_counter() - start_time)
+
+        print(f"{size:11d} | {build_time:9.3f}с | {binary_rate} | {bisect_rate} | "
+              f"{scalar_rate:14.0f} | {searchsorted_rate:12.0f} | {batch_rate:13.0f}")
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
+    compare_strategies()
+    benchmark_batched_search()
+    benchmark_static_index()
\ No newline at end of file
@@ -1,6 +1,11 @@
 """
 Модуль с реализацией алгоритмов поиска
 """
+from bisect import bisect_left
+from itertools import islice
+from typing import Iterable, List
+
+import numpy as np
 
 
 def linear_search(arr: list, target: int) -> int:
@@ -45,4 +50,196 @@ def binary_search(arr: list, target: int) -> int:
         else:  # O(1)
             right = mid - 1  # O(1)
     return -1  # O(1)
-# Общая сложность: O(log n)
\ No newline at end of file
+# Общая сложность: O(log n)
+
+
+def _binary_search_range(arr, target: int, left: int, right: int) -> int:
+    """Бинарный поиск на отрезке [left, right] отсортированного массива"""
+    while left <= right:  # O(log (right - left))
+        mid = (left + right) // 2  # O(1)
+        if arr[mid] == target:  # O(1)
+            return mid  # O(1)
+        elif arr[mid] < target:  # O(1)
+            left = mid + 1  # O(1)
+        else:  # O(1)
+            right = mid - 1  # O(1)
+    return -1  # O(1)
+
+
+def interpolation_search(arr: list, target: int) -> int:
+    """
+    Интерполяционный поиск элемента в отсортированном массиве чисел
+
+    Позиция пробы оценивается линейной интерполяцией между значениями на
+    границах отрезка. На равномерных данных хватает O(log log n) проб; чтобы
+    неудачное распределение не привело к O(n) пробам, после 2 log log n
+    интерполяционных проб оставшийся отрезок дорабатывается бинарным поиском.
+
+    Args:
+        arr: Отсортированный массив чисел
+        target: Искомый элемент
+
+    Returns:
+        int: Индекс элемента или -1 если не найден
+    """
+    left = 0  # O(1)
+    right = len(arr) - 1  # O(1)
+    budget = max(4, 2 * len(arr).bit_length().bit_length())  # O(1), около 2 log log n
+
+    while left <= right and budget > 0:  # O(log log n)
+        left_value = arr[left]  # O(1)
+        right_value = arr[right]  # O(1)
+        if target < left_value or target > right_value:  # O(1)
+            return -1  # O(1)
+        if left_value == right_value:  # O(1)
+            return left  # O(1), все элементы отрезка равны target
+
+        pos = left + int((target - left_value) * (right - left) // (right_value - left_value))  # O(1)
+        if arr[pos] == target:  # O(1)
+            return pos  # O(1)
+        elif arr[pos] < target:  # O(1)
+            left = pos + 1  # O(1)
+        else:  # O(1)
+            right = pos - 1  # O(1)
+        budget -= 1  # O(1)
+    return _binary_search_range(arr, target, left, right)  # O(log n) только в худшем случае
+# Общая сложность: O(log log n) в среднем на равномерных данных, O(log n) в худшем
+
+
+def _exponential_search_stream(iterable: Iterable[int], target: int) -> int:
+    """Галопирующий поиск в отсортированном потоке: читается не больше 2 * (индекс + 1) элементов"""
+    stream = iter(iterable)  # O(1)
+    buffer = []  # O(1)
+    bound = 1  # O(1)
+    while True:  # O(log i)
+        buffer.extend(islice(stream, bound - len(buffer)))  # O(bound)
+        if len(buffer) < bound or buffer[-1] >= target:  # O(1)
+            break
+        bound *= 2  # O(1)
+    return _binary_search_range(buffer, target, bound // 2, len(buffer) - 1)  # O(log i)
+
+
+def exponential_search(arr, target: int) -> int:
+    """
+    Экспоненциальный (галопирующий) поиск элемента
+
+    Граница поиска удваивается, пока элемент на ней меньше искомого, затем
+    выполняется бинарный поиск на последнем отрезке. Время зависит от
+    позиции элемента i, а не от длины массива, поэтому поиск работает
+    и на неограниченных отсортированных потоках (итераторах).
+
+    Args:
+        arr: Отсортированная последовательность или итератор
+        target: Искомый элемент
+
+    Returns:
+        int: Индекс элемента или -1 если не найден
+    """
+    if not (hasattr(arr, '__getitem__') and hasattr(arr, '__len__')):  # O(1)
+        return _exponential_search_stream(arr, target)  # O(i)
+
+    n = len(arr)  # O(1)
+    if n == 0:  # O(1)
+        return -1  # O(1)
+    bound = 1  # O(1)
+    while bound < n and arr[bound] < target:  # O(log i)
+        bound *= 2  # O(1)
+    return _binary_search_range(arr, target, bound // 2, min(bound, n - 1))  # O(log i)
+# Общая сложность: O(log i), где i - позиция искомого элемента
+
+
+SEARCH_STRATEGIES = {
+    'linear': linear_search,
+    'binary': binary_search,
+    'interpolation': interpolation_search,
+    'exponential': exponential_search,
+}
+
+
+def search(arr, target: int, strategy: str = 'binary') -> int:
+    """
+    Поиск элемента выбранной стратегией
+
+    Args:
+        arr: Массив для поиска (отсортированный для всех стратегий, кроме linear)
+        target: Искомый элемент
+        strategy: Стратегия поиска: linear, binary, interpolation или exponential
+
+    Returns:
+        int: Индекс элемента или -1 если не найден
+
+    Raises:
+        ValueError: Если стратегия неизвестна
+    """
+    if strategy not in SEARCH_STRATEGIES:
+        raise ValueError(f"Неизвестная стратегия поиска: {strategy}")
+    return SEARCH_STRATEGIES[strategy](arr, target)
+
+
+def binary_search_many(arr, targets) -> np.ndarray:
+    """
+    Пакетный бинарный поиск: все элементы targets ищутся в отсортированном
+    массиве за один векторизованный проход (np.searchsorted).
+
+    Массив приводится к непрерывному буферу NumPy, поэтому для многократных
+    запросов к одному массиву выгоднее заранее передать np.ndarray,
+    чтобы не платить за преобразование list -> ndarray при каждом вызове.
+
+    Args:
+        arr: Отсортированный массив (list или np.ndarray)
+        targets: Искомые элементы (любой порядок)
+
+    Returns:
+        np.ndarray: Индексы элементов (-1 для ненайденных)
+    """
+    data = np.ascontiguousarray(arr)  # O(1) для ndarray, O(n) для list
+    queries = np.asarray(targets)  # O(m)
+    if data.size == 0:  # O(1)
+        return np.full(queries.shape, -1, dtype=np.intp)  # O(m)
+
+    positions = np.searchsorted(data, queries)  # O(m log n)
+    clipped = np.minimum(positions, data.size - 1)  # O(m)
+    found = data[clipped] == queries  # O(m)
+    return np.where(found, clipped, -1)  # O(m)
+# Общая сложность: O(m log n), но без накладных расходов интерпретатора на каждый запрос
+
+
+def binary_search_many_sorted(arr: list, targets: Iterable[int]) -> List[int]:
+    """
+    Пакетный поиск отсортированных запросов методом слияния (merge-join).
+
+    Левая граница поиска только сдвигается вправо, а следующая позиция
+    находится галопирующим (экспоненциальным) шагом от текущей, поэтому
+    каждый запрос стоит O(log d), где d - расстояние до предыдущего ответа.
+
+    Args:
+        arr: Отсортированный массив
+        targets: Искомые элементы в неубывающем порядке
+
+    Returns:
+        List[int]: Индексы элементов (-1 для ненайденных)
+
+    Raises:
+        ValueError: Если targets не отсортированы
+    """
+    n = len(arr)  # O(1)
+    result = []  # O(1)
+    pos = 0  # O(1)
+    previous = None  # O(1)
+
+    for target in targets:  # O(m)
+        if previous is not None and target < previous:  # O(1)
+            raise ValueError("Запросы должны быть отсортированы по неубыванию")
+        previous = target  # O(1)
+
+        step = 1  # O(1)
+        while pos + step < n and arr[pos + step] < target:  # O(log d)
+            step *= 2  # O(1)
+        pos = bisect_left(arr, target, pos + step // 2, min(pos + step + 1, n))  # O(log d)
+
+        if pos < n and arr[pos] == target:  # O(1)
+            result.append(pos)  # O(1)
+        else:  # O(1)
+            result.append(-1)  # O(1)
+    return result  # O(1)
+# Общая сложность: O(m log(n/m) + m), не хуже O(n + m) для плотных запросов
@@ -0,0 +1,115 @@
+"""
+Модуль со статическим индексом для отсортированных массивов в раскладке Эйтцингера
+"""
+from typing import Iterable
+
+import numpy as np
+
+
+class StaticSortedIndex:
+    """
+    Статический индекс над отсортированным массивом.
+
+    Элементы один раз переупорядочиваются в раскладку Эйтцингера (обход дерева
+    поиска в ширину, корень в ячейке 1, потомки узла k - в ячейках 2k и 2k + 1).
+    Дерево дополняется до совершенного (2^h - 1 узлов) максимальным значением
+    типа, поэтому спуск всегда занимает ровно h шагов без ветвлений, а номер
+    листа после спуска сразу дает ранг запроса. Верхние уровни дерева лежат
+    в начале буфера и остаются в кэше, чего нет у обычного бинарного поиска.
+    """
+
+    def __init__(self, arr: Iterable) -> None:
+        """
+        Построение индекса. Сложность: O(n)
+
+        Args:
+            arr: Отсортированный массив (list или np.ndarray)
+
+        Raises:
+            ValueError: Если массив не отсортирован
+        """
+        data = np.ascontiguousarray(arr)
+        if data.dtype == object:
+            raise ValueError("Поддерживаются только числовые массивы")
+        if data.size > 1 and np.any(data[1:] < data[:-1]):
+            raise ValueError("Массив должен быть отсортирован по неубыванию")
+
+        self._n = int(data.size)
+        self._height = self._n.bit_length()  # Высота совершенного дерева
+        if np.issubdtype(data.dtype, np.integer):
+            sentinel = np.iinfo(data.dtype).max
+        else:
+            sentinel = np.inf
+
+        # Ячейка 0 не используется, узлы занимают ячейки 1..2^h - 1
+        self._tree = np.full(1 << self._height, sentinel, dtype=data.dtype)
+        for depth in range(self._height):
+            # Узлы уровня depth имеют ранги step - 1, 3 * step - 1, 5 * step - 1, ...
+            step = 1 << (self._height - 1 - depth)
+            level = data[step - 1::2 * step]
+            first = 1 << depth
+            self._tree[first:first + level.size] = level
+        self._view = memoryview(self._tree)  # Быстрый доступ к элементам из Python
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __contains__(self, target) -> bool:
+        return self.contains(target)
+
+    def _descend(self, target) -> int:
+        """Спуск по дереву для одного запроса, возвращает номер листа. Сложность: O(log n)"""
+        tree = self._view
+        k = 1
+        for _ in range(self._height):
+            k = 2 * k + (tree[k] < target)
+        return k
+
+    def rank(self, target) -> int:
+        """Количество элементов, меньших target. Сложность: O(log n)"""
+        return min(self._descend(target) - (1 << self._height), self._n)
+
+    def lower_bound(self, target):
+        """
+        Наименьший элемент, не меньший target. Сложность: O(log n)
+
+        Returns:
+            Значение элемента или None, если все элементы меньше target
+        """
+        k = self._descend(target)
+        if k - (1 << self._height) >= self._n:
+            return None
+        # Снятие хвостовых единиц пути дает узел, где был последний поворот налево
+        k >>= ((~k) & (k + 1)).bit_length()
+        return self._view[k]
+
+    def contains(self, target) -> bool:
+        """Проверка наличия элемента. Сложность: O(log n)"""
+        value = self.lower_bound(target)
+        return value is not None and value == target
+
+    def _descend_many(self, targets) -> np.ndarray:
+        """Векторизованный спуск по дереву сразу для всех запросов. Сложность: O(m log n)"""
+        queries = np.asarray(targets)
+        k = np.ones(queries.shape, dtype=np.int64)
+        for _ in range(self._height):
+            k = 2 * k + (self._tree[k] < queries)
+        return k
+
+    def rank_many(self, targets) -> np.ndarray:
+        """Пакетная версия rank. Сложность: O(m log n)"""
+        ranks = self._descend_many(targets) - (1 << self._height)
+        return np.minimum(ranks, self._n)
+
+    def contains_many(self, targets) -> np.ndarray:
+        """
+        Пакетная версия contains. Сложность: O(m log n)
+
+        Returns:
+            np.ndarray: Маска bool той же формы, что и targets
+        """
+        queries = np.asarray(targets)
+        k = self._descend_many(queries)
+        found = k - (1 << self._height) < self._n
+        nodes = k >> (np.log2((~k) & (k + 1)).astype(np.int64) + 1)
+        return found & (self._tree[nodes] == queries)
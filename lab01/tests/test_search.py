@@ -2,7 +2,15 @@
 Тесты для алгоритмов поиска
 """
 import pytest
-from src.search_algorithms import linear_search, binary_search
+from src.search_algorithms import (
+    linear_search,
+    binary_search,
+    binary_search_many,
+    binary_search_many_sorted,
+    interpolation_search,
+    exponential_search,
+    search,
+)
 
 
 class TestSearchAlgorithms:
@@ -39,4 +47,79 @@ class TestSearchAlgorithms:
         """Тест поиска в пустом массиве"""
         arr = []
         assert linear_search(arr, 1) == -1
-        assert binary_search(arr, 1) == -1
\ No newline at end of file
+        assert binary_search(arr, 1) == -1
+
+
+class TestBatchedSearch:
+    """Тестовый класс для пакетного поиска"""
+
+    def test_binary_search_many(self):
+        """Тест пакетного поиска - совпадение с поштучным"""
+        arr = [1, 3, 5, 7, 9, 11, 13]
+        targets = [13, 2, 1, 7, 15, 0, 9]
+        expected = [binary_search(arr, t) for t in targets]
+        assert binary_search_many(arr, targets).tolist() == expected
+
+    def test_binary_search_many_empty(self):
+        """Тест пакетного поиска в пустом массиве"""
+        assert binary_search_many([], [1, 2]).tolist() == [-1, -1]
+
+    def test_binary_search_many_sorted(self):
+        """Тест поиска слиянием для отсортированных запросов"""
+        arr = list(range(0, 200, 2))
+        targets = [-1, 0, 0, 3, 4, 57, 100, 198, 199, 500]
+        expected = [binary_search(arr, t) for t in targets]
+        assert binary_search_many_sorted(arr, targets) == expected
+
+    def test_binary_search_many_sorted_unsorted_targets(self):
+        """Тест поиска слиянием - неотсортированные запросы"""
+        with pytest.raises(ValueError):
+            binary_search_many_sorted([1, 2, 3], [3, 1])
+
+
+class TestSearchStrategies:
+    """Тестовый класс для интерполяционного и экспоненциального поиска"""
+
+    def test_interpolation_search(self):
+        """Тест интерполяционного поиска на равномерных и перекошенных данных"""
+        uniform = list(range(0, 1000, 7))
+        skewed = [2 ** i for i in range(40)]
+        for arr in (uniform, skewed):
+            for i, value in enumerate(arr):
+                assert interpolation_search(arr, value) == i
+            assert interpolation_search(arr, -5) == -1
+            assert interpolation_search(arr, 3) == -1
+
+    def test_interpolation_search_duplicates(self):
+        """Тест интерполяционного поиска на массиве из одинаковых элементов"""
+        arr = [5, 5, 5, 5]
+        assert arr[interpolation_search(arr, 5)] == 5
+        assert interpolation_search(arr, 4) == -1
+
+    def test_exponential_search(self):
+        """Тест экспоненциального поиска в последовательности"""
+        arr = [1, 3, 5, 7, 9, 11, 13]
+        for i, value in enumerate(arr):
+            assert exponential_search(arr, value) == i
+        assert exponential_search(arr, 8) == -1
+        assert exponential_search([], 1) == -1
+
+    def test_exponential_search_stream(self):
+        """Тест экспоненциального поиска в неограниченном потоке"""
+        def evens():
+            value = 0
+            while True:
+                yield value
+                value += 2
+
+        assert exponential_search(evens(), 1000) == 500
+        assert exponential_search(evens(), 1001) == -1
+        assert exponential_search(iter([1, 2, 3]), 4) == -1
+
+    def test_search_strategy(self):
+        """Тест выбора стратегии поиска"""
+        arr = [1, 3, 5, 7, 9]
+        for strategy in ('linear', 'binary', 'interpolation', 'exponential'):
+            assert search(arr, 7, strategy=strategy) == 3
+        with pytest.raises(ValueError):
+            search(arr, 7, strategy='unknown')
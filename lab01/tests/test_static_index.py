@@ -0,0 +1,43 @@
+"""
+Тесты для статического индекса в раскладке Эйтцингера
+"""
+from bisect import bisect_left
+
+import pytest
+from src.static_index import StaticSortedIndex
+
+
+class TestStaticSortedIndex:
+    """Тестовый класс для StaticSortedIndex"""
+
+    def test_matches_bisect(self):
+        """Тест совпадения rank/lower_bound/contains с bisect на разных размерах"""
+        for n in [1, 2, 3, 7, 8, 9, 100]:
+            arr = [i * 3 for i in range(n)]
+            index = StaticSortedIndex(arr)
+            for target in range(-1, 3 * n + 2):
+                pos = bisect_left(arr, target)
+                assert index.rank(target) == pos
+                assert index.lower_bound(target) == (arr[pos] if pos < n else None)
+                assert index.contains(target) == (target in arr)
+
+    def test_batch_queries(self):
+        """Тест пакетных запросов"""
+        arr = [1, 3, 3, 5, 9, 11]
+        index = StaticSortedIndex(arr)
+        targets = [0, 1, 2, 3, 10, 11, 12]
+        assert index.rank_many(targets).tolist() == [bisect_left(arr, t) for t in targets]
+        assert index.contains_many(targets).tolist() == [t in arr for t in targets]
+
+    def test_empty_index(self):
+        """Тест пустого индекса"""
+        index = StaticSortedIndex([])
+        assert len(index) == 0
+        assert 1 not in index
+        assert index.rank(1) == 0
+        assert index.lower_bound(1) is None
+
+    def test_unsorted_input(self):
+        """Тест построения по неотсортированному массиву"""
+        with pytest.raises(ValueError):
+            StaticSortedIndex([3, 1, 2])
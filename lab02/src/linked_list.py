@@ -1,57 +1,247 @@
-"""Модуль реализует связный список (LinkedList)."""
+"""Модуль реализует связный список (LinkedList) и его вариант на массивах (PooledLinkedList)."""
 
-from typing import Optional, Any
+from array import array
+from typing import Optional, Any, Iterable, Iterator, List
 
 
 class Node:
-    """Узел связного списка."""
+    """Узел двусвязного списка."""
 
     def __init__(self, data: Any) -> None:
         self.data = data
         self.next: Optional['Node'] = None
+        self.prev: Optional['Node'] = None
 
 
 class LinkedList:
-    """Связный список."""
+    """
+    Двусвязный список.
+
+    Методы вставки возвращают созданный узел; по нему можно за O(1) удалить
+    элемент или перенести его в начало (например, для вытеснения по LRU).
+    Узел должен принадлежать этому списку - проверка заняла бы O(n);
+    повторное удаление узла обнаруживается за O(1) (ValueError).
+    """
 
     def __init__(self) -> None:
         self.head: Optional[Node] = None
         self.tail: Optional[Node] = None
+        self._size = 0
 
-    def insert_at_start(self, data: Any) -> None:
+    def insert_at_start(self, data: Any) -> Node:
         """Вставка элемента в начало списка. Сложность O(1)."""
         new_node = Node(data)
-        if self.head is None:
-            self.head = new_node
-            self.tail = new_node
-        else:
-            new_node.next = self.head
-            self.head = new_node
+        self._link_front(new_node)
+        self._size += 1
+        return new_node
 
-    def insert_at_end(self, data: Any) -> None:
+    def insert_at_end(self, data: Any) -> Node:
         """Вставка элемента в конец списка. Сложность O(1) с хвостом."""
         new_node = Node(data)
         if self.tail is None:
             self.head = new_node
             self.tail = new_node
         else:
+            new_node.prev = self.tail
             self.tail.next = new_node
             self.tail = new_node
+        self._size += 1
+        return new_node
 
     def delete_from_start(self) -> Optional[Any]:
         """Удаление элемента из начала списка. Сложность O(1)."""
         if self.head is None:
             return None
-        data = self.head.data
-        self.head = self.head.next
+        return self.remove(self.head)
+
+    def delete_from_end(self) -> Optional[Any]:
+        """Удаление элемента из конца списка. Сложность O(1)."""
+        if self.tail is None:
+            return None
+        return self.remove(self.tail)
+
+    def remove(self, node: Node) -> Any:
+        """Удаление узла из списка. Сложность O(1)."""
+        self._unlink(node)
+        self._size -= 1
+        return node.data
+
+    def move_to_front(self, node: Node) -> None:
+        """Перенос узла в начало списка. Сложность O(1)."""
+        if node is self.head:
+            return
+        self._unlink(node)
+        self._link_front(node)
+
+    def splice(self, other: 'LinkedList', after: Optional[Node] = None) -> None:
+        """
+        Перенос всех узлов other в этот список после узла after
+        (в начало, если after не задан). other становится пустым. Сложность O(1).
+        """
+        if other is self:
+            raise ValueError("Нельзя вставить список сам в себя")
+        if other.head is None:
+            return
+        first, last = other.head, other.tail
+        following = self.head if after is None else after.next
+
+        first.prev = after
+        if after is None:
+            self.head = first
+        else:
+            after.next = first
+        last.next = following
+        if following is None:
+            self.tail = last
+        else:
+            following.prev = last
+
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+
+    def concat(self, other: 'LinkedList') -> None:
+        """Перенос всех узлов other в конец этого списка. Сложность O(1)."""
+        self.splice(other, self.tail)
+
+    def _link_front(self, node: Node) -> None:
+        """Привязка отдельного узла к началу списка."""
+        node.prev = None
+        node.next = self.head
         if self.head is None:
-            self.tail = None
-        return data
+            self.tail = node
+        else:
+            self.head.prev = node
+        self.head = node
 
-    def traversal(self) -> None:
-        """Печать всех элементов списка. Сложность O(n)."""
+    def _unlink(self, node: Node) -> None:
+        """Отвязка узла от соседей; уже удаленный узел не меняет список."""
+        if node.prev is None and node is not self.head:
+            raise ValueError("Узел не входит в список")
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+
+    def iter_nodes(self) -> Iterator[Node]:
+        """Обход узлов; текущий узел можно удалить, не прерывая обход. Сложность O(n)."""
         current = self.head
         while current is not None:
-            print(current.data, end=' ')
+            following = current.next
+            yield current
+            current = following
+
+    def __iter__(self) -> Iterator[Any]:
+        current = self.head
+        while current is not None:
+            yield current.data
             current = current.next
-        print()
\ No newline at end of file
+
+    def __len__(self) -> int:
+        return self._size
+
+    def traversal(self) -> None:
+        """Печать всех элементов списка. Сложность O(n)."""
+        for data in self:
+            print(data, end=' ')
+        print()
+
+
+_NIL = -1  # Отсутствие ссылки на ячейку в PooledLinkedList
+
+
+class PooledLinkedList:
+    """
+    Связный список на параллельных массивах.
+
+    Данные хранятся в списке _data, ссылки на следующую ячейку - в массиве
+    целых чисел _next, поэтому вместо объекта Node со своим __dict__ на элемент
+    тратится одна ячейка списка и 8 байт ссылки. Освобожденные ячейки
+    связываются в список свободных (через тот же _next) и переиспользуются
+    при следующих вставках.
+    """
+
+    def __init__(self, items: Optional[Iterable[Any]] = None) -> None:
+        self._data: List[Any] = []
+        self._next = array('q')
+        self._head = _NIL
+        self._tail = _NIL
+        self._free = _NIL  # Голова списка свободных ячеек
+        self._size = 0
+        if items is not None:
+            self.extend(items)
+
+    def _allocate(self, data: Any) -> int:
+        """Выделение ячейки: из списка свободных или в конце массивов. Сложность O(1) амортизированно."""
+        slot = self._free
+        if slot != _NIL:
+            self._free = self._next[slot]
+            self._data[slot] = data
+            self._next[slot] = _NIL
+        else:
+            slot = len(self._data)
+            self._data.append(data)
+            self._next.append(_NIL)
+        return slot
+
+    def insert_at_start(self, data: Any) -> None:
+        """Вставка элемента в начало списка. Сложность O(1)."""
+        slot = self._allocate(data)
+        if self._head == _NIL:
+            self._tail = slot
+        else:
+            self._next[slot] = self._head
+        self._head = slot
+        self._size += 1
+
+    def insert_at_end(self, data: Any) -> None:
+        """Вставка элемента в конец списка. Сложность O(1)."""
+        slot = self._allocate(data)
+        if self._tail == _NIL:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+        self._tail = slot
+        self._size += 1
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Вставка всех элементов в конец списка. Сложность O(k)."""
+        for data in items:
+            self.insert_at_end(data)
+
+    def delete_from_start(self) -> Optional[Any]:
+        """Удаление элемента из начала списка. Сложность O(1)."""
+        slot = self._head
+        if slot == _NIL:
+            return None
+        data = self._data[slot]
+        self._head = self._next[slot]
+        if self._head == _NIL:
+            self._tail = _NIL
+
+        # Ячейка возвращается в список свободных, ссылка на данные освобождается
+        self._data[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+        self._size -= 1
+        return data
+
+    def traversal(self) -> None:
+        """Печать всех элементов списка. Сложность O(n)."""
+        print(*self)
+
+    def __iter__(self) -> Iterator[Any]:
+        data = self._data
+        links = self._next
+        slot = self._head
+        while slot != _NIL:
+            yield data[slot]
+            slot = links[slot]
+
+    def __len__(self) -> int:
+        return self._size
@@ -1,8 +1,17 @@
 """Модуль для анализа производительности различных структур данных."""
 
+import os
+import sys
+import tempfile
 import timeit
+import tracemalloc
 from collections import deque
-from linked_list import LinkedList
+from typing import Any, Callable, List
+from linked_list import LinkedList, PooledLinkedList
+from task_solutions import check_brackets, check_brackets_stream, check_brackets_file, simulate_job_queue
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.benchmark import benchmark
 
 
 def compare_list_and_linked_list() -> None:
@@ -55,6 +64,115 @@ def compare_list_and_deque() -> None:
     print(f"Deque (popleft()): {time_deque:.5f} секунд")
 
 
+def bytes_per_element(build: Callable[[List[Any]], Any], items: List[Any]) -> float:
+    """
+    Память структуры в байтах на элемент (tracemalloc).
+    Сами элементы создаются заранее и в замер не входят.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    structure = build(items)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del structure
+    return (after - before) / len(items)
+
+
+def compare_pooled_linked_list(memory_size: int = 200000, ops_size: int = 50000) -> None:
+    """Сравнение PooledLinkedList с LinkedList, list и deque по памяти и скорости очереди."""
+    print(f"\nПамять на элемент ({memory_size} элементов) и очередь FIFO ({ops_size} вставок + удалений):")
+
+    def build_linked_list(items):
+        ll = LinkedList()
+        for x in items:
+            ll.insert_at_end(x)
+        return ll
+
+    def linked_list_queue(items):
+        ll = LinkedList()
+        for x in items:
+            ll.insert_at_end(x)
+        while ll.delete_from_start() is not None:
+            pass
+
+    def pooled_queue(items):
+        pl = PooledLinkedList()
+        for x in items:
+            pl.insert_at_end(x)
+        while pl.delete_from_start() is not None:
+            pass
+
+    def list_queue(items):
+        lst = []
+        for x in items:
+            lst.append(x)
+        while lst:
+            lst.pop(0)
+
+    def deque_queue(items):
+        dq = deque()
+        for x in items:
+            dq.append(x)
+        while dq:
+            dq.popleft()
+
+    structures = [
+        ('LinkedList', build_linked_list, linked_list_queue),
+        ('PooledLinkedList', PooledLinkedList, pooled_queue),
+        ('list', list, list_queue),
+        ('deque', deque, deque_queue),
+    ]
+
+    memory_items = list(range(1, memory_size + 1))
+    ops_items = list(range(1, ops_size + 1))
+    for name, build, queue in structures:
+        memory = bytes_per_element(build, memory_items)
+        result = benchmark(queue, ops_items, repeat=3, name=name)
+        ops_per_sec = 2 * ops_size / result.median
+        print(f"{name:17s}: {memory:7.1f} байт/элемент, {ops_per_sec:12.0f} операций/с")
+
+
+def measure_bracket_throughput(size_mb: int = 64, chunk_size: int = 1 << 24) -> None:
+    """Пропускная способность проверки скобок (МБ/с) на сгенерированном JSON-подобном файле."""
+    record = '{"id": 12345, "tags": ["a", "b", {"k": [1, 2, 3]}], "meta": {"x": (4, 5)}}, '
+    text = '[' + record * (size_mb * (1 << 20) // len(record)) + '{}]'
+    data = text.encode('ascii')
+    megabytes = len(data) / (1 << 20)
+    print(f"\nПроверка скобок на {megabytes:.0f} МБ JSON-подобных данных:")
+
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        f.write(data)
+        path = f.name
+    try:
+        chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+        variants = [
+            ('check_brackets (str целиком)', check_brackets, (text,)),
+            ('check_brackets_stream (bytes)', check_brackets_stream, (chunks,)),
+            ('check_brackets_file (mmap)', check_brackets_file, (path,)),
+        ]
+        for name, func, args in variants:
+            result = benchmark(func, *args, repeat=3, warmup=0, name=name)
+            print(f"{name:32s}: {megabytes / result.median:8.1f} МБ/с")
+    finally:
+        os.unlink(path)
+
+
+def size_worker_pool(arrival_rate: float = 40.0, mean_service: float = 0.2, service: str = 'lognormal',
+                     capacity: int = 100, num_jobs: int = 200000, max_workers: int = 16) -> None:
+    """Подбор числа обработчиков: ожидание p50/p99, загрузка и противодавление для 1..max_workers."""
+    print(f"\nПодбор пула: {arrival_rate:.0f} заданий/с, обслуживание {service} "
+          f"со средним {mean_service}с, очередь на {capacity} заданий")
+    min_workers = max(1, int(arrival_rate * mean_service))  # Меньше - очередь растет неограниченно
+    for workers in range(min_workers, max_workers + 1):
+        stats = simulate_job_queue(num_jobs, workers, arrival_rate, mean_service, service,
+                                   capacity=capacity, policy='block', seed=workers)
+        print(f"{workers:3d} обработчиков: ожидание p50 {stats.wait_p50:8.4f}с p99 {stats.wait_p99:8.4f}с, "
+              f"загрузка {stats.utilization:6.1%}, источник ждал в среднем {stats.mean_blocked:.4f}с")
+
+
 if __name__ == '__main__':
     compare_list_and_linked_list()
-    compare_list_and_deque()
\ No newline at end of file
+    compare_list_and_deque()
+    compare_pooled_linked_list()
+    measure_bracket_throughput()
+    size_worker_pool()
\ No newline at end of file
@@ -1,16 +1,31 @@
 """Модуль для решения практических задач."""
 
+import asyncio
+import heapq
+import math
+import mmap
+import os
+import random
+import re
+import sys
 from collections import deque
-from typing import List
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.benchmark import percentile
+
+DEFAULT_BRACKET_PAIRS = '()[]{}'
+_MAX_REDUCE_PASSES = 16  # Ограничение проходов replace при глубокой вложенности
 
 
 def check_brackets(expression: str) -> bool:
     """Проверка сбалансированности скобок. Используется стек (list)."""
     stack: List[str] = []
     brackets = {')': '(', ']': '[', '}': '{'}
+    openers = set(brackets.values())
 
     for char in expression:
-        if char in brackets.values():
+        if char in openers:
             stack.append(char)
         elif char in brackets:
             if not stack or stack.pop() != brackets[char]:
@@ -18,6 +33,122 @@ def check_brackets(expression: str) -> bool:
     return not stack
 
 
+def check_brackets_stream(chunks: Iterable[Union[str, bytes]], pairs: str = DEFAULT_BRACKET_PAIRS) -> int:
+    """
+    Потоковая проверка сбалансированности скобок по частям (str или bytes).
+
+    В памяти хранится только стек типов открытых скобок (по байту на уровень
+    вложенности). Из каждой части сначала на стороне C (bytes.translate или
+    регулярное выражение) удаляются все символы, кроме скобок, затем несколько
+    проходов replace убирают соседние пары вида "()" - это не меняет ни
+    состояния стека после части, ни наличия ошибки. Цикл Python проходит
+    только по остатку; точное смещение ищется повторным проходом по части
+    лишь при ошибке.
+
+    Args:
+        chunks: Последовательные части входа одного типа (str или bytes)
+        pairs: Пары скобок подряд: открывающая, закрывающая, ...
+
+    Returns:
+        -1, если скобки сбалансированы, иначе смещение первой ошибки
+        (в символах для str, в байтах для bytes): позиция лишней или
+        несовпадающей закрывающей скобки либо длина входа, если остались
+        незакрытые скобки
+    """
+    if len(pairs) % 2 != 0 or len(set(pairs)) != len(pairs):
+        raise ValueError("pairs должна состоять из пар различных символов")
+    binary_pairs = pairs.encode('ascii') if pairs.isascii() else None
+
+    stack = bytearray()
+    offset = 0
+    prepared = None  # Таблицы для типа частей (str или bytes)
+    for chunk in chunks:
+        if prepared is None:
+            if isinstance(chunk, (bytes, bytearray, memoryview)):
+                if binary_pairs is None:
+                    raise ValueError("Для bytes скобки должны быть ASCII-символами")
+                prepared = _prepare_bracket_tables(binary_pairs)
+            else:
+                prepared = _prepare_bracket_tables(pairs)
+        kinds, bracket_pattern, only_brackets, matched_pairs = prepared
+
+        brackets = only_brackets(chunk)
+        reduced = brackets
+        for _ in range(_MAX_REDUCE_PASSES):
+            previous_length = len(reduced)
+            for pair in matched_pairs:
+                reduced = reduced.replace(pair, pair[:0])
+            if len(reduced) == previous_length:
+                break
+
+        # Часть снимает со стека не больше len(reduced) скобок - для отката
+        # при ошибке достаточно сохранить вершину такой длины
+        depth = len(stack)
+        top = stack[max(0, depth - len(reduced)):]
+        if _apply_brackets(reduced, kinds, stack) >= 0:
+            # Ошибка есть: стек восстанавливается, точная позиция - по полному списку скобок части
+            del stack[depth - len(top):]
+            stack += top
+            index = _apply_brackets(brackets, kinds, stack)
+            matches = bracket_pattern.finditer(chunk)
+            for _ in range(index):
+                next(matches)
+            return offset + next(matches).start()
+        offset += len(chunk)
+
+    return offset if stack else -1
+
+
+def _apply_brackets(brackets: Union[str, bytes], kinds, stack: bytearray) -> int:
+    """Применение скобок к стеку; индекс первой ошибочной скобки или -1."""
+    for index, char in enumerate(brackets):
+        kind = kinds[char]
+        if kind >= 0:
+            stack.append(kind)
+        elif not stack or stack.pop() != ~kind:
+            return index
+    return -1
+
+
+def _prepare_bracket_tables(pairs: Union[str, bytes]):
+    """
+    Таблицы для потоковой проверки: тип скобки (k для открывающей k-й пары,
+    ~k для закрывающей), регулярное выражение для поиска скобок, функция,
+    оставляющая в части только скобки, и список соседних пар вида "()".
+    """
+    kinds = {}
+    for k in range(len(pairs) // 2):
+        kinds[pairs[2 * k]] = k
+        kinds[pairs[2 * k + 1]] = ~k
+    matched_pairs = [pairs[i:i + 2] for i in range(0, len(pairs), 2)]
+
+    if isinstance(pairs, bytes):
+        bracket_pattern = re.compile(b'[' + re.escape(pairs) + b']')
+        non_brackets = bytes(b for b in range(256) if b not in pairs)
+        return (kinds, bracket_pattern,
+                lambda chunk: bytes(chunk).translate(None, non_brackets), matched_pairs)
+
+    bracket_pattern = re.compile('[' + re.escape(pairs) + ']')
+    gaps = re.compile('[^' + re.escape(pairs) + ']+')
+    return kinds, bracket_pattern, lambda chunk: gaps.sub('', chunk), matched_pairs
+
+
+def check_brackets_file(path: str, pairs: str = DEFAULT_BRACKET_PAIRS, chunk_size: int = 1 << 24) -> int:
+    """
+    Проверка скобок в файле любого размера через mmap, частями по chunk_size байт.
+
+    Returns:
+        -1, если скобки сбалансированы, иначе смещение первой ошибки в байтах
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, 2)
+        if f.tell() == 0:
+            return -1
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            chunks = (mm[i:i + chunk_size] for i in range(0, len(mm), chunk_size))
+            return check_brackets_stream(chunks, pairs)
+
+
 def is_palindrome(sequence: str) -> bool:
     """Проверка, является ли последовательность палиндромом. Используется дек (deque)."""
     dq = deque(sequence)
@@ -27,15 +158,229 @@ def is_palindrome(sequence: str) -> bool:
     return True
 
 
-def simulate_print_queue(tasks: List[str]) -> None:
-    """Симуляция обработки задач в очереди печати. Используется deque."""
-    queue = deque(tasks)
-    while queue:
-        current_task = queue.popleft()
-        print(f"Печатается: {current_task}")
-        # Имитация времени печати
-        # time.sleep(0.5)
+# Распределения времени обслуживания задания с заданным средним mean
+SERVICE_TIME_DISTRIBUTIONS: Dict[str, Callable[[random.Random, float], float]] = {
+    'constant': lambda rng, mean: mean,
+    'uniform': lambda rng, mean: rng.uniform(0, 2 * mean),
+    'exponential': lambda rng, mean: rng.expovariate(1 / mean),
+    # Тяжелый хвост: sigma = 1, mu подобрано так, чтобы среднее было равно mean
+    'lognormal': lambda rng, mean: rng.lognormvariate(math.log(mean) - 0.5, 1.0),
+}
+
+QUEUE_POLICIES = ('block', 'reject')
+
+
+class JobQueueStats:
+    """Итоги работы очереди заданий: ожидание в очереди, загрузка и пропускная способность."""
+
+    def __init__(self, workers: int, waits: List[float], blocked: List[float], busy_time: float,
+                 elapsed: float, rejected: int = 0, failed: int = 0, max_queue_length: int = 0) -> None:
+        self.workers = workers
+        # Ожидание от поступления задания до начала обслуживания; включает
+        # время, которое источник ждал места в полной очереди (оно же в blocked)
+        self.waits = waits
+        self.blocked = blocked  # Ожидание источника перед постановкой в полную очередь
+        self.busy_time = busy_time  # Суммарное время обслуживания всеми обработчиками
+        self.elapsed = elapsed
+        self.rejected = rejected
+        self.failed = failed
+        self.max_queue_length = max_queue_length
+        self._sorted_waits = sorted(waits)
+
+    @property
+    def completed(self) -> int:
+        return len(self.waits) - self.failed
+
+    @property
+    def throughput(self) -> float:
+        """Заданий в секунду."""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Доля времени, которую обработчики были заняты."""
+        return self.busy_time / (self.workers * self.elapsed) if self.elapsed > 0 else 0.0
+
+    @property
+    def wait_p50(self) -> float:
+        return percentile(self._sorted_waits, 50) if self.waits else 0.0
+
+    @property
+    def wait_p99(self) -> float:
+        return percentile(self._sorted_waits, 99) if self.waits else 0.0
+
+    @property
+    def mean_blocked(self) -> float:
+        return sum(self.blocked) / len(self.blocked) if self.blocked else 0.0
+
+    def summary(self) -> str:
+        return (f"обработчиков={self.workers} выполнено={self.completed} отклонено={self.rejected} "
+                f"ожидание p50={self.wait_p50:.4f}с p99={self.wait_p99:.4f}с "
+                f"загрузка={self.utilization:.1%} {self.throughput:.1f} заданий/с")
+
+
+def _check_queue_parameters(workers: int, capacity: Optional[int], policy: str) -> None:
+    if workers < 1:
+        raise ValueError("Нужен хотя бы один обработчик")
+    if capacity is not None and capacity < 1:
+        raise ValueError("Емкость очереди должна быть положительной")
+    if policy not in QUEUE_POLICIES:
+        raise ValueError(f"Неизвестная политика переполнения: {policy}")
+
+
+def simulate_job_queue(num_jobs: int, workers: int = 1, arrival_rate: float = 1.0,
+                       mean_service: float = 1.0, service: str = 'exponential',
+                       capacity: Optional[int] = None, policy: str = 'block',
+                       seed: Optional[int] = None) -> JobQueueStats:
+    """
+    Моделирование очереди заданий в модельном времени (дискретно-событийно).
+
+    Задания приходят пуассоновским потоком с интенсивностью arrival_rate и
+    обслуживаются по порядку поступления workers обработчиками. В очереди
+    ожидают не более capacity заданий: при политике 'block' источник ждет
+    освобождения места (противодавление сдвигает все следующие поступления),
+    при 'reject' задание отклоняется. Моделирует ту же схему, что и
+    run_job_queue, но без реального ожидания, поэтому подходит для подбора
+    числа обработчиков на миллионах заданий.
+
+    Args:
+        num_jobs: Количество заданий
+        workers: Количество обработчиков
+        arrival_rate: Среднее число поступлений в секунду
+        mean_service: Среднее время обслуживания (секунды)
+        service: Распределение времени обслуживания (ключ SERVICE_TIME_DISTRIBUTIONS)
+        capacity: Емкость очереди ожидания (None - без ограничения)
+        policy: Поведение при полной очереди: 'block' или 'reject'
+        seed: Начальное значение генератора случайных чисел
+
+    Returns:
+        JobQueueStats
+
+    Сложность: O(n log w), где w - число обработчиков
+    """
+    _check_queue_parameters(workers, capacity, policy)
+    draw_service = SERVICE_TIME_DISTRIBUTIONS[service]
+    rng = random.Random(seed)
+
+    free_at = [0.0] * workers  # Куча моментов освобождения обработчиков
+    waiting = deque()  # Моменты начала обслуживания заданий, еще стоящих в очереди
+    waits: List[float] = []
+    blocked: List[float] = []
+    busy_time = 0.0
+    rejected = 0
+    max_queue_length = 0
+    now = 0.0
+    last_finish = 0.0
+
+    for _ in range(num_jobs):
+        now += rng.expovariate(arrival_rate)
+        arrival = now
+        # Начала обслуживания при FIFO не убывают, поэтому очередь - префикс deque
+        while waiting and waiting[0] <= now:
+            waiting.popleft()
+        if capacity is not None and len(waiting) >= capacity:
+            if policy == 'reject':
+                rejected += 1
+                continue
+            # Источник ждет, пока в обслуживание не уйдет достаточно заданий
+            enqueued = waiting[len(waiting) - capacity]
+            blocked.append(enqueued - now)
+            now = enqueued
+            while waiting and waiting[0] <= now:
+                waiting.popleft()
+        else:
+            blocked.append(0.0)
+
+        duration = draw_service(rng, mean_service)
+        start = max(now, free_at[0])
+        heapq.heapreplace(free_at, start + duration)
+        waits.append(start - arrival)
+        busy_time += duration
+        last_finish = max(last_finish, start + duration)
+        if start > now:
+            waiting.append(start)
+            max_queue_length = max(max_queue_length, len(waiting))
+
+    return JobQueueStats(workers, waits, blocked, busy_time, last_finish,
+                         rejected=rejected, max_queue_length=max_queue_length)
+
+
+async def run_job_queue(jobs: Iterable[Any], handler: Callable[[Any], Awaitable[Any]], workers: int = 1,
+                        capacity: Optional[int] = None, policy: str = 'block',
+                        interarrival: Optional[Callable[[], float]] = None) -> JobQueueStats:
+    """
+    Выполнение заданий через ограниченную asyncio.Queue и workers параллельных обработчиков.
+
+    Args:
+        jobs: Задания в порядке поступления
+        handler: Асинхронная функция обработки одного задания
+        workers: Количество обработчиков
+        capacity: Емкость очереди (None - без ограничения)
+        policy: Поведение при полной очереди: 'block' (источник ждет) или 'reject'
+        interarrival: Функция, возвращающая паузу перед следующим заданием (секунды)
+
+    Returns:
+        JobQueueStats по реальному времени цикла событий; исключения обработчика
+        учитываются в failed и не останавливают остальных обработчиков
+    """
+    _check_queue_parameters(workers, capacity, policy)
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=capacity or 0)
+    waits: List[float] = []
+    blocked: List[float] = []
+    counters = {'busy': 0.0, 'failed': 0}
+
+    async def worker() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            job, enqueued = item
+            started = loop.time()
+            waits.append(started - enqueued)
+            try:
+                await handler(job)
+            except Exception:
+                counters['failed'] += 1
+            counters['busy'] += loop.time() - started
+
+    tasks = [loop.create_task(worker()) for _ in range(workers)]
+    rejected = 0
+    max_queue_length = 0
+    begin = loop.time()
+    for job in jobs:
+        if interarrival is not None:
+            await asyncio.sleep(interarrival())
+        created = loop.time()
+        if policy == 'reject':
+            try:
+                queue.put_nowait((job, created))
+            except asyncio.QueueFull:
+                rejected += 1
+                continue
+            blocked.append(0.0)
+        else:
+            await queue.put((job, created))
+            blocked.append(loop.time() - created)
+        max_queue_length = max(max_queue_length, queue.qsize())
+
+    for _ in tasks:
+        await queue.put(None)
+    await asyncio.gather(*tasks)
+    return JobQueueStats(workers, waits, blocked, counters['busy'], loop.time() - begin,
+                         rejected=rejected, failed=counters['failed'], max_queue_length=max_queue_length)
+
+
+def simulate_print_queue(tasks: List[str], workers: int = 1, print_time: float = 0.0,
+                         capacity: Optional[int] = None) -> JobQueueStats:
+    """Симуляция обработки задач в очереди печати: asyncio.Queue и workers принтеров."""
+    async def print_job(task: str) -> None:
+        print(f"Печатается: {task}")
+        await asyncio.sleep(print_time)  # Имитация времени печати
+
+    stats = asyncio.run(run_job_queue(tasks, print_job, workers=workers, capacity=capacity))
     print("Все задачи выполнены.")
+    return stats
 
 
 if __name__ == '__main__':
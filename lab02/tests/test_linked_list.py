@@ -0,0 +1,113 @@
+"""
+Тесты для связных списков
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from linked_list import LinkedList
+
+
+def make_list(items):
+    linked = LinkedList()
+    nodes = [linked.insert_at_end(item) for item in items]
+    return linked, nodes
+
+
+def test_remove_middle_head_tail():
+    """Тест удаления узлов из середины, начала и конца"""
+    linked, nodes = make_list([1, 2, 3, 4])
+    assert linked.remove(nodes[1]) == 2
+    assert list(linked) == [1, 3, 4]
+    assert linked.remove(nodes[0]) == 1
+    assert linked.remove(nodes[3]) == 4
+    assert list(linked) == [3]
+    assert linked.head is linked.tail is nodes[2]
+    assert len(linked) == 1
+
+
+def test_remove_clears_links():
+    """Тест: удаленный узел отвязан от соседей"""
+    linked, nodes = make_list([1, 2, 3])
+    linked.remove(nodes[1])
+    assert nodes[1].prev is None and nodes[1].next is None
+    assert nodes[0].next is nodes[2] and nodes[2].prev is nodes[0]
+
+
+def test_remove_twice_raises():
+    """Тест: повторное удаление узла не портит список"""
+    linked, nodes = make_list([1, 2, 3])
+    linked.remove(nodes[1])
+    with pytest.raises(ValueError):
+        linked.remove(nodes[1])
+    assert list(linked) == [1, 3]
+    assert len(linked) == 2
+
+    linked.remove(nodes[0])
+    linked.remove(nodes[2])
+    with pytest.raises(ValueError):
+        linked.remove(nodes[0])
+    assert len(linked) == 0
+    assert linked.head is None and linked.tail is None
+
+
+def test_move_to_front():
+    """Тест переноса узла в начало"""
+    linked, nodes = make_list([1, 2, 3])
+    linked.move_to_front(nodes[2])
+    assert list(linked) == [3, 1, 2]
+    assert linked.tail is nodes[1]
+    linked.move_to_front(nodes[2])
+    assert list(linked) == [3, 1, 2]
+    linked.move_to_front(nodes[0])
+    assert list(linked) == [1, 3, 2]
+    assert len(linked) == 3
+
+
+def test_move_removed_node_raises():
+    """Тест: перенос удаленного узла не портит список"""
+    linked, nodes = make_list([1, 2, 3])
+    linked.remove(nodes[2])
+    with pytest.raises(ValueError):
+        linked.move_to_front(nodes[2])
+    assert list(linked) == [1, 2]
+
+
+def test_splice_after_node():
+    """Тест вставки списка после узла"""
+    linked, nodes = make_list([1, 4])
+    other, _ = make_list([2, 3])
+    linked.splice(other, nodes[0])
+    assert list(linked) == [1, 2, 3, 4]
+    assert len(linked) == 4
+    assert len(other) == 0 and other.head is None and other.tail is None
+    assert [node.data for node in reversed(list(linked.iter_nodes()))] == [4, 3, 2, 1]
+
+
+def test_splice_front_and_self():
+    """Тест вставки списка в начало и вставки списка в самого себя"""
+    linked, _ = make_list([3])
+    other, _ = make_list([1, 2])
+    linked.splice(other)
+    assert list(linked) == [1, 2, 3]
+    with pytest.raises(ValueError):
+        linked.splice(linked)
+
+
+def test_concat():
+    """Тест объединения списков, в том числе пустых"""
+    linked, _ = make_list([])
+    linked.concat(LinkedList())
+    assert list(linked) == [] and len(linked) == 0
+    other, _ = make_list([1, 2])
+    linked.concat(other)
+    assert list(linked) == [1, 2]
+    more, _ = make_list([3])
+    linked.concat(more)
+    assert list(linked) == [1, 2, 3]
+    assert linked.tail.data == 3
+    assert linked.delete_from_end() == 3
+
@@ -0,0 +1,37 @@
+"""
+Тесты для связного списка на массивах
+"""
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from linked_list import PooledLinkedList
+
+
+def test_pooled_list_order():
+    """Тест вставки и удаления в списке на массивах"""
+    pooled = PooledLinkedList([2, 3])
+    pooled.insert_at_start(1)
+    pooled.insert_at_end(4)
+    assert list(pooled) == [1, 2, 3, 4]
+    assert pooled.delete_from_start() == 1
+    assert len(pooled) == 3
+    for _ in range(3):
+        pooled.delete_from_start()
+    assert pooled.delete_from_start() is None
+    pooled.insert_at_end(5)
+    assert list(pooled) == [5]
+
+
+def test_pooled_list_reuses_free_slots():
+    """Тест: освобожденные ячейки переиспользуются при вставке"""
+    pooled = PooledLinkedList(range(100))
+    for _ in range(50):
+        pooled.delete_from_start()
+    assert len(pooled._data) == 100
+    pooled.extend(range(100, 150))
+    assert len(pooled._data) == 100
+    assert list(pooled) == list(range(50, 150))
+    pooled.insert_at_end(150)
+    assert len(pooled._data) == 101
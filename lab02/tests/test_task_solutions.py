@@ -0,0 +1,175 @@
+"""
+Тесты для практических задач: проверка скобок и очередь заданий
+"""
+import asyncio
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from performance_analysis import size_worker_pool
+from task_solutions import (check_brackets, check_brackets_stream, check_brackets_file,
+                            simulate_job_queue, run_job_queue)
+
+
+def first_error(expression: str) -> int:
+    """Смещение первой ошибки, найденное посимвольно"""
+    stack = []
+    brackets = {')': '(', ']': '[', '}': '{'}
+    for index, char in enumerate(expression):
+        if char in '([{':
+            stack.append(char)
+        elif char in brackets and (not stack or stack.pop() != brackets[char]):
+            return index
+    return len(expression) if stack else -1
+
+
+def split(expression, size):
+    return [expression[i:i + size] for i in range(0, len(expression), size)]
+
+
+def test_balanced_stream():
+    """Тест сбалансированного входа в одной и нескольких частях"""
+    assert check_brackets_stream(['a(b[c]{d})e']) == -1
+    assert check_brackets_stream([]) == -1
+    assert check_brackets_stream(['', 'x', '']) == -1
+
+
+def test_pair_split_between_chunks():
+    """Тест: граница частей разрезает пару скобок"""
+    assert check_brackets_stream(['(', ')']) == -1
+    assert check_brackets_stream(['x([', 'y', ']z', ')']) == -1
+    assert check_brackets_stream(['{[(', ')]}']) == -1
+    assert check_brackets_stream(['((', '])']) == 2
+    assert check_brackets_stream(['(', 'ab', ']']) == 3
+
+
+def test_unclosed_at_end_of_stream():
+    """Тест: незакрытые скобки в конце потока - смещение равно длине входа"""
+    assert check_brackets_stream(['(a', 'b']) == 3
+    assert check_brackets_stream(['()', '[', '']) == 3
+    assert check_brackets_stream([b'{(', b')']) == 3
+
+
+def test_extra_closing_bracket():
+    """Тест лишней закрывающей скобки в середине и в конце потока"""
+    assert check_brackets_stream(['()', ')(']) == 2
+    assert check_brackets_stream(['(())', '', ']']) == 4
+
+
+def test_error_after_failed_reduced_pass():
+    """Тест: ошибка в части после вложенных скобок из предыдущих частей"""
+    depth = 100
+    chunks = ['(' * depth, ')' * (depth - 1) + ']' + ')']
+    assert check_brackets_stream(chunks) == 2 * depth - 1
+
+
+def test_random_chunking_matches_reference():
+    """Тест случайных входов и разбиений против посимвольной проверки"""
+    rng = random.Random(9)
+    for _ in range(300):
+        expression = ''.join(rng.choice('()[]{}ab') for _ in range(rng.randrange(60)))
+        if rng.random() < 0.5:  # Сбалансированные входы тоже нужны
+            expression = ''.join(rng.choice(['()', '[', ']', 'x']) for _ in range(20))
+        expected = first_error(expression)
+        for size in (1, 2, 3, 7, 64):
+            assert check_brackets_stream(split(expression, size)) == expected
+            assert check_brackets_stream(split(expression.encode(), size)) == expected
+        assert (expected == -1) == check_brackets(expression)
+
+
+def test_custom_pairs_and_validation():
+    """Тест своих пар скобок и неверного параметра pairs"""
+    assert check_brackets_stream(['<', '>'], pairs='<>') == -1
+    assert check_brackets_stream(['<', '(>'], pairs='<>()') == 2
+    with pytest.raises(ValueError):
+        check_brackets_stream(['()'], pairs='(')
+
+
+def test_check_brackets_file(tmp_path):
+    """Тест проверки файла частями меньше входа"""
+    path = tmp_path / 'input.txt'
+    path.write_bytes(b'([x]' * 10 + b')' * 10)
+    assert check_brackets_file(str(path), chunk_size=3) == -1
+    path.write_bytes(b'([x]' * 10 + b')' * 9 + b']')
+    assert check_brackets_file(str(path), chunk_size=3) == 49
+    path.write_bytes(b'')
+    assert check_brackets_file(str(path)) == -1
+
+
+def test_simulate_job_queue_throughput():
+    """Тест модели очереди: при перегрузке пропускная способность равна workers / mean_service"""
+    stats = simulate_job_queue(2000, workers=2, arrival_rate=1000.0, mean_service=1.0,
+                               service='constant', capacity=10, policy='block', seed=1)
+    assert stats.completed == 2000
+    assert stats.rejected == 0
+    assert stats.throughput == pytest.approx(2.0, rel=0.01)
+    assert stats.utilization == pytest.approx(1.0, rel=0.01)
+    assert stats.max_queue_length == 10
+    assert stats.mean_blocked > 0
+
+
+def test_simulate_job_queue_reject_and_seed():
+    """Тест политики reject и воспроизводимости по seed"""
+    stats = simulate_job_queue(1000, workers=1, arrival_rate=10.0, mean_service=1.0,
+                               service='constant', capacity=1, policy='reject', seed=2)
+    assert stats.completed + stats.rejected == 1000
+    assert stats.rejected > 800
+    assert all(blocked == 0.0 for blocked in stats.blocked)
+    again = simulate_job_queue(1000, workers=1, arrival_rate=10.0, mean_service=1.0,
+                               service='constant', capacity=1, policy='reject', seed=2)
+    assert again.waits == stats.waits
+    with pytest.raises(ValueError):
+        simulate_job_queue(10, workers=0)
+    with pytest.raises(ValueError):
+        simulate_job_queue(10, policy='drop')
+
+
+def test_wait_includes_blocking():
+    """Тест: ожидание считается от поступления задания и включает блокировку источника"""
+    # Один обработчик, очередь на одно задание, поступления почти мгновенные: начиная с
+    # третьего задания источник ждет около 1с места в очереди и еще 1с задание стоит в ней
+    stats = simulate_job_queue(50, workers=1, arrival_rate=10**6, mean_service=1.0,
+                               service='constant', capacity=1, policy='block', seed=3)
+    assert stats.blocked[:2] == [0.0, 0.0]
+    assert stats.blocked[2:] == pytest.approx([1.0] * 48, abs=1e-3)
+    assert stats.waits[2:] == pytest.approx([2.0] * 48, abs=1e-3)
+
+    async def handler(job):
+        await asyncio.sleep(0.005)
+
+    stats = asyncio.run(run_job_queue(range(10), handler, workers=1, capacity=1))
+    assert any(blocked > 0 for blocked in stats.blocked)
+    assert all(wait >= blocked for wait, blocked in zip(stats.waits, stats.blocked))
+
+
+def test_run_job_queue_failed_and_rejected():
+    """Тест реальной очереди: ошибки обработчика и отклонение при полной очереди"""
+    done = []
+
+    async def handler(job):
+        if job % 3 == 0:
+            raise RuntimeError(job)
+        done.append(job)
+
+    stats = asyncio.run(run_job_queue(range(30), handler, workers=3))
+    assert stats.failed == 10
+    assert stats.completed == 20
+    assert sorted(done) == [job for job in range(30) if job % 3]
+    assert stats.throughput > 0
+
+    # Без пауз источник не уступает управление: в очередь емкости 1 попадает только первое задание
+    stats = asyncio.run(run_job_queue(range(10), handler, workers=2, capacity=1, policy='reject'))
+    assert stats.rejected == 9
+    assert len(stats.waits) == 1
+
+
+def test_size_worker_pool(capsys):
+    """Тест подбора пула: строка на каждое число обработчиков от arrival_rate * mean_service"""
+    size_worker_pool(arrival_rate=10.0, mean_service=0.2, capacity=10, num_jobs=2000, max_workers=5)
+    lines = capsys.readouterr().out.strip().splitlines()
+    rows = [line for line in lines if 'обработчиков' in line]
+    assert [int(line.split()[0]) for line in rows] == [2, 3, 4, 5]
@@ -0,0 +1,211 @@
+"""
+Модуль с компактным представлением бинарного дерева в виде структуры массивов.
+"""
+
+from array import array
+from typing import List, Optional, Tuple
+
+from src.task_solutions import TreeNode
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен, без него используется array
+    np = None
+
+NIL = -1  # Отсутствующий потомок
+
+
+class ArrayTree:
+    """
+    Бинарное дерево в трех параллельных массивах: values[i] - значение узла i,
+    left[i] и right[i] - индексы потомков (NIL, если потомка нет).
+
+    Узлы хранятся в порядке прямого обхода, корень - узел 0, поэтому потомки
+    всегда правее родителя. На узел приходится 24 байта в массивах array('q')
+    или NumPy int64 вместо отдельного объекта TreeNode.
+    """
+
+    def __init__(self, values, left, right) -> None:
+        self.values = values
+        self.left = left
+        self.right = right
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @classmethod
+    def _from_lists(cls, values: array, left: array, right: array, use_numpy: bool) -> 'ArrayTree':
+        if use_numpy:
+            if np is None:
+                raise ImportError("Для use_numpy=True нужен NumPy")
+            return cls(np.frombuffer(values, dtype=np.int64), np.frombuffer(left, dtype=np.int64),
+                       np.frombuffer(right, dtype=np.int64))
+        return cls(values, left, right)
+
+    @classmethod
+    def from_nodes(cls, root: Optional[TreeNode], use_numpy: bool = False) -> 'ArrayTree':
+        """
+        Построение из дерева TreeNode (итеративно, глубина не ограничена). Сложность: O(n)
+
+        Args:
+            root: Корень дерева
+            use_numpy: Хранить массивы в NumPy
+        """
+        values, left, right = array('q'), array('q'), array('q')
+        stack = [(root, NIL, False)] if root is not None else []
+        while stack:
+            node, parent, is_right = stack.pop()
+            index = len(values)
+            values.append(node.value)
+            left.append(NIL)
+            right.append(NIL)
+            if parent != NIL:
+                (right if is_right else left)[parent] = index
+            if node.right is not None:
+                stack.append((node.right, index, True))
+            if node.left is not None:
+                stack.append((node.left, index, False))
+        return cls._from_lists(values, left, right, use_numpy)
+
+    @classmethod
+    def balanced(cls, n: int, use_numpy: bool = False) -> 'ArrayTree':
+        """
+        Сбалансированное дерево поиска из значений 0..n-1 без промежуточных TreeNode.
+        Сложность: O(n)
+        """
+        values, left, right = array('q'), array('q'), array('q')
+        stack = [(0, n - 1, NIL, False)] if n > 0 else []
+        while stack:
+            low, high, parent, is_right = stack.pop()
+            mid = (low + high) // 2
+            index = len(values)
+            values.append(mid)
+            left.append(NIL)
+            right.append(NIL)
+            if parent != NIL:
+                (right if is_right else left)[parent] = index
+            if mid < high:
+                stack.append((mid + 1, high, index, True))
+            if low < mid:
+                stack.append((low, mid - 1, index, False))
+        return cls._from_lists(values, left, right, use_numpy)
+
+    def to_nodes(self) -> Optional[TreeNode]:
+        """Обратное преобразование в дерево TreeNode. Сложность: O(n)"""
+        nodes = [TreeNode(value) for value in self.values.tolist()]
+        for node, left, right in zip(nodes, self.left.tolist(), self.right.tolist()):
+            if left != NIL:
+                node.left = nodes[left]
+            if right != NIL:
+                node.right = nodes[right]
+        return nodes[0] if nodes else None
+
+    def preorder(self) -> List[int]:
+        """Прямой обход: массив values уже хранится в этом порядке. Сложность: O(n)"""
+        return self.values.tolist()
+
+    def _numpy_levels(self) -> list:
+        """Уровни дерева как массивы индексов узлов (для векторных проходов NumPy)."""
+        levels = []
+        level = np.zeros(1 if len(self.values) else 0, dtype=np.int64)
+        while level.size:
+            levels.append(level)
+            children = np.concatenate((self.left[level], self.right[level]))
+            level = children[children != NIL]
+        return levels
+
+    def _inorder_numpy(self) -> List[int]:
+        """
+        Симметричный обход векторно по уровням: место узла в обходе равно началу
+        диапазона его поддерева плюс размер левого поддерева.
+        """
+        n = len(self.values)
+        levels = self._numpy_levels()
+        # Индекс NIL = -1 попадает в последний, фиктивный элемент массивов
+        size = np.zeros(n + 1, dtype=np.int64)
+        for level in reversed(levels):
+            size[level] = 1 + size[self.left[level]] + size[self.right[level]]
+        start = np.zeros(n + 1, dtype=np.int64)
+        position = np.empty(n, dtype=np.int64)
+        for level in levels:
+            left, right = self.left[level], self.right[level]
+            level_position = start[level] + size[left]
+            position[level] = level_position
+            start[left] = start[level]
+            start[right] = level_position + 1
+        result = np.empty(n, dtype=self.values.dtype)
+        result[position] = self.values
+        return result.tolist()
+
+    def inorder(self) -> List[int]:
+        """Симметричный обход со стеком индексов (для NumPy - по уровням). Сложность: O(n)"""
+        if np is not None and isinstance(self.values, np.ndarray):
+            return self._inorder_numpy()
+        values, left, right = self.values.tolist(), self.left.tolist(), self.right.tolist()
+        result = []
+        stack = []
+        current = 0 if values else NIL
+        while current != NIL or stack:
+            while current != NIL:
+                stack.append(current)
+                current = left[current]
+            current = stack.pop()
+            result.append(values[current])
+            current = right[current]
+        return result
+
+    def postorder(self) -> List[int]:
+        """
+        Обратный обход: обход корень -> правое -> левое, записанный задом наперед.
+        Сложность: O(n)
+        """
+        values, left, right = self.values.tolist(), self.left.tolist(), self.right.tolist()
+        result = []
+        stack = [0] if values else []
+        while stack:
+            current = stack.pop()
+            result.append(values[current])
+            if left[current] != NIL:
+                stack.append(left[current])
+            if right[current] != NIL:
+                stack.append(right[current])
+        result.reverse()
+        return result
+
+    def aggregates(self) -> Tuple[int, int, int]:
+        """
+        Количество узлов, высота и сумма значений за один проход.
+
+        Потомки лежат правее родителя, поэтому при проходе индексов справа
+        налево высоты поддеревьев потомков уже известны - стек не нужен.
+
+        Returns:
+            Кортеж (количество узлов, высота, сумма значений)
+
+        Сложность: O(n)
+        """
+        values, left, right = self.values.tolist(), self.left.tolist(), self.right.tolist()
+        n = len(values)
+        heights = [0] * (n + 1)  # heights[NIL] = heights[n] = 0 для пустого поддерева
+        total = 0
+        for i in range(n - 1, -1, -1):
+            left_height = heights[left[i]]
+            right_height = heights[right[i]]
+            heights[i] = 1 + (left_height if left_height > right_height else right_height)
+            total += values[i]
+        return n, heights[0] if n else 0, total
+
+    def height(self) -> int:
+        """
+        Высота дерева. Для NumPy - по уровням: все узлы уровня обрабатываются
+        одной векторной операцией. Сложность: O(n)
+        """
+        if np is None or not isinstance(self.values, np.ndarray):
+            return self.aggregates()[1]
+        return len(self._numpy_levels())
+
+    def sum_values(self) -> int:
+        """Сумма значений узлов. Сложность: O(n)"""
+        if np is not None and isinstance(self.values, np.ndarray):
+            return int(self.values.sum())
+        return sum(self.values)
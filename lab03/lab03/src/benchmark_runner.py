@@ -0,0 +1,247 @@
+"""
+Модуль для параллельного запуска сравнений алгоритмов в пуле процессов.
+
+Каждое сравнение разбивается на независимые случаи (группа, алгоритм, n),
+которые раздаются рабочим процессам. Рабочий процесс привязан к своему ядру
+процессора, а случай, превысивший лимит времени, завершается вместе с
+процессом (процесс тут же перезапускается), поэтому медленные варианты вроде
+fibonacci_recursive при больших n не блокируют остальные измерения.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from common.benchmark import benchmark
+
+from src.recursive_algorithms import (
+    factorial_recursive,
+    factorial_iterative,
+    fibonacci_recursive,
+    fibonacci_iterative,
+    binary_search_recursive,
+    binary_search_iterative,
+    gcd_recursive,
+    gcd_iterative
+)
+from src.task_solutions import is_palindrome_recursive, is_palindrome_iterative
+
+OK, TIMEOUT, ERROR = 'ok', 'timeout', 'error'
+
+
+class BenchmarkCase:
+    """Один независимый случай: алгоритм группы сравнения на входе размера n."""
+
+    def __init__(self, group: str, algorithm: str, n: Any, func: Callable, args: Tuple = (),
+                 repeat: int = 3) -> None:
+        self.group = group
+        self.algorithm = algorithm
+        self.n = n
+        self.func = func  # Функция и аргументы передаются в процесс через pickle
+        self.args = args
+        self.repeat = repeat
+
+
+class CaseResult:
+    """Результат случая: status - OK, TIMEOUT или ERROR."""
+
+    def __init__(self, case: BenchmarkCase, status: str, median: Optional[float] = None,
+                 value: Any = None, error: str = '', cpu: Optional[int] = None) -> None:
+        self.case = case
+        self.status = status
+        self.median = median
+        self.value = value
+        self.error = error
+        self.cpu = cpu
+
+
+def _worker(connection, cpu: Optional[int]) -> None:
+    """Цикл рабочего процесса: получение случая, измерение, отправка результата."""
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    while True:
+        task = connection.recv()
+        if task is None:
+            return
+        index, func, args, repeat = task
+        try:
+            result = benchmark(func, *args, repeat=repeat, warmup=0)
+            connection.send((index, OK, result.median, result.value, ''))
+        except Exception as exc:  # RecursionError и другие ошибки - результат случая, а не сбой пула
+            connection.send((index, ERROR, None, None, f"{type(exc).__name__}: {exc}"))
+
+
+def _available_cpus() -> List[Optional[int]]:
+    """Ядра для привязки рабочих процессов; [None], если привязка не поддерживается."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return [None]
+
+
+class _Worker:
+    """Рабочий процесс, привязанный к ядру cpu, и его канал связи."""
+
+    def __init__(self, context, cpu: Optional[int]) -> None:
+        self.cpu = cpu
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_worker, args=(child, cpu), daemon=True)
+        self.process.start()
+        child.close()
+        self.index = None  # Номер выполняемого случая
+        self.deadline = 0.0
+
+    def stop(self, kill: bool = False) -> None:
+        if kill:
+            self.process.kill()
+        else:
+            self.connection.send(None)
+        self.process.join()
+        self.connection.close()
+
+
+def run_cases(cases: Sequence[BenchmarkCase], workers: Optional[int] = None,
+              timeout: float = 10.0) -> List[CaseResult]:
+    """
+    Выполнение случаев в пуле привязанных к ядрам процессов.
+
+    Args:
+        cases: Случаи для измерения
+        workers: Число рабочих процессов (по умолчанию - число доступных ядер)
+        timeout: Лимит времени на случай в секундах (все повторы вместе);
+                 процесс, превысивший лимит, завершается и перезапускается
+
+    Returns:
+        Результаты в порядке cases
+    """
+    cpus = _available_cpus()
+    workers = max(1, min(workers or len(cpus), len(cases)))
+    context = multiprocessing.get_context()
+    pool = [_Worker(context, cpus[i % len(cpus)]) for i in range(workers)]
+    results: List[Optional[CaseResult]] = [None] * len(cases)
+    pending = list(range(len(cases)))
+    pending.reverse()
+    try:
+        while pending or any(worker.index is not None for worker in pool):
+            for worker in pool:
+                if worker.index is None and pending:
+                    worker.index = pending.pop()
+                    case = cases[worker.index]
+                    worker.deadline = time.monotonic() + timeout
+                    worker.connection.send((worker.index, case.func, case.args, case.repeat))
+
+            busy = [worker for worker in pool if worker.index is not None]
+            now = time.monotonic()
+            ready = wait([worker.connection for worker in busy],
+                         max(0.0, min(worker.deadline for worker in busy) - now))
+            for i, worker in enumerate(pool):
+                if worker.index is None:
+                    continue
+                if worker.connection in ready:
+                    try:
+                        index, status, median, value, error = worker.connection.recv()
+                    except EOFError:  # Процесс упал (например, переполнение стека C)
+                        index, status, median, value, error = worker.index, ERROR, None, None, 'процесс завершился'
+                        worker.stop(kill=True)
+                        pool[i] = worker = _Worker(context, worker.cpu)
+                    results[index] = CaseResult(cases[index], status, median, value, error, worker.cpu)
+                    worker.index = None
+                elif time.monotonic() >= worker.deadline:
+                    results[worker.index] = CaseResult(cases[worker.index], TIMEOUT, cpu=worker.cpu)
+                    worker.stop(kill=True)
+                    pool[i] = _Worker(context, worker.cpu)
+    finally:
+        for worker in pool:
+            if worker.process.is_alive():
+                worker.stop(kill=worker.index is not None)
+    return results
+
+
+def format_table(results: Sequence[CaseResult]) -> str:
+    """
+    Сводная таблица: строка на (группа, n), столбец на алгоритм, медиана времени
+    в секундах; в последнем столбце - совпадают ли результаты завершенных вариантов.
+    """
+    rows: Dict[Tuple[str, Any], Dict[str, CaseResult]] = {}
+    algorithms: Dict[str, List[str]] = {}
+    for result in results:
+        case = result.case
+        rows.setdefault((case.group, case.n), {})[case.algorithm] = result
+        columns = algorithms.setdefault(case.group, [])
+        if case.algorithm not in columns:
+            columns.append(case.algorithm)
+
+    lines = []
+    current_group = None
+    for (group, n), row in rows.items():
+        if group != current_group:
+            current_group = group
+            header = f"{group:16s} | {'n':>12s} | " + " | ".join(f"{name:>14s}" for name in algorithms[group])
+            lines.append(header + " | результаты")
+            lines.append("-" * (len(header) + 13))
+        cells = []
+        for name in algorithms[group]:
+            result = row.get(name)
+            if result is None:
+                cells.append(f"{'':>14s}")
+            elif result.status == OK:
+                cells.append(f"{result.median:14.6f}")
+            else:
+                cells.append(f"{'лимит времени' if result.status == TIMEOUT else 'ошибка':>14s}")
+        values = [result.value for result in row.values() if result.status == OK]
+        check = '-' if len(values) < 2 else ('совпадают' if all(v == values[0] for v in values) else 'ОШИБКА')
+        lines.append(f"{'':16s} | {str(n):>12s} | " + " | ".join(cells) + f" | {check}")
+    return "\n".join(lines)
+
+
+def default_cases() -> List[BenchmarkCase]:
+    """Случаи сравнений рекурсивных и итеративных версий из performance_analysis."""
+    cases = []
+    for n in (10, 100, 500):
+        cases.append(BenchmarkCase('факториал', 'рекурсивная', n, factorial_recursive, (n,)))
+        cases.append(BenchmarkCase('факториал', 'итеративная', n, factorial_iterative, (n,)))
+    for n in (10, 30, 35, 40):
+        cases.append(BenchmarkCase('Фибоначчи', 'рекурсивная', n, fibonacci_recursive, (n,)))
+        cases.append(BenchmarkCase('Фибоначчи', 'итеративная', n, fibonacci_iterative, (n,)))
+    for size, target in ((1000, 500), (10000, 5000)):
+        arr = list(range(size))
+        cases.append(BenchmarkCase('бинарный поиск', 'рекурсивная', size, binary_search_recursive, (arr, target)))
+        cases.append(BenchmarkCase('бинарный поиск', 'итеративная', size, binary_search_iterative, (arr, target)))
+    for a, b in ((48, 18), (1000, 250)):
+        cases.append(BenchmarkCase('НОД', 'рекурсивная', f"{a}, {b}", gcd_recursive, (a, b)))
+        cases.append(BenchmarkCase('НОД', 'итеративная', f"{a}, {b}", gcd_iterative, (a, b)))
+    for s in ("радар", "привет", "А роза упала на лапу Азора"):
+        label = s if len(s) <= 12 else s[:9] + '...'
+        cases.append(BenchmarkCase('палиндром', 'рекурсивная', label, is_palindrome_recursive, (s,)))
+        cases.append(BenchmarkCase('палиндром', 'итеративная', label, is_palindrome_iterative, (s,)))
+    return cases
+
+
+def run_comparisons(workers: Optional[int] = None, timeout: float = 10.0) -> List[CaseResult]:
+    """Параллельный запуск default_cases() и печать сводной таблицы."""
+    cases = default_cases()
+    start = time.perf_counter()
+    results = run_cases(cases, workers, timeout)
+    elapsed = time.perf_counter() - start
+    print(f"\nСравнение рекурсивных и итеративных версий (медиана, секунды; лимит {timeout:g} с на случай):")
+    print(format_table(results))
+    print(f"Случаев: {len(cases)}, время запуска: {elapsed:.1f} с")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Командная строка: число процессов и лимит времени на случай."""
+    parser = argparse.ArgumentParser(description='Параллельный запуск сравнений lab03')
+    parser.add_argument('--workers', type=int, default=None, help='Число рабочих процессов')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Лимит времени на случай, секунды')
+    args = parser.parse_args(argv)
+    run_comparisons(args.workers, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@ from src.recursive_algorithms import (
     gcd_recursive,
     gcd_iterative
 )
+from src.benchmark_runner import BenchmarkCase, OK, TIMEOUT, run_cases
 from src.task_solutions import (
     hanoi_towers,
     is_palindrome_recursive,
@@ -46,24 +47,28 @@ def demonstrate_factorial() -> None:
         print()
 
 
-def demonstrate_fibonacci() -> None:
-    """Демонстрация вычисления чисел Фибоначчи."""
+def demonstrate_fibonacci(timeout: float = 10.0) -> None:
+    """
+    Демонстрация вычисления чисел Фибоначчи. Рекурсивная версия выполняется
+    в пуле процессов (run_cases) и прерывается через timeout секунд.
+    """
     print("="*60)
     print("Демонстрация вычисления чисел Фибоначчи")
     print("="*60)
     
     values = [5, 10, 20, 30]
-    for n in values:
-        if n <= 30:
-            fib_rec = fibonacci_recursive(n)
+    cases = [BenchmarkCase('Фибоначчи', 'рекурсивная', n, fibonacci_recursive, (n,), repeat=1) for n in values]
+    for result in run_cases(cases, timeout=timeout):
+        n = result.case.n
+        if result.status == OK:
+            fib_rec = result.value
+        elif result.status == TIMEOUT:
+            fib_rec = f"прервана по лимиту времени {timeout:g} с"
         else:
-            fib_rec = "слишком медленно"
+            fib_rec = result.error
         fib_iter = fibonacci_iterative(n)
         print(f"Число Фибоначчи F({n}):")
-        if n <= 30:
-            print(f"  Рекурсивно: {fib_rec}")
-        else:
-            print(f"  Рекурсивно: {fib_rec}")
+        print(f"  Рекурсивно: {fib_rec}")
         print(f"  Итеративно: {fib_iter}")
         print()
 
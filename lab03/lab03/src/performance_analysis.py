@@ -2,25 +2,56 @@
 Модуль для анализа производительности рекурсивных и итеративных алгоритмов.
 """
 
-import time
-from typing import Callable, Tuple
+from functools import partial
+from typing import Callable, Optional, Sequence, Tuple
+import math
+import random
 import sys
 import os
+import tracemalloc
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from common.benchmark import benchmark
 
 from src.recursive_algorithms import (
     factorial_recursive,
     factorial_iterative,
+    factorial_binary_splitting,
+    factorial_prime_swing,
+    factorial_stackless,
     fibonacci_recursive,
     fibonacci_iterative,
     binary_search_recursive,
     binary_search_iterative,
+    binary_search_stackless,
+    power,
+    power_batch,
+    power_recursive,
+    power_stackless,
     gcd_recursive,
-    gcd_iterative
+    gcd_iterative,
+    gcd_stackless,
+    gcd_binary,
+    extended_gcd,
+    gcd_array,
+    gcd_vectorized
 )
+from src.array_tree import ArrayTree, np
+from src.benchmark_runner import BenchmarkCase, OK, TIMEOUT, run_cases, run_comparisons
 from src.task_solutions import (
-    is_palindrome_recursive,
-    is_palindrome_iterative
+    is_palindrome_iterative,
+    is_palindrome_large,
+    longest_palindrome,
+    TreeNode,
+    count_nodes,
+    count_nodes_stackless,
+    tree_height,
+    sum_tree_values,
+    tree_traversal_inorder,
+    hanoi_towers,
+    hanoi_moves,
+    hanoi_moves_packed
 )
 
 
@@ -34,104 +65,240 @@ def measure_time(func: Callable, *args, **kwargs) -> Tuple[float, any]:
         **kwargs: Именованные аргументы
         
     Returns:
-        Кортеж (время выполнения в секундах, результат функции)
+        Кортеж (медианное время выполнения в секундах, результат функции)
     """
-    start_time = time.perf_counter()
-    result = func(*args, **kwargs)
-    end_time = time.perf_counter()
-    return end_time - start_time, result
+    result = benchmark(partial(func, **kwargs), *args, name=func.__name__)
+    return result.median, result.value
 
 
-def compare_factorial(n: int) -> None:
-    """Сравнение рекурсивной и итеративной версий факториала."""
-    print(f"\nСравнение факториала для n = {n}:")
-    
+def compare_factorial_engines(sizes: Sequence[int] = (500, 10**3, 10**4, 10**5, 10**6),
+                              workers: Optional[int] = None) -> None:
+    """
+    Сравнение способов вычисления факториала больших чисел.
+
+    Рекурсивная версия ограничена глубиной рекурсии, последовательный цикл
+    запускается только до n = 10^5 (при 10^6 он работает десятки минут);
+    math.factorial приведен как эталон на C.
+    """
+    print("\nФакториал больших чисел (медиана, секунды):")
+    engines = [
+        ('рекурсивная', factorial_recursive, sys.getrecursionlimit() - 50),
+        ('итеративная', factorial_iterative, 10**5),
+        ('дерево произведений', factorial_binary_splitting, None),
+        ('prime swing', factorial_prime_swing, None),
+        ('math.factorial', math.factorial, None),
+    ]
+    if workers:
+        engines.insert(3, (f'дерево, {workers} процессов', partial(factorial_binary_splitting, workers=workers), None))
+
+    for n in sizes:
+        repeat = 3 if n <= 10**5 else 1
+        expected = None
+        line = []
+        for name, func, limit in engines:
+            if limit is not None and n > limit:
+                line.append(f"{name}: -")
+                continue
+            result = benchmark(func, n, repeat=repeat, warmup=0, name=name)
+            if expected is None:
+                expected = result.value
+            elif result.value != expected:
+                print(f"ОШИБКА: {name} дает другой результат для n = {n}")
+            line.append(f"{name}: {result.median:.4f}")
+        print(f"  n = {n:>7d} | " + " | ".join(line))
+
+
+def _balanced_tree(low: int, high: int) -> Optional[TreeNode]:
+    """Сбалансированное дерево из значений low..high."""
+    if low > high:
+        return None
+    mid = (low + high) // 2
+    node = TreeNode(mid)
+    node.left = _balanced_tree(low, mid - 1)
+    node.right = _balanced_tree(mid + 1, high)
+    return node
+
+
+def compare_stackless_overhead(deep_size: int = 10**6) -> None:
+    """
+    Накладные расходы выполнения рекурсии через stackless по сравнению
+    с обычной рекурсией и итеративными версиями, и работа на глубине deep_size.
+    """
+    print("\nРекурсия через stackless (медиана, секунды):")
+    arr = list(range(10**6))
+    cases = [
+        ('факториал n = 800', (800,), factorial_recursive, factorial_stackless, factorial_iterative),
+        ('НОД F(90), F(89)', (fibonacci_iterative(90), fibonacci_iterative(89)),
+         gcd_recursive, gcd_stackless, gcd_iterative),
+        ('бинарный поиск 10^6', (arr, 765432), binary_search_recursive, binary_search_stackless,
+         binary_search_iterative),
+        ('степень 3^1000', (3, 1000), power_recursive, power_stackless, pow),
+        ('узлы дерева 2^15', (_balanced_tree(1, 2**15 - 1),), count_nodes, count_nodes_stackless, None),
+    ]
+    for name, args, recursive, stackless_version, iterative in cases:
+        time_rec = benchmark(recursive, *args, number=20).median
+        time_stackless = benchmark(stackless_version, *args, number=20).median
+        line = (f"  {name:22s} рекурсия {time_rec:.6f} | stackless {time_stackless:.6f} "
+                f"(x{time_stackless / time_rec:.1f})")
+        if iterative is not None:
+            line += f" | итеративно {benchmark(iterative, *args, number=20).median:.6f}"
+        print(line)
+
+    # Дерево, вырожденное в цепочку: обычная рекурсия здесь невозможна
+    root = node = TreeNode(0)
+    for value in range(1, deep_size):
+        node.right = TreeNode(value)
+        node = node.right
     try:
-        time_rec, result_rec = measure_time(factorial_recursive, n)
-        print(f"Рекурсивная версия: {time_rec:.6f} секунд, результат: {result_rec}")
+        count_nodes(root)
+        print(f"  Цепочка из {deep_size} узлов: обычная рекурсия отработала")
     except RecursionError:
-        print(f"Рекурсивная версия: Превышена глубина рекурсии для n = {n}")
-        time_rec = float('inf')
-        result_rec = None
-    
-    time_iter, result_iter = measure_time(factorial_iterative, n)
-    print(f"Итеративная версия: {time_iter:.6f} секунд, результат: {result_iter}")
-    
-    if result_rec == result_iter:
-        print("Результаты совпадают")
-    else:
-        print("ОШИБКА: Результаты не совпадают!")
+        print(f"  Цепочка из {deep_size} узлов: обычная рекурсия - RecursionError")
+    result = benchmark(count_nodes_stackless, root, repeat=3, warmup=0)
+    print(f"  Цепочка из {deep_size} узлов: stackless {result.median:.3f} с, узлов: {result.value}")
+    result = benchmark(factorial_stackless, 10**5, repeat=1, warmup=0)
+    print(f"  factorial_stackless(10^5): {result.median:.3f} с")
 
 
-def compare_fibonacci(n: int) -> None:
-    """Сравнение рекурсивной и итеративной версий чисел Фибоначчи."""
-    print(f"\nСравнение чисел Фибоначчи для n = {n}:")
-    
-    if n > 35:
-        print(f"Рекурсивная версия: Пропущена (слишком медленная для n = {n})")
-        time_rec = float('inf')
-        result_rec = None
-    else:
-        time_rec, result_rec = measure_time(fibonacci_recursive, n)
-        print(f"Рекурсивная версия: {time_rec:.6f} секунд, результат: {result_rec}")
-    
-    time_iter, result_iter = measure_time(fibonacci_iterative, n)
-    print(f"Итеративная версия: {time_iter:.6f} секунд, результат: {result_iter}")
-    
-    if n <= 35 and result_rec == result_iter:
-        print("Результаты совпадают")
-    elif n > 35:
-        print("Итеративная версия работает для больших значений n")
+def compare_hanoi_generation(n: int = 22, packed_n: int = 30) -> None:
+    """Ходы Ханойских башен: список, ленивый генератор и упакованные части (ходов/с и пиковая память)."""
+    print(f"\nХанойские башни, n = {n} ({2**n - 1} ходов):")
+    variants = [
+        ('список hanoi_towers', lambda: len(hanoi_towers(n))),
+        ('генератор hanoi_moves', lambda: sum(1 for _ in hanoi_moves(n))),
+        ('части hanoi_moves_packed', lambda: sum(len(chunk) for chunk in hanoi_moves_packed(n))),
+    ]
+    for name, run in variants:
+        result = benchmark(run, repeat=3, warmup=0, name=name)
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {name:26s}: {result.value / result.median:14,.0f} ходов/с, пик памяти {peak / 2**20:8.1f} МБ")
 
+    result = benchmark(lambda: sum(len(chunk) for chunk in hanoi_moves_packed(packed_n)), repeat=1, warmup=0)
+    print(f"  hanoi_moves_packed, n = {packed_n}: {result.value} ходов за {result.median:.2f} с "
+          f"({2 * result.value / result.median / 2**20:.0f} МБ/с)")
 
-def compare_binary_search(arr_size: int, target: int) -> None:
-    """Сравнение рекурсивной и итеративной версий бинарного поиска."""
-    print(f"\nСравнение бинарного поиска (размер массива: {arr_size}, искомое: {target}):")
-    
-    arr = list(range(arr_size))
-    
-    time_rec, result_rec = measure_time(binary_search_recursive, arr, target)
-    print(f"Рекурсивная версия: {time_rec:.6f} секунд, индекс: {result_rec}")
-    
-    time_iter, result_iter = measure_time(binary_search_iterative, arr, target)
-    print(f"Итеративная версия: {time_iter:.6f} секунд, индекс: {result_iter}")
-    
-    if result_rec == result_iter:
-        print("Результаты совпадают")
-    else:
-        print("ОШИБКА: Результаты не совпадают!")
 
+def compare_power(exponent: int = 10**5, batch: int = 1000, mod: int = 10**9 + 7) -> None:
+    """Возведение в степень: power_recursive, итеративная power, встроенная pow и пакетная power_batch."""
+    print("\nВозведение в степень (медиана, секунды):")
+    variants = [
+        (f'3^{exponent}', lambda f: f(3, exponent), [('power_recursive', power_recursive), ('power', power), ('pow', pow)]),
+        (f'1.0000001^{exponent}', lambda f: f(1.0000001, exponent),
+         [('power_recursive', power_recursive), ('power', power), ('pow', pow)]),
+        (f'3^(2^256) mod p', lambda f: f(3, 2**256, mod), [('power', power), ('pow', pow)]),
+    ]
+    for label, call, funcs in variants:
+        line = [f"{name}: {benchmark(call, func, name=name).median:.6f}" for name, func in funcs]
+        print(f"  {label:20s} | " + " | ".join(line))
 
-def compare_gcd(a: int, b: int) -> None:
-    """Сравнение рекурсивной и итеративной версий НОД."""
-    print(f"\nСравнение НОД для a = {a}, b = {b}:")
-    
-    time_rec, result_rec = measure_time(gcd_recursive, a, b)
-    print(f"Рекурсивная версия: {time_rec:.6f} секунд, НОД: {result_rec}")
-    
-    time_iter, result_iter = measure_time(gcd_iterative, a, b)
-    print(f"Итеративная версия: {time_iter:.6f} секунд, НОД: {result_iter}")
-    
-    if result_rec == result_iter:
-        print("Результаты совпадают")
-    else:
-        print("ОШИБКА: Результаты не совпадают!")
+    rng = random.Random(0)
+    exponents = [rng.getrandbits(256) for _ in range(batch)]
+    fib_matrix = [[1, 1], [1, 0]]
+    cases = [
+        ('целые по модулю', 3),
+        ('матрица 2x2 по модулю', fib_matrix),
+    ]
+    for label, base in cases:
+        single = benchmark(lambda: [power(base, e, mod) for e in exponents], repeat=3, name='power')
+        batched = benchmark(power_batch, base, exponents, mod, repeat=3, name='power_batch')
+        line = f"power x{batch}: {single.median:.4f} | power_batch: {batched.median:.4f}"
+        if isinstance(base, int):
+            line += f" | pow x{batch}: {benchmark(lambda: [pow(base, e, mod) for e in exponents], repeat=3).median:.4f}"
+        print(f"  {label:20s} | {line}")
 
 
-def compare_palindrome(s: str) -> None:
-    """Сравнение рекурсивной и итеративной версий проверки палиндрома."""
-    print(f"\nСравнение проверки палиндрома для строки '{s}':")
-    
-    time_rec, result_rec = measure_time(is_palindrome_recursive, s)
-    print(f"Рекурсивная версия: {time_rec:.6f} секунд, результат: {result_rec}")
-    
-    time_iter, result_iter = measure_time(is_palindrome_iterative, s)
-    print(f"Итеративная версия: {time_iter:.6f} секунд, результат: {result_iter}")
-    
-    if result_rec == result_iter:
-        print("Результаты совпадают")
-    else:
-        print("ОШИБКА: Результаты не совпадают!")
+def compare_gcd_variants(pairs: int = 10**6, python_pairs: int = 10**5) -> None:
+    """НОД многих пар: алгоритм Евклида, бинарный алгоритм Штейна, math.gcd и np.gcd (пар/с)."""
+    print("\nНОД пар случайных чисел до 10^9:")
+    rng = random.Random(0)
+    a = [rng.randrange(1, 10**9) for _ in range(python_pairs)]
+    b = [rng.randrange(1, 10**9) for _ in range(python_pairs)]
+    variants = [
+        ('gcd_recursive', gcd_recursive),
+        ('gcd_iterative', gcd_iterative),
+        ('gcd_binary', gcd_binary),
+        ('extended_gcd', extended_gcd),
+        ('math.gcd', math.gcd),
+    ]
+    for name, func in variants:
+        result = benchmark(lambda: list(map(func, a, b)), repeat=3, name=name)
+        print(f"  {name:16s}: {python_pairs / result.median:14,.0f} пар/с")
+    result = benchmark(gcd_array, a, repeat=3)
+    print(f"  gcd_array (список {python_pairs}): {result.median:.6f} с")
+    if np is not None:
+        generator = np.random.default_rng(0)
+        a_np = generator.integers(1, 10**9, pairs)
+        b_np = generator.integers(1, 10**9, pairs)
+        result = benchmark(gcd_vectorized, a_np, b_np, repeat=3)
+        print(f"  {'gcd_vectorized':16s}: {pairs / result.median:14,.0f} пар/с ({pairs} пар)")
+        result = benchmark(gcd_array, a_np * 6, repeat=3)
+        print(f"  gcd_array (NumPy {pairs}): {result.median:.6f} с, НОД = {result.value}")
+
+
+def compare_palindrome_large(size: int = 10**7) -> None:
+    """Проверка палиндрома на больших входах: посимвольный цикл и проверка по частям (МБ/с)."""
+    half = ''.join(chr(ord('a') + i % 26) + (' ' if i % 7 == 0 else '') for i in range(size // 2))
+    text = half + half[::-1]
+    data = text.encode()
+    print(f"\nПроверка палиндрома, {len(data) / 2**20:.0f} МБ:")
+    variants = [
+        ('is_palindrome_iterative (str)', lambda: is_palindrome_iterative(text)),
+        ('is_palindrome_large (str)', lambda: is_palindrome_large(text, casefold=True, alnum_only=True)),
+        ('is_palindrome_large (bytes)', lambda: is_palindrome_large(data, casefold=True, alnum_only=True)),
+        ('is_palindrome_large (utf-8)', lambda: is_palindrome_large(data, True, True, encoding='utf-8')),
+    ]
+    for name, run in variants:
+        result = benchmark(run, repeat=3, warmup=0, name=name)
+        print(f"  {name:30s}: {result.median:.3f} с, {len(data) / result.median / 2**20:8.1f} МБ/с")
+
+    sample = 'ab' * 10**4 + text[len(text) // 2 - 4 * 10**4:len(text) // 2 + 4 * 10**4]
+    result = benchmark(longest_palindrome, sample, repeat=3, warmup=0)
+    print(f"  longest_palindrome (Манакер), n = {len(sample)}: {result.median:.3f} с, "
+          f"длина {result.value[1]}")
+
+
+def compare_tree_representations(sizes: Sequence[int] = (10**6, 10**7), node_limit: int = 10**6) -> None:
+    """
+    Дерево из объектов TreeNode против структуры массивов ArrayTree:
+    память на узел и время агрегатов (высота, количество, сумма) и обхода.
+    Деревья TreeNode строятся только до node_limit узлов (около 100 байт на узел).
+    """
+    print("\nПредставление дерева: TreeNode и ArrayTree (сбалансированное дерево):")
+    for n in sizes:
+        tracemalloc.start()
+        tree = ArrayTree.balanced(n)
+        array_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"  n = {n}: ArrayTree {array_bytes / n:.1f} байт/узел")
+
+        result = benchmark(tree.aggregates, repeat=3, warmup=0)
+        print(f"    агрегаты за один проход (array)    : {result.median:.3f} с")
+        if np is not None:
+            numpy_tree = ArrayTree(*(np.frombuffer(a, dtype=np.int64) for a in (tree.values, tree.left, tree.right)))
+            result = benchmark(lambda: (len(numpy_tree), numpy_tree.height(), numpy_tree.sum_values()),
+                               repeat=3, warmup=0)
+            print(f"    агрегаты по уровням (NumPy)        : {result.median:.3f} с")
+            result = benchmark(numpy_tree.inorder, repeat=3, warmup=0)
+            print(f"    симметричный обход (NumPy)         : {result.median:.3f} с")
+        result = benchmark(tree.inorder, repeat=3, warmup=0)
+        print(f"    симметричный обход (array)         : {result.median:.3f} с")
+
+        if n > node_limit:
+            continue
+        tracemalloc.start()
+        root = tree.to_nodes()
+        node_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"    TreeNode {node_bytes / n:.1f} байт/узел")
+        result = benchmark(lambda: (count_nodes(root), tree_height(root), sum_tree_values(root)),
+                           repeat=3, warmup=0)
+        print(f"    агрегаты тремя рекурсиями (TreeNode): {result.median:.3f} с")
+        result = benchmark(tree_traversal_inorder, root, repeat=3, warmup=0)
+        print(f"    симметричный обход (TreeNode)      : {result.median:.3f} с")
+        del root
 
 
 def analyze_fibonacci_performance() -> None:
@@ -147,10 +314,15 @@ def analyze_fibonacci_performance() -> None:
         time_iter, result = measure_time(fibonacci_iterative, n)
         print(f"  n = {n:2d}: {time_iter:.6f} секунд, результат: {result}")
     
-    print("\nРекурсивная версия (только для малых значений):")
-    for n in [10, 20, 30, 35]:
-        time_rec, result = measure_time(fibonacci_recursive, n)
-        print(f"  n = {n:2d}: {time_rec:.6f} секунд, результат: {result}")
+    print("\nРекурсивная версия (параллельно, лимит 10 с на значение):")
+    cases = [BenchmarkCase('Фибоначчи', 'рекурсивная', n, fibonacci_recursive, (n,)) for n in values]
+    for result in run_cases(cases, timeout=10.0):
+        if result.status == OK:
+            print(f"  n = {result.case.n:2d}: {result.median:.6f} секунд, результат: {result.value}")
+        elif result.status == TIMEOUT:
+            print(f"  n = {result.case.n:2d}: прервана по лимиту времени")
+        else:
+            print(f"  n = {result.case.n:2d}: {result.error}")
 
 
 def main() -> None:
@@ -159,31 +331,21 @@ def main() -> None:
     print("Анализ производительности рекурсивных и итеративных алгоритмов")
     print("="*60)
     
-    # Сравнение факториала
-    compare_factorial(10)
-    compare_factorial(100)
-    compare_factorial(500)
+    # Сравнение рекурсивных и итеративных версий: факториал, Фибоначчи,
+    # бинарный поиск, НОД и палиндромы - параллельно, одной таблицей
+    run_comparisons()
     
-    # Сравнение чисел Фибоначчи
-    compare_fibonacci(10)
-    compare_fibonacci(30)
-    compare_fibonacci(40)
+    compare_factorial_engines()
+    compare_stackless_overhead()
+    compare_hanoi_generation()
+    compare_power()
+    compare_gcd_variants()
+    compare_tree_representations()
     
     # Анализ производительности Фибоначчи
     analyze_fibonacci_performance()
     
-    # Сравнение бинарного поиска
-    compare_binary_search(1000, 500)
-    compare_binary_search(10000, 5000)
-    
-    # Сравнение НОД
-    compare_gcd(48, 18)
-    compare_gcd(1000, 250)
-    
-    # Сравнение палиндромов
-    compare_palindrome("радар")
-    compare_palindrome("привет")
-    compare_palindrome("А роза упала на лапу Азора")
+    compare_palindrome_large()
     
     print("\n" + "="*60)
     print("Анализ завершен")
@@ -3,7 +3,76 @@
 Содержит рекурсивные и итеративные версии базовых алгоритмов.
 """
 
-from typing import Any, List, Optional
+import gc
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import wraps
+from typing import Any, Callable, Generator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy нужен только для gcd_vectorized и массивов в gcd_array
+    np = None
+
+_GC_PAUSE_DEPTH = 10000
+
+
+def stackless(func: Callable[..., Generator]) -> Callable[..., Any]:
+    """
+    Декоратор для выполнения рекурсии без стека интерпретатора (трамплин).
+
+    Рекурсивная функция записывается генератором: вместо вызова самой себя
+    она выдает кортеж аргументов, result = yield (n - 1,), и получает результат
+    обратно. Незавершенные вызовы хранятся в списке в куче, поэтому глубина
+    ограничена только памятью, а не sys.getrecursionlimit().
+
+    Args:
+        func: Функция-генератор с рекурсивными вызовами через yield
+
+    Returns:
+        Обычная функция с теми же аргументами
+    """
+    @wraps(func)
+    def run(*args):
+        gen = func(*args)
+        stack = []
+        push, pop = stack.append, stack.pop
+        value = None
+        error = None
+        paused_gc = False
+        try:
+            while True:
+                try:
+                    if error is None:
+                        call_args = gen.send(value)
+                    else:
+                        pending, error = error, None
+                        call_args = gen.throw(pending)
+                except StopIteration as finished:
+                    if not stack:
+                        return finished.value
+                    value = finished.value
+                    gen = pop()
+                except Exception as exc:
+                    # Исключение передается вызывающему уровню, как при обычной рекурсии
+                    if not stack:
+                        raise
+                    error = exc
+                    gen = pop()
+                else:
+                    push(gen)
+                    gen = func(*call_args)
+                    value = None
+                    # Все генераторы на стеке живые, и сборщик мусора при глубокой
+                    # рекурсии лишь повторно их обходит - на время работы он выключается
+                    if len(stack) == _GC_PAUSE_DEPTH and gc.isenabled():
+                        gc.disable()
+                        paused_gc = True
+        finally:
+            if paused_gc:
+                gc.enable()
+
+    return run
 
 
 def factorial_recursive(n: int) -> int:
@@ -25,6 +94,21 @@ def factorial_recursive(n: int) -> int:
     return n * factorial_recursive(n - 1)
 
 
+@stackless
+def factorial_stackless(n: int):
+    """
+    Рекурсивная формулировка факториала, выполняемая через stackless.
+    Работает при n порядка 10^6 без изменения лимита рекурсии.
+
+    Сложность: O(n)
+    """
+    if n < 0:
+        raise ValueError("Факториал определен только для неотрицательных чисел")
+    if n == 0 or n == 1:
+        return 1
+    return n * (yield (n - 1,))
+
+
 def factorial_iterative(n: int) -> int:
     """
     Вычисление факториала итеративным способом.
@@ -45,6 +129,139 @@ def factorial_iterative(n: int) -> int:
     return result
 
 
+_LEAF_SIZE = 32  # Диапазон, который выгоднее перемножать простым циклом
+
+
+def _range_product(low: int, high: int) -> int:
+    """
+    Произведение low * (low + 1) * ... * high делением диапазона пополам.
+
+    Сомножители на каждом уровне дерева произведений имеют близкую длину,
+    поэтому работает умножение Карацубы, а не умножение большого числа
+    на маленькое, как в последовательном цикле.
+
+    Сложность: O(M(n log n) log n), глубина рекурсии O(log n)
+    """
+    if high - low < _LEAF_SIZE:
+        result = 1
+        for i in range(low, high + 1):
+            result *= i
+        return result
+    mid = (low + high) // 2
+    return _range_product(low, mid) * _range_product(mid + 1, high)
+
+
+def _product_tree(values: List[int]) -> int:
+    """Произведение списка попарным перемножением соседей (сбалансированное дерево)."""
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def factorial_binary_splitting(n: int, workers: Optional[int] = None) -> int:
+    """
+    Вычисление факториала деревом произведений (binary splitting).
+
+    Args:
+        n: Неотрицательное целое число
+        workers: Число процессов для произведений на листьях (None - без пула)
+
+    Returns:
+        Факториал числа n
+
+    Сложность: O(M(n log n) log n), где M(k) - стоимость умножения k-битных чисел
+    """
+    if n < 0:
+        raise ValueError("Факториал определен только для неотрицательных чисел")
+    if n < 2:
+        return 1
+    if not workers or workers < 2:
+        return _range_product(2, n)
+
+    # Диапазон делится на равные части, части считаются в процессах,
+    # а их произведения собираются деревом в основном процессе
+    parts = workers * 4
+    bounds = [2 + (n - 1) * k // parts for k in range(parts + 1)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        leaves = list(pool.map(_range_product, bounds[:-1], [b - 1 for b in bounds[1:]]))
+    return _product_tree(leaves)
+
+
+def _primes_up_to(n: int) -> List[int]:
+    """Простые числа до n включительно (решето Эратосфена на bytearray)."""
+    sieve = bytearray([1]) * (n + 1)
+    sieve[:2] = b'\x00\x00'
+    for p in range(2, int(n ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [p for p, is_prime in enumerate(sieve) if is_prime]
+
+
+def _swing(n: int, primes: List[int]) -> int:
+    """
+    Нечетная часть "качающегося факториала" n! / ((n // 2)!)^2.
+
+    Показатель простого p в нем равен числу нечетных среди n // p, n // p^2, ...;
+    для p > sqrt(n) это просто (n // p) mod 2.
+    """
+    factors = []
+    root = int(n ** 0.5)
+    for p in primes:
+        if p > n:
+            break
+        if p == 2:
+            continue
+        if p > root:
+            if (n // p) & 1:
+                factors.append(p)
+        else:
+            q, power = n, 1
+            while q:
+                q //= p
+                if q & 1:
+                    power *= p
+            if power > 1:
+                factors.append(power)
+    return _product_tree(factors)
+
+
+def factorial_prime_swing(n: int) -> int:
+    """
+    Вычисление факториала через разложение на простые (алгоритм prime swing).
+
+    Нечетная часть n! считается рекурсивно: odd(n) = odd(n // 2)^2 * swing(n),
+    где swing(n) собирается из степеней простых; степень двойки n - popcount(n)
+    добавляется в конце одним сдвигом. Сомножителей в разы меньше, чем в
+    произведении 2..n, а самое дорогое действие - возведение в квадрат.
+
+    Args:
+        n: Неотрицательное целое число
+
+    Returns:
+        Факториал числа n
+
+    Сложность: O(M(n log n) log n)
+    """
+    if n < 0:
+        raise ValueError("Факториал определен только для неотрицательных чисел")
+    if n < 2:
+        return 1
+    primes = _primes_up_to(n)
+
+    def odd_factorial(m: int) -> int:
+        if m < 2:
+            return 1
+        half = odd_factorial(m // 2)
+        return half * half * _swing(m, primes)
+
+    return odd_factorial(n) << (n - bin(n).count('1'))
+
+
 def fibonacci_recursive(n: int) -> int:
     """
     Вычисление n-го числа Фибоначчи рекурсивным способом.
@@ -122,6 +339,29 @@ def binary_search_recursive(arr: List[int], target: int, left: int = 0, right: O
         return binary_search_recursive(arr, target, mid + 1, right)
 
 
+@stackless
+def binary_search_stackless(arr: List[int], target: int, left: int = 0, right: Optional[int] = None):
+    """
+    Рекурсивный бинарный поиск, выполняемый через stackless.
+
+    Сложность: O(log n)
+    """
+    if right is None:
+        right = len(arr) - 1
+
+    if left > right:
+        return None
+
+    mid = (left + right) // 2
+
+    if arr[mid] == target:
+        return mid
+    elif arr[mid] > target:
+        return (yield (arr, target, left, mid - 1))
+    else:
+        return (yield (arr, target, mid + 1, right))
+
+
 def binary_search_iterative(arr: List[int], target: int) -> Optional[int]:
     """
     Бинарный поиск итеративным способом.
@@ -174,6 +414,188 @@ def power_recursive(base: float, exponent: int) -> float:
         return base * power_recursive(base, exponent - 1)
 
 
+@stackless
+def power_stackless(base: float, exponent: int):
+    """
+    Рекурсивное возведение в степень, выполняемое через stackless.
+
+    Сложность: O(log n)
+    """
+    if exponent == 0:
+        return 1
+    if exponent < 0:
+        return 1 / (yield (base, -exponent))
+
+    if exponent % 2 == 0:
+        half_power = yield (base, exponent // 2)
+        return half_power * half_power
+    else:
+        return base * (yield (base, exponent - 1))
+
+
+def _power_operations(base, mod: Optional[int]) -> Tuple[Callable, Callable, bool]:
+    """
+    Операции для возведения в степень: приведение по модулю, умножение и
+    признак матрицы. Поддерживаются числа, квадратные матрицы-списки и
+    двумерные массивы NumPy (для них точность ограничена dtype массива).
+    """
+    if mod is not None and mod == 0:
+        raise ValueError("Модуль не может быть равен 0")
+
+    if isinstance(base, (list, tuple)) or getattr(base, 'ndim', 0) == 2:
+        size = len(base)
+        if any(len(row) != size for row in base):
+            raise ValueError("Матрица должна быть квадратной")
+        if isinstance(base, (list, tuple)):
+            def reduce(matrix):
+                return [[x % mod for x in row] for row in matrix] if mod is not None else [list(row) for row in matrix]
+
+            def multiply(a, b):
+                columns = list(zip(*b))
+                product = [[sum(x * y for x, y in zip(row, column)) for column in columns] for row in a]
+                return reduce(product) if mod is not None else product
+        else:
+            def reduce(matrix):
+                return matrix % mod if mod is not None else matrix.copy()
+
+            def multiply(a, b):
+                return (a @ b) % mod if mod is not None else a @ b
+        return reduce, multiply, True
+
+    if mod is not None and not isinstance(base, int):
+        raise TypeError("Возведение в степень по модулю определено только для целых чисел")
+
+    def reduce(x):
+        return x % mod if mod is not None else x
+
+    def multiply(a, b):
+        return a * b % mod if mod is not None else a * b
+    return reduce, multiply, False
+
+
+def _identity_like(base, mod: Optional[int]):
+    """Единица для base: 1 или единичная матрица того же вида."""
+    if isinstance(base, (list, tuple)):
+        one = 1 % mod if mod is not None else 1
+        return [[one if i == j else 0 for j in range(len(base))] for i in range(len(base))]
+    if getattr(base, 'ndim', 0) == 2:
+        identity = base * 0
+        identity[range(len(base)), range(len(base))] = 1
+        return identity % mod if mod is not None else identity
+    return 1 % mod if mod is not None else 1
+
+
+def power(base, exponent: int, mod: Optional[int] = None):
+    """
+    Возведение в степень итеративным методом "возведение в квадрат и умножение".
+
+    Биты показателя просматриваются от младшего к старшему: на каждом шаге
+    основание возводится в квадрат, а при единичном бите умножается на результат.
+    Рекурсии нет, поэтому глубина стека не зависит от показателя.
+
+    Args:
+        base: Число (int, float) или квадратная матрица (список списков, массив NumPy)
+        exponent: Целый показатель; отрицательный - для чисел (по модулю - через обратный элемент)
+        mod: Модуль для целых чисел и целочисленных матриц
+
+    Returns:
+        base^exponent (по модулю mod, если он задан)
+
+    Сложность: O(log exponent) умножений
+    """
+    if not isinstance(exponent, int):
+        raise TypeError("Показатель степени должен быть целым числом")
+    reduce, multiply, is_matrix = _power_operations(base, mod)
+    if exponent < 0:
+        if is_matrix:
+            raise ValueError("Отрицательная степень матрицы не поддерживается")
+        if mod is None:
+            return 1 / power(base, -exponent)
+        base, exponent = pow(base, -1, mod), -exponent  # ValueError, если обратного элемента нет
+    if exponent == 0:
+        return _identity_like(base, mod)
+
+    base = reduce(base)
+    result = None
+    while True:
+        if exponent & 1:
+            result = base if result is None else multiply(result, base)
+        exponent >>= 1
+        if not exponent:
+            return result
+        base = multiply(base, base)
+
+
+def _window_size(bits: int) -> int:
+    """Ширина окна, при которой предвычисление окупается для показателя из bits бит."""
+    for width, limit in enumerate((7, 36, 140, 450, 1303, 3529), 1):
+        if bits <= limit:
+            return width
+    return 7
+
+
+def power_batch(base, exponents: Sequence[int], mod: Optional[int] = None,
+                window: Optional[int] = None) -> List:
+    """
+    Возведение одного основания в много степеней скользящим окном.
+
+    Нечетные степени base^1, base^3, ..., base^(2^window - 1) вычисляются
+    один раз и используются для всех показателей; каждый показатель
+    просматривается от старших битов окнами до window бит, и на окно
+    приходится одно умножение вместо умножения на каждый единичный бит.
+    Выигрыш заметен, когда умножение дорогое (матрицы); для целых чисел
+    встроенная pow(base, e, mod) быстрее, так как ее цикл выполняется на C.
+
+    Args:
+        base: Число или квадратная матрица (как в power)
+        exponents: Неотрицательные целые показатели
+        mod: Модуль для целых чисел и целочисленных матриц
+        window: Ширина окна (по умолчанию выбирается по длине наибольшего показателя)
+
+    Returns:
+        Список base^e для каждого e из exponents
+
+    Сложность: O(2^window + k * log E) умножений для k показателей не больше E
+    """
+    exponents = list(exponents)
+    if any(not isinstance(e, int) or e < 0 for e in exponents):
+        raise ValueError("Показатели должны быть неотрицательными целыми числами")
+    reduce, multiply, _ = _power_operations(base, mod)
+    base = reduce(base)
+    width = window or _window_size(max((e.bit_length() for e in exponents), default=0))
+
+    odd_powers = [base]
+    if width > 1:
+        square = multiply(base, base)
+        for _ in range((1 << (width - 1)) - 1):
+            odd_powers.append(multiply(odd_powers[-1], square))
+
+    results = []
+    for exponent in exponents:
+        if exponent == 0:
+            results.append(_identity_like(base, mod))
+            continue
+        bits = bin(exponent)[2:]  # Строка битов: срезы дешевле сдвигов длинного числа
+        result = None
+        i = 0
+        while i < len(bits):
+            if bits[i] == '0':
+                result = multiply(result, result)
+                i += 1
+                continue
+            # Окно не длиннее width, начинается и заканчивается единичным битом
+            digits = bits[i:i + width].rstrip('0')
+            if result is None:
+                result = odd_powers[int(digits, 2) >> 1]
+            else:
+                for _ in digits:
+                    result = multiply(result, result)
+                result = multiply(result, odd_powers[int(digits, 2) >> 1])
+            i += len(digits)
+        results.append(result)
+    return results
+
+
 def gcd_recursive(a: int, b: int) -> int:
     """
     Нахождение наибольшего общего делителя (НОД) рекурсивным способом (алгоритм Евклида).
@@ -192,6 +614,18 @@ def gcd_recursive(a: int, b: int) -> int:
     return gcd_recursive(b, a % b)
 
 
+@stackless
+def gcd_stackless(a: int, b: int):
+    """
+    Рекурсивный алгоритм Евклида, выполняемый через stackless.
+
+    Сложность: O(log min(a, b))
+    """
+    if b == 0:
+        return abs(a)
+    return (yield (b, a % b))
+
+
 def gcd_iterative(a: int, b: int) -> int:
     """
     Нахождение наибольшего общего делителя (НОД) итеративным способом.
@@ -210,3 +644,140 @@ def gcd_iterative(a: int, b: int) -> int:
         a, b = b, a % b
     return a
 
+
+def gcd_binary(a: int, b: int) -> int:
+    """
+    НОД бинарным алгоритмом Штейна: вместо деления - сдвиги и вычитания.
+
+    Общая степень двойки выносится сразу (число младших нулевых битов
+    a | b), затем из большего нечетного числа вычитается меньшее и
+    результат сдвигается до нечетного.
+
+    Args:
+        a: Первое число
+        b: Второе число
+
+    Returns:
+        НОД(a, b)
+
+    Сложность: O(log a + log b) итераций
+    """
+    a, b = abs(a), abs(b)
+    if a == 0 or b == 0:
+        return a | b
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+
+def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
+    """
+    Расширенный алгоритм Евклида (итеративный).
+
+    Args:
+        a: Первое число
+        b: Второе число
+
+    Returns:
+        Кортеж (g, x, y), где g = НОД(a, b) >= 0 и a*x + b*y = g
+
+    Сложность: O(log min(a, b))
+    """
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+    if old_r < 0:
+        return -old_r, -old_x, -old_y
+    return old_r, old_x, old_y
+
+
+def mod_inverse(a: int, m: int) -> int:
+    """
+    Обратный элемент a по модулю m через расширенный алгоритм Евклида.
+
+    Returns:
+        x из [0, m), для которого a*x = 1 (mod m)
+
+    Raises:
+        ValueError: Если НОД(a, m) != 1 или m <= 0
+
+    Сложность: O(log m)
+    """
+    if m <= 0:
+        raise ValueError("Модуль должен быть положительным")
+    g, x, _ = extended_gcd(a % m, m)
+    if g != 1:
+        raise ValueError(f"{a} не имеет обратного элемента по модулю {m}")
+    return x % m
+
+
+def gcd_array(values) -> int:
+    """
+    НОД всех элементов последовательности или массива NumPy.
+
+    Для целочисленного массива NumPy - np.gcd.reduce, иначе последовательная
+    свертка math.gcd с остановкой, как только НОД стал равен 1.
+
+    Сложность: O(n log M), M - наибольший элемент
+    """
+    if np is not None and isinstance(values, np.ndarray) and values.dtype.kind in 'iu':
+        return int(np.gcd.reduce(values, axis=None)) if values.size else 0
+    result = 0
+    for value in values:
+        result = math.gcd(result, value)
+        if result == 1:
+            break
+    return result
+
+
+def lcm_array(values) -> int:
+    """
+    НОК всех элементов (точное, в целых числах Python: НОК быстро выходит за int64).
+
+    Сложность: O(n log M) операций с длинными числами
+    """
+    result = 1
+    for value in (values.tolist() if np is not None and isinstance(values, np.ndarray) else values):
+        if value == 0:
+            return 0
+        result = result // math.gcd(result, value) * abs(value)
+    return result
+
+
+def gcd_vectorized(a, b):
+    """
+    Поэлементный НОД для миллионов пар.
+
+    Для целых чисел в пределах int64 используется универсальная функция
+    np.gcd (цикл на C, без объектов Python на каждую пару); массивы с
+    dtype=object (длинные целые) обрабатываются math.gcd поэлементно.
+
+    Args:
+        a: Массив или последовательность целых чисел
+        b: Массив, последовательность или число (с трансляцией размеров)
+
+    Returns:
+        Массив NumPy НОД пар
+
+    Сложность: O(n log M)
+    """
+    if np is None:
+        raise ImportError("Для gcd_vectorized нужен NumPy")
+    a, b = np.asarray(a), np.asarray(b)
+    if a.dtype == object or b.dtype == object:
+        return np.frompyfunc(math.gcd, 2, 1)(a, b)
+    if a.dtype.kind not in 'iu' or b.dtype.kind not in 'iu':
+        raise TypeError("НОД определен только для целых чисел")
+    if np.result_type(a, b).kind not in 'iu':  # uint64 и знаковые: общего целого типа нет
+        raise TypeError("Для uint64 и знаковых целых приведите массивы к одному типу")
+    return np.gcd(a, b)
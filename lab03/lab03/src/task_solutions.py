@@ -2,7 +2,13 @@
 Модуль с решением практических задач с использованием рекурсии.
 """
 
-from typing import List, Optional
+import mmap
+import re
+import sys
+from array import array
+from typing import Iterator, List, Optional, Tuple, Union
+
+from src.recursive_algorithms import stackless
 
 
 def hanoi_towers(n: int, source: str = "A", destination: str = "C", auxiliary: str = "B") -> List[tuple]:
@@ -36,6 +42,147 @@ def hanoi_towers(n: int, source: str = "A", destination: str = "C", auxiliary: s
     return moves
 
 
+def _disk_cycle(n: int, disk: int, source, destination, auxiliary) -> tuple:
+    """
+    Порядок стержней, по которому ходит диск в решении для n дисков.
+    Каждый диск движется по кругу в одну сторону, направление зависит от четности n - disk.
+    """
+    if (n - disk) % 2 == 0:
+        return source, destination, auxiliary
+    return source, auxiliary, destination
+
+
+def hanoi_moves(n: int, source: str = "A", destination: str = "C", auxiliary: str = "B") -> Iterator[tuple]:
+    """
+    Ленивый генератор ходов Ханойских башен в том же порядке, что hanoi_towers.
+
+    Ход с номером m (с единицы) делает диск, равный числу младших нулевых
+    битов m плюс один, поэтому хранить нужно только положение каждого диска.
+
+    Args:
+        n: Количество дисков
+        source: Исходный стержень
+        destination: Целевой стержень
+        auxiliary: Вспомогательный стержень
+
+    Yields:
+        Ходы в формате (диск, откуда, куда)
+
+    Сложность: O(1) на ход, память O(n)
+    """
+    # Для каждого диска три возможных хода по его циклу, кортежи создаются один раз
+    disk_moves: List[List[tuple]] = [[]]
+    for disk in range(1, n + 1):
+        cycle = _disk_cycle(n, disk, source, destination, auxiliary)
+        disk_moves.append([(disk, cycle[i], cycle[(i + 1) % 3]) for i in range(3)])
+    positions = [0] * (n + 1)  # Номер стержня диска в его цикле
+    for m in range(1, 1 << n):
+        disk = (m & -m).bit_length()
+        p = positions[disk]
+        positions[disk] = p + 1 if p < 2 else 0
+        yield disk_moves[disk][p]
+
+
+def move_at(n: int, k: int, source: str = "A", destination: str = "C", auxiliary: str = "B") -> tuple:
+    """
+    k-й ход (с нуля) решения для n дисков без генерации предыдущих ходов.
+
+    Args:
+        n: Количество дисков
+        k: Номер хода, 0 <= k < 2^n - 1
+
+    Returns:
+        Ход в формате (диск, откуда, куда), равный hanoi_towers(n)[k]
+
+    Raises:
+        IndexError: Если номер хода вне диапазона
+
+    Сложность: O(n) битовых операций
+    """
+    if not 0 <= k < (1 << n) - 1:
+        raise IndexError("Номер хода вне диапазона")
+    m = k + 1
+    disk = (m & -m).bit_length()
+    moved = (m >> disk) % 3  # Сколько раз диск уже ходил, по модулю длины цикла
+    cycle = _disk_cycle(n, disk, source, destination, auxiliary)
+    return disk, cycle[moved], cycle[(moved + 1) % 3]
+
+
+def _peg_relabel_table(source: int, auxiliary: int, destination: int) -> bytes:
+    """Таблица для bytes.translate: перестановка стержней 0, 1, 2 в кодах (откуда << 2 | куда)."""
+    pegs = (source, auxiliary, destination)
+    table = bytearray(range(256))
+    for from_peg in range(3):
+        for to_peg in range(3):
+            table[from_peg << 2 | to_peg] = pegs[from_peg] << 2 | pegs[to_peg]
+    return bytes(table)
+
+
+def hanoi_moves_packed(n: int, chunk_size: int = 1 << 20) -> Iterator[array]:
+    """
+    Ходы Ханойских башен частями в компактном массиве array('H').
+
+    Каждый ход - одно 16-битное число: диск << 8 | откуда << 2 | куда,
+    стержни 0 - исходный, 1 - вспомогательный, 2 - целевой. Блок из
+    2^b ходов, выровненный по 2^b, - это перенос башни из b верхних дисков
+    (шаблон, построенный один раз) и один ход большего диска; шаблон
+    переставляется под нужные стержни через bytes.translate на стороне C.
+
+    Args:
+        n: Количество дисков (не больше 255)
+        chunk_size: Ходов в одной части, степень двойки
+
+    Yields:
+        array('H') с очередными ходами; вместе 2^n - 1 ходов
+
+    Сложность: O(2^n) в сумме, память O(chunk_size)
+    """
+    if chunk_size < 1 or chunk_size & (chunk_size - 1):
+        raise ValueError("Размер части должен быть степенью двойки")
+    if not 0 <= n <= 255:
+        raise ValueError("Поддерживается от 0 до 255 дисков")
+    if n == 0:
+        return
+    b = min(chunk_size.bit_length() - 1, n)
+
+    # Шаблон: перенос b дисков со стержня 0 на 2 через 1, отдельно диски и коды стержней
+    template_disks, template_pegs = b'', b''
+    first_half = _peg_relabel_table(0, 2, 1)   # Перенос k - 1 дисков 0 -> 1
+    second_half = _peg_relabel_table(1, 0, 2)  # Перенос k - 1 дисков 1 -> 2
+    for k in range(1, b + 1):
+        template_pegs = template_pegs.translate(first_half) + bytes([0 << 2 | 2]) + template_pegs.translate(second_half)
+        template_disks = template_disks + bytes([k]) + template_disks
+
+    # Башня из b дисков ходит как диск b: по кругу, по одному разу за блок
+    tower_cycle = _disk_cycle(n, b, 0, 2, 1) if b > 0 else None
+    total = (1 << n) - 1
+    for j in range(-(-total >> b)):
+        if b > 0:
+            from_peg, to_peg = tower_cycle[j % 3], tower_cycle[(j + 1) % 3]
+            table = _peg_relabel_table(from_peg, 3 - from_peg - to_peg, to_peg)
+            disks, pegs = template_disks, template_pegs.translate(table)
+        else:
+            disks, pegs = b'', b''
+        if (j + 1) << b <= total:
+            disk, from_peg, to_peg = move_at(n, ((j + 1) << b) - 1, 0, 2, 1)
+            disks += bytes([disk])
+            pegs += bytes([from_peg << 2 | to_peg])
+
+        packed = bytearray(2 * len(disks))
+        packed[0::2] = pegs
+        packed[1::2] = disks
+        chunk = array('H')
+        chunk.frombytes(packed)
+        if sys.byteorder == 'big':
+            chunk.byteswap()
+        yield chunk
+
+
+def unpack_hanoi_move(code: int, pegs: Tuple[str, str, str] = ("A", "B", "C")) -> tuple:
+    """Распаковка хода из hanoi_moves_packed: pegs - (исходный, вспомогательный, целевой)."""
+    return code >> 8, pegs[(code >> 2) & 3], pegs[code & 3]
+
+
 def is_palindrome_recursive(s: str, left: int = 0, right: Optional[int] = None) -> bool:
     """
     Проверка, является ли строка палиндромом (рекурсивно).
@@ -86,6 +233,150 @@ def is_palindrome_iterative(s: str) -> bool:
     return True
 
 
+_NON_ALNUM = re.compile(r'[\W_]+')
+_NON_ALNUM_BYTES = bytes(b for b in range(256) if not bytes([b]).isalnum())
+
+
+def _normalize_chunk(chunk, casefold: bool, alnum_only: bool, encoding: Optional[str]):
+    """Приведение части текста: декодирование, удаление небуквенно-цифровых символов, casefold."""
+    if encoding is not None:
+        chunk = bytes(chunk)
+        # ASCII-часть обрабатывается как байты: translate быстрее регулярного выражения
+        if alnum_only and chunk.isascii():
+            return _normalize_chunk(chunk, casefold, alnum_only, None).decode('ascii')
+        chunk = chunk.decode(encoding)
+    if isinstance(chunk, str):
+        if alnum_only:
+            if chunk.isascii():
+                chunk = chunk.encode('ascii').translate(None, _NON_ALNUM_BYTES).decode('ascii')
+            else:
+                chunk = _NON_ALNUM.sub('', chunk)
+        return chunk.casefold() if casefold else chunk
+    if alnum_only:
+        chunk = bytes(chunk).translate(None, _NON_ALNUM_BYTES)
+    return bytes(chunk).lower() if casefold else bytes(chunk)
+
+
+def is_palindrome_large(data: Union[str, bytes, bytearray, memoryview, mmap.mmap], casefold: bool = False,
+                        alnum_only: bool = False, encoding: Optional[str] = None,
+                        chunk_size: int = 1 << 16) -> bool:
+    """
+    Проверка палиндрома для больших данных без копирования целиком.
+
+    Данные читаются частями одновременно с начала и с конца; каждая часть
+    приводится (casefold, удаление небуквенно-цифровых символов) на стороне C,
+    часть с конца разворачивается, и части сравниваются. Когда чтения
+    встречаются, становится известна длина приведенного текста, и проверка
+    останавливается после сравнения его половины.
+
+    Args:
+        data: Строка, байты или mmap
+        casefold: Сравнение без учета регистра (для bytes - только ASCII)
+        alnum_only: Учитывать только буквы и цифры
+        encoding: Кодировка для байтовых данных (поддерживается 'utf-8'), None - сравнение байтов
+        chunk_size: Размер части
+
+    Returns:
+        True, если приведенный текст является палиндромом
+
+    Сложность: O(n), дополнительная память O(chunk_size)
+    """
+    if encoding is not None and encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+        raise ValueError("Для байтовых данных поддерживается только кодировка utf-8")
+    utf8 = encoding is not None and not isinstance(data, str)
+    n = len(data)
+
+    def boundary(position: int) -> int:
+        # Граница части не должна разрезать многобайтовый символ UTF-8
+        while utf8 and 0 < position < n and data[position] & 0xC0 == 0x80:
+            position -= 1
+        return position
+
+    def normalize(start: int, end: int):
+        return _normalize_chunk(data[start:end], casefold, alnum_only, encoding if utf8 else None)
+
+    front_pos, back_pos = 0, n
+    front, back = normalize(0, 0), normalize(0, 0)
+    front_count = back_count = 0  # Сколько приведенных символов выдало каждое чтение
+    compared = 0
+    half = None
+    while half is None or compared < half:
+        if not front and front_pos < n:
+            end = boundary(min(front_pos + chunk_size, n))
+            if end == front_pos:  # Часть меньше одного символа UTF-8: берем символ целиком
+                end += 1
+                while end < n and data[end] & 0xC0 == 0x80:
+                    end += 1
+            front = normalize(front_pos, end)
+            front_pos = end
+            front_count += len(front)
+        if not back and back_pos > 0:
+            start = boundary(max(back_pos - chunk_size, 0))
+            back = normalize(start, back_pos)[::-1]
+            back_pos = start
+            back_count += len(back)
+        if half is None and front_pos >= back_pos:
+            # Чтения пересеклись: длина текста = прочитано с двух сторон минус общий участок
+            total = front_count + back_count - len(normalize(back_pos, front_pos))
+            half = total // 2
+        if not front or not back:
+            if front_pos >= n and back_pos <= 0:
+                return True
+            continue
+        m = min(len(front), len(back))
+        if front[:m] != back[:m]:
+            return False
+        front, back = front[m:], back[m:]
+        compared += m
+    return True
+
+
+def is_palindrome_file(path: str, casefold: bool = False, alnum_only: bool = False,
+                       encoding: Optional[str] = None, chunk_size: int = 1 << 20) -> bool:
+    """Проверка палиндрома для файла через mmap (см. is_palindrome_large). Сложность: O(n)"""
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return True
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return is_palindrome_large(data, casefold, alnum_only, encoding, chunk_size)
+
+
+def longest_palindrome(s: Union[str, bytes]) -> Tuple[int, int]:
+    """
+    Самая длинная подстрока-палиндром (алгоритм Манакера).
+
+    Работает с виртуальной строкой длины 2n + 1, где между символами стоят
+    разделители, поэтому палиндромы четной и нечетной длины обрабатываются
+    одинаково; сама строка с разделителями не строится.
+
+    Args:
+        s: Строка или байты
+
+    Returns:
+        Кортеж (начало, длина) самого длинного палиндрома
+
+    Сложность: O(n)
+    """
+    m = 2 * len(s) + 1
+    radius = [0] * m  # radius[i] - длина палиндрома с центром i в исходной строке
+    center = right = 0
+    best = 0
+    for i in range(m):
+        r = min(right - i, radius[2 * center - i]) if i < right else 0
+        a, b = i - r - 1, i + r + 1
+        # У зеркальных позиций одинаковая четность: четные - разделители, нечетные - символы
+        while a >= 0 and b < m and (a % 2 == 0 or s[a // 2] == s[b // 2]):
+            a -= 1
+            b += 1
+            r += 1
+        radius[i] = r
+        if i + r > right:
+            center, right = i, i + r
+        if r > radius[best]:
+            best = i
+    return (best - radius[best]) // 2, radius[best]
+
+
 class TreeNode:
     """Узел бинарного дерева."""
     
@@ -177,10 +468,14 @@ def tree_height(root: Optional[TreeNode]) -> int:
     Returns:
         Высота дерева (0 для пустого дерева)
         
-    Сложность: O(n)
+    Сложность: O(n), O(1) для узлов с кэшем агрегатов
     """
     if root is None:
         return 0
+    # Узлы с кэшем агрегатов (AugmentedTreeNode из lab06) хранят ответ
+    cached = getattr(root, 'height', None)
+    if cached is not None:
+        return cached
     
     left_height = tree_height(root.left)
     right_height = tree_height(root.right)
@@ -198,10 +493,13 @@ def count_nodes(root: Optional[TreeNode]) -> int:
     Returns:
         Количество узлов
         
-    Сложность: O(n)
+    Сложность: O(n), O(1) для узлов с кэшем агрегатов
     """
     if root is None:
         return 0
+    cached = getattr(root, 'size', None)
+    if cached is not None:
+        return cached
     
     return 1 + count_nodes(root.left) + count_nodes(root.right)
 
@@ -216,10 +514,81 @@ def sum_tree_values(root: Optional[TreeNode]) -> int:
     Returns:
         Сумма всех значений
         
-    Сложность: O(n)
+    Сложность: O(n), O(1) для узлов с кэшем агрегатов
     """
     if root is None:
         return 0
+    cached = getattr(root, 'total', None)
+    if cached is not None:
+        return cached
     
     return root.value + sum_tree_values(root.left) + sum_tree_values(root.right)
 
+
+@stackless
+def _traverse_stackless(node: TreeNode, result: List[int], order: int):
+    # Пустые поддеревья не вызываются: каждый вызов через stackless - новый генератор
+    if order == 0:
+        result.append(node.value)
+    if node.left is not None:
+        yield (node.left, result, order)
+    if order == 1:
+        result.append(node.value)
+    if node.right is not None:
+        yield (node.right, result, order)
+    if order == 2:
+        result.append(node.value)
+
+
+def tree_traversal_stackless(root: Optional[TreeNode], order: str = 'inorder') -> List[int]:
+    """
+    Обход дерева в рекурсивной формулировке через stackless, для деревьев
+    любой глубины (например, вырожденных в цепочку из 10^6 узлов).
+
+    Args:
+        root: Корень дерева
+        order: 'preorder', 'inorder' или 'postorder'
+
+    Returns:
+        Список значений узлов в порядке обхода
+
+    Сложность: O(n)
+    """
+    kind = ('preorder', 'inorder', 'postorder').index(order)
+    result: List[int] = []
+    if root is not None:
+        _traverse_stackless(root, result, kind)
+    return result
+
+
+@stackless
+def _height_stackless(node: TreeNode):
+    left_height = (yield (node.left,)) if node.left is not None else 0
+    right_height = (yield (node.right,)) if node.right is not None else 0
+    return 1 + max(left_height, right_height)
+
+
+@stackless
+def _sum_stackless(node: TreeNode, weight):
+    # weight(node) - вклад узла: 1 для подсчета узлов, значение для суммы
+    total = weight(node)
+    if node.left is not None:
+        total += yield (node.left, weight)
+    if node.right is not None:
+        total += yield (node.right, weight)
+    return total
+
+
+def tree_height_stackless(root: Optional[TreeNode]) -> int:
+    """Высота дерева через stackless. Сложность: O(n)"""
+    return _height_stackless(root) if root is not None else 0
+
+
+def count_nodes_stackless(root: Optional[TreeNode]) -> int:
+    """Количество узлов через stackless. Сложность: O(n)"""
+    return _sum_stackless(root, lambda node: 1) if root is not None else 0
+
+
+def sum_tree_values_stackless(root: Optional[TreeNode]) -> int:
+    """Сумма значений через stackless. Сложность: O(n)"""
+    return _sum_stackless(root, lambda node: node.value) if root is not None else 0
@@ -0,0 +1,43 @@
+"""
+Тесты для вычисления факториала
+"""
+import math
+
+import pytest
+
+from src.recursive_algorithms import (
+    factorial_recursive,
+    factorial_iterative,
+    factorial_binary_splitting,
+    factorial_prime_swing,
+)
+
+ENGINES = [factorial_iterative, factorial_binary_splitting, factorial_prime_swing]
+
+
+@pytest.mark.parametrize('factorial', ENGINES + [factorial_recursive], ids=lambda f: f.__name__)
+def test_small_values(factorial):
+    """Тест малых n, включая границы листа дерева произведений"""
+    for n in list(range(0, 70)) + [100, 127, 128, 129, 500]:
+        assert factorial(n) == math.factorial(n), n
+
+
+@pytest.mark.parametrize('factorial', ENGINES, ids=lambda f: f.__name__)
+def test_large_values(factorial):
+    """Тест больших n, в том числе степеней двойки и простых"""
+    for n in (1024, 4093, 20000):
+        assert factorial(n) == math.factorial(n), n
+
+
+@pytest.mark.parametrize('factorial', ENGINES + [factorial_recursive], ids=lambda f: f.__name__)
+def test_negative(factorial):
+    """Тест отрицательного аргумента"""
+    with pytest.raises(ValueError):
+        factorial(-1)
+
+
+def test_binary_splitting_workers():
+    """Тест дерева произведений с пулом процессов"""
+    for n in (2, 3, 50, 5000):
+        assert factorial_binary_splitting(n, workers=2) == math.factorial(n)
+    assert factorial_binary_splitting(1, workers=2) == 1
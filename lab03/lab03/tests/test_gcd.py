@@ -0,0 +1,125 @@
+"""
+Тесты для НОД, расширенного алгоритма Евклида и НОК
+"""
+import math
+import random
+from functools import reduce
+
+import pytest
+
+from src.recursive_algorithms import (
+    gcd_recursive,
+    gcd_iterative,
+    gcd_stackless,
+    gcd_binary,
+    extended_gcd,
+    mod_inverse,
+    gcd_array,
+    lcm_array,
+    gcd_vectorized,
+)
+
+GCDS = [gcd_recursive, gcd_iterative, gcd_stackless, gcd_binary]
+
+
+def pairs(seed, count=500):
+    rng = random.Random(seed)
+    result = [(0, 0), (0, 5), (5, 0), (1, 1), (-12, 18), (12, -18), (-7, -21), (2**64, 2**32 * 3)]
+    for _ in range(count):
+        bits = rng.choice([8, 64, 200])
+        common = rng.randrange(1, 1 << 16)
+        result.append((rng.randrange(-(1 << bits), 1 << bits) * common,
+                       rng.randrange(-(1 << bits), 1 << bits) * common))
+    return result
+
+
+@pytest.mark.parametrize('gcd', GCDS, ids=lambda f: f.__name__)
+def test_gcd(gcd):
+    """Тест всех вариантов НОД против math.gcd, включая нули и отрицательные"""
+    for a, b in pairs(1):
+        assert gcd(a, b) == math.gcd(a, b), (a, b)
+
+
+def test_extended_gcd():
+    """Тест коэффициентов Безу"""
+    for a, b in pairs(2):
+        g, x, y = extended_gcd(a, b)
+        assert g == math.gcd(a, b), (a, b)
+        assert a * x + b * y == g, (a, b)
+
+
+def test_mod_inverse():
+    """Тест обратного элемента по модулю"""
+    for m in (1, 2, 7, 10**9 + 7, 2**61 - 1, 360):
+        for a in (1, 3, 7, -5, 10**20 + 1, 2**61 - 2):
+            if math.gcd(a, m) != 1:
+                continue
+            x = mod_inverse(a, m)
+            assert 0 <= x < m
+            assert a * x % m == 1 % m
+            assert x == pow(a, -1, m)
+
+
+def test_mod_inverse_errors():
+    """Тест необратимых элементов и неположительного модуля"""
+    for a, m in ((2, 4), (0, 7), (6, 360), (3, 0), (3, -7)):
+        with pytest.raises(ValueError):
+            mod_inverse(a, m)
+
+
+def test_gcd_array_and_lcm():
+    """Тест НОД и НОК последовательностей"""
+    rng = random.Random(3)
+    for _ in range(200):
+        values = [rng.randrange(-1000, 1000) * rng.choice([1, 6, 30]) for _ in range(rng.randrange(0, 8))]
+        assert gcd_array(values) == reduce(math.gcd, values, 0)
+        assert gcd_array(iter(values)) == reduce(math.gcd, values, 0)
+        assert lcm_array(values) == reduce(lambda x, y: abs(x * y) // math.gcd(x, y) if x and y else 0,
+                                           values, 1)
+    assert lcm_array(range(1, 60)) == math.lcm(*range(1, 60))  # больше int64
+
+
+def test_numpy_arrays():
+    """Тест массивов NumPy в gcd_array и lcm_array"""
+    np = pytest.importorskip('numpy')
+    values = np.array([-48, 180, 0, 36], dtype=np.int64)
+    assert gcd_array(values) == 12
+    assert gcd_array(values.reshape(2, 2)) == 12
+    assert gcd_array(np.array([], dtype=np.int64)) == 0
+    assert gcd_array(np.array([2**63 + 2, 6], dtype=np.uint64)) == 2
+    assert lcm_array(np.arange(1, 60, dtype=np.int64)) == math.lcm(*range(1, 60))
+
+
+def test_gcd_vectorized():
+    """Тест поэлементного НОД с трансляцией размеров"""
+    np = pytest.importorskip('numpy')
+    rng = random.Random(4)
+    a = [rng.randrange(-10**12, 10**12) * 6 for _ in range(1000)]
+    b = [rng.randrange(-10**12, 10**12) * 4 for _ in range(1000)]
+    assert gcd_vectorized(a, b).tolist() == [math.gcd(x, y) for x, y in zip(a, b)]
+    assert gcd_vectorized(np.array(a, dtype=np.int64), 10).tolist() == [math.gcd(x, 10) for x in a]
+    column = np.array([[4], [9]], dtype=np.int32)
+    assert gcd_vectorized(column, np.array([6, 12, 27], dtype=np.int16)).tolist() == [[2, 4, 1], [3, 3, 9]]
+    unsigned = np.array([2**64 - 2, 2**63], dtype=np.uint64)
+    assert gcd_vectorized(unsigned, np.array([6, 2**62], dtype=np.uint64)).tolist() == \
+        [math.gcd(2**64 - 2, 6), 2**62]
+
+
+def test_gcd_vectorized_object():
+    """Тест длинных целых через dtype=object"""
+    np = pytest.importorskip('numpy')
+    a = np.array([2**100 * 3, 2**70, 17], dtype=object)
+    b = np.array([2**90 * 9, 2**80 * 5, 2**65], dtype=object)
+    assert list(gcd_vectorized(a, b)) == [2**90 * 3, 2**70, 1]
+    assert list(gcd_vectorized([2**100, 6], [2**64 * 6, 4])) == [2**65, 2]
+
+
+def test_gcd_vectorized_type_errors():
+    """Тест нецелых массивов и смеси uint64 со знаковыми"""
+    np = pytest.importorskip('numpy')
+    with pytest.raises(TypeError):
+        gcd_vectorized(np.array([1.0, 2.0]), np.array([3, 4]))
+    with pytest.raises(TypeError):
+        gcd_vectorized(np.array([2**63 + 6], dtype=np.uint64), np.array([-4], dtype=np.int64))
+    with pytest.raises(TypeError):
+        gcd_vectorized(np.array([6], dtype=np.int8), np.array([2**64 - 1], dtype=np.uint64))
@@ -0,0 +1,85 @@
+"""
+Тесты для Ханойских башен
+"""
+from itertools import chain
+
+import pytest
+
+from src.task_solutions import (
+    hanoi_towers,
+    hanoi_moves,
+    move_at,
+    hanoi_moves_packed,
+    unpack_hanoi_move,
+)
+
+
+def check_solution(n, moves, source="A", destination="C", auxiliary="B"):
+    """Проверка, что ходы допустимы и переносят всю башню на целевой стержень"""
+    pegs = {source: list(range(n, 0, -1)), destination: [], auxiliary: []}
+    for disk, from_peg, to_peg in moves:
+        assert pegs[from_peg] and pegs[from_peg][-1] == disk
+        assert not pegs[to_peg] or pegs[to_peg][-1] > disk
+        pegs[to_peg].append(pegs[from_peg].pop())
+    assert pegs[destination] == list(range(n, 0, -1))
+
+
+@pytest.mark.parametrize('n', range(0, 11))
+def test_hanoi_moves_matches_towers(n):
+    """Тест генератора ходов: тот же порядок, что у рекурсивного решения"""
+    expected = hanoi_towers(n)
+    assert len(expected) == 2 ** n - 1
+    check_solution(n, expected)
+    assert list(hanoi_moves(n)) == expected
+    assert list(hanoi_moves(n, "X", "Z", "Y")) == hanoi_towers(n, "X", "Z", "Y")
+
+
+@pytest.mark.parametrize('n', range(1, 11))
+def test_move_at(n):
+    """Тест k-го хода для каждого k"""
+    expected = hanoi_towers(n, "L", "R", "M")
+    assert [move_at(n, k, "L", "R", "M") for k in range(len(expected))] == expected
+
+
+def test_move_at_large():
+    """Тест k-го хода при большом n без построения решения"""
+    n = 200
+    assert move_at(n, 0) == (1, "A", "B")
+    assert move_at(n, 2 ** (n - 1) - 1) == (n, "A", "C")
+    assert move_at(n, 2 ** n - 2) == (1, "B", "C")
+
+
+def test_move_at_range():
+    """Тест номеров хода вне диапазона"""
+    for n, k in ((3, -1), (3, 7), (0, 0)):
+        with pytest.raises(IndexError):
+            move_at(n, k)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 4, 8, 1 << 20])
+def test_packed_matches_towers(chunk_size):
+    """Тест упакованных ходов при разных размерах частей"""
+    for n in range(0, 12):
+        chunks = list(hanoi_moves_packed(n, chunk_size))
+        assert all(len(chunk) <= chunk_size for chunk in chunks)
+        moves = [unpack_hanoi_move(code, ("A", "B", "C")) for code in chain.from_iterable(chunks)]
+        assert moves == hanoi_towers(n), n
+
+
+def test_packed_large():
+    """Тест упакованных ходов для n, при котором список ходов не строится"""
+    n = 18
+    packed = chain.from_iterable(hanoi_moves_packed(n, 1 << 10))
+    count = 0
+    for code, move in zip(packed, hanoi_moves(n)):
+        assert unpack_hanoi_move(code) == move
+        count += 1
+    assert count == 2 ** n - 1
+    assert next(packed, None) is None
+
+
+def test_packed_errors():
+    """Тест недопустимых параметров упакованного генератора"""
+    for n, chunk_size in ((3, 0), (3, 3), (256, 4), (-1, 4)):
+        with pytest.raises(ValueError):
+            list(hanoi_moves_packed(n, chunk_size))
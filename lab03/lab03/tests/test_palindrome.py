@@ -0,0 +1,142 @@
+"""
+Тесты для проверки палиндромов на больших данных и поиска самого длинного палиндрома
+"""
+import random
+
+import pytest
+
+from src.task_solutions import is_palindrome_large, is_palindrome_file, longest_palindrome
+
+ALPHABET = 'aAbBß1 ._,éÉяЯ😀'
+CHUNK_SIZES = [1, 2, 3, 7, 64, 1 << 16]
+
+
+def normalize(text, casefold, alnum_only):
+    """Приведение всего текста сразу - эталон для проверки по частям"""
+    if isinstance(text, str):
+        if alnum_only:
+            text = ''.join(c for c in text if c.isalnum())
+        return text.casefold() if casefold else text
+    if alnum_only:
+        text = bytes(b for b in text if bytes([b]).isalnum())
+    return text.lower() if casefold else text
+
+
+def reference(text, casefold, alnum_only):
+    text = normalize(text, casefold, alnum_only)
+    return text == text[::-1]
+
+
+def samples(seed, count=150):
+    """Случайные строки: почти палиндромы с шумом регистра и знаков, и произвольные"""
+    rng = random.Random(seed)
+    result = ['', 'a', 'ab', 'aA', 'ß', 'SSß', '.', 'a.,a', 'Aé_éa']
+    for _ in range(count):
+        half = ''.join(rng.choice(ALPHABET) for _ in range(rng.randrange(0, 12)))
+        middle = rng.choice(['', rng.choice(ALPHABET)])
+        text = half + middle + half[::-1]
+        if rng.random() < 0.5:
+            text = ''.join(c.swapcase() if rng.random() < 0.3 else c for c in text)
+        if rng.random() < 0.5:
+            pos = rng.randrange(len(text) + 1)
+            text = text[:pos] + rng.choice(' .,_') + text[pos:]
+        if rng.random() < 0.2:
+            text = ''.join(rng.choice(ALPHABET) for _ in range(rng.randrange(1, 8)))
+        result.append(text)
+    return result
+
+
+@pytest.mark.parametrize('casefold', [False, True])
+@pytest.mark.parametrize('alnum_only', [False, True])
+def test_large_str(casefold, alnum_only):
+    """Тест строк при разных размерах частей"""
+    for text in samples(1):
+        expected = reference(text, casefold, alnum_only)
+        for chunk_size in CHUNK_SIZES:
+            assert is_palindrome_large(text, casefold, alnum_only, chunk_size=chunk_size) == expected, \
+                (text, chunk_size)
+
+
+@pytest.mark.parametrize('casefold', [False, True])
+@pytest.mark.parametrize('alnum_only', [False, True])
+def test_large_utf8(casefold, alnum_only):
+    """Тест байтов UTF-8: части не разрезают многобайтовые символы"""
+    for text in samples(2):
+        data = text.encode('utf-8')
+        expected = reference(text, casefold, alnum_only)
+        for chunk_size in CHUNK_SIZES:
+            for wrapped in (data, bytearray(data), memoryview(data)):
+                assert is_palindrome_large(wrapped, casefold, alnum_only, 'utf-8', chunk_size) == expected, \
+                    (text, chunk_size)
+
+
+@pytest.mark.parametrize('casefold', [False, True])
+@pytest.mark.parametrize('alnum_only', [False, True])
+def test_large_bytes(casefold, alnum_only):
+    """Тест сравнения байтов без кодировки"""
+    for text in samples(3):
+        data = text.encode('utf-8')
+        expected = reference(data, casefold, alnum_only)
+        for chunk_size in CHUNK_SIZES:
+            assert is_palindrome_large(data, casefold, alnum_only, chunk_size=chunk_size) == expected, \
+                (text, chunk_size)
+
+
+def test_large_long_input():
+    """Тест длинного палиндрома и ошибки в его середине"""
+    rng = random.Random(4)
+    half = ''.join(rng.choice('abcXYZ ,') for _ in range(50000))
+    text = half + 'q' + half[::-1]
+    assert is_palindrome_large(text, chunk_size=1000)
+    # Отличие в одном символе рядом с серединой, далеко от границ частей
+    broken = text[:49990] + '#' + text[49991:]
+    assert not is_palindrome_large(broken, chunk_size=1000)
+    assert is_palindrome_large(broken, alnum_only=True, chunk_size=1000) == reference(broken, False, True)
+
+
+def test_large_encoding_error():
+    """Тест неподдерживаемой кодировки"""
+    with pytest.raises(ValueError):
+        is_palindrome_large(b'aba', encoding='cp1251')
+    assert is_palindrome_large(b'aba', encoding='UTF_8')
+
+
+def test_palindrome_file(tmp_path):
+    """Тест проверки файла через mmap"""
+    cases = {'empty': '', 'yes': 'А роза упала на лапу Азора', 'no': 'А роза упала на лапу Азорa!'}
+    for name, text in cases.items():
+        path = tmp_path / name
+        path.write_bytes(text.encode('utf-8'))
+        expected = reference(text, True, True)
+        assert is_palindrome_file(str(path), True, True, 'utf-8', chunk_size=4) == expected, name
+    assert is_palindrome_file(str(tmp_path / 'yes'), True, True, 'utf-8')
+    assert not is_palindrome_file(str(tmp_path / 'yes'))
+
+
+def longest_brute_force(s):
+    for length in range(len(s), 0, -1):
+        for start in range(len(s) - length + 1):
+            part = s[start:start + length]
+            if part == part[::-1]:
+                return length
+    return 0
+
+
+def test_longest_palindrome():
+    """Тест алгоритма Манакера против перебора"""
+    rng = random.Random(5)
+    strings = ['', 'a', 'ab', 'aa', 'abba', 'abcba', 'forgeeksskeegfor', 'aaaa', 'abacdfgdcaba']
+    strings += [''.join(rng.choice('ab') for _ in range(rng.randrange(1, 25))) for _ in range(300)]
+    strings += [''.join(rng.choice('abc') for _ in range(rng.randrange(1, 25))) for _ in range(300)]
+    for s in strings:
+        start, length = longest_palindrome(s)
+        part = s[start:start + length]
+        assert len(part) == length == longest_brute_force(s), s
+        assert part == part[::-1]
+    assert longest_palindrome(b'xxabbay') == (2, 4)
+
+
+def test_longest_palindrome_long():
+    """Тест линейного времени на строке из одинаковых символов"""
+    assert longest_palindrome('a' * 100000) == (0, 100000)
+    assert longest_palindrome('ab' * 50000) == (0, 99999)
@@ -0,0 +1,106 @@
+"""
+Тесты для возведения в степень
+"""
+import random
+
+import pytest
+
+from src.recursive_algorithms import power, power_batch, power_recursive, power_stackless
+
+MOD = 10**9 + 7
+
+
+def matrix_power_naive(matrix, exponent, mod=None):
+    size = len(matrix)
+    result = [[int(i == j) for j in range(size)] for i in range(size)]
+    for _ in range(exponent):
+        result = [[sum(result[i][k] * matrix[k][j] for k in range(size)) for j in range(size)]
+                  for i in range(size)]
+        if mod is not None:
+            result = [[x % mod for x in row] for row in result]
+    if mod is not None:
+        result = [[x % mod for x in row] for row in result]
+    return result
+
+
+def test_power_matches_pow():
+    """Тест power для целых чисел с модулем и без"""
+    rng = random.Random(19)
+    for _ in range(200):
+        base = rng.randrange(-1000, 1000)
+        exponent = rng.randrange(0, 300)
+        assert power(base, exponent) == pow(base, exponent)
+        assert power(base, exponent, MOD) == pow(base, exponent, MOD)
+    assert power(3, 10**5, MOD) == pow(3, 10**5, MOD)
+    assert power(0, 0) == 1
+    assert power(5, 0, 1) == 0
+
+
+def test_power_negative_exponent():
+    """Тест отрицательного показателя: дробь без модуля, обратный элемент по модулю"""
+    assert power(2, -3) == pytest.approx(0.125)
+    assert power(2.5, -2) == pytest.approx(0.16)
+    for base in (2, 3, 10**6, MOD - 1):
+        for exponent in (-1, -2, -17):
+            assert power(base, exponent, MOD) == pow(base, exponent, MOD)
+    with pytest.raises(ValueError):
+        power(2, -1, 4)  # Обратного элемента нет
+
+
+def test_power_matrix():
+    """Тест power для матриц-списков и массивов NumPy"""
+    fib = [[1, 1], [1, 0]]
+    assert power(fib, 90)[0][1] == 2880067194370816120
+    assert power(fib, 0) == [[1, 0], [0, 1]]
+    rng = random.Random(7)
+    matrix = [[rng.randrange(-5, 6) for _ in range(3)] for _ in range(3)]
+    for exponent in (1, 2, 5, 13):
+        assert power(matrix, exponent) == matrix_power_naive(matrix, exponent)
+        assert power(matrix, exponent, 97) == matrix_power_naive(matrix, exponent, 97)
+    np = pytest.importorskip('numpy')
+    array = np.array(matrix, dtype=np.int64)
+    assert power(array, 13, 97).tolist() == matrix_power_naive(matrix, 13, 97)
+    assert power(array, 0).tolist() == matrix_power_naive(matrix, 0)
+
+
+def test_power_errors():
+    """Тест неверных аргументов power"""
+    with pytest.raises(TypeError):
+        power(2, 1.5)
+    with pytest.raises(TypeError):
+        power(2.0, 3, 5)
+    with pytest.raises(ValueError):
+        power(2, 3, 0)
+    with pytest.raises(ValueError):
+        power([[1, 2]], 2)
+    with pytest.raises(ValueError):
+        power([[1, 1], [1, 0]], -1)
+
+
+@pytest.mark.parametrize('window', [None, 1, 2, 3, 4, 5, 6, 7])
+def test_power_batch_windows(window):
+    """Тест power_batch при всех ширинах окна"""
+    rng = random.Random(window or 0)
+    exponents = [0, 1, 2, 3, 255, 256, 2**64 + 1] + [rng.randrange(10**30) for _ in range(30)]
+    assert power_batch(3, exponents, MOD, window) == [pow(3, e, MOD) for e in exponents]
+    small = [rng.randrange(200) for _ in range(20)] + [0]
+    assert power_batch(-7, small, window=window) == [pow(-7, e) for e in small]
+    fib = [[1, 1], [1, 0]]
+    assert power_batch(fib, [0, 1, 10, 91], MOD, window) == [power(fib, e, MOD) for e in (0, 1, 10, 91)]
+
+
+def test_power_batch_errors():
+    """Тест power_batch: пустой список и отрицательные показатели"""
+    assert power_batch(5, []) == []
+    with pytest.raises(ValueError):
+        power_batch(5, [1, -2])
+
+
+def test_power_recursive_and_stackless():
+    """Тест рекурсивной версии и версии через stackless"""
+    for base in (2, -3, 7):
+        for exponent in (0, 1, 2, 15, 64, 200):
+            assert power_recursive(base, exponent) == pow(base, exponent)
+            assert power_stackless(base, exponent) == pow(base, exponent)
+    assert power_recursive(2, -2) == pytest.approx(0.25)
+    assert power_stackless(2, -2) == pytest.approx(0.25)
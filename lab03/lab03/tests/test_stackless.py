@@ -0,0 +1,162 @@
+"""
+Тесты для рекурсии без стека интерпретатора (stackless)
+"""
+import gc
+import math
+import sys
+
+import pytest
+
+from src.recursive_algorithms import (
+    stackless,
+    factorial_stackless,
+    binary_search_stackless,
+    binary_search_iterative,
+    gcd_stackless,
+    power_stackless,
+)
+from src.task_solutions import (
+    TreeNode,
+    tree_traversal_stackless,
+    tree_traversal_preorder,
+    tree_traversal_inorder,
+    tree_traversal_postorder,
+    tree_height_stackless,
+    count_nodes_stackless,
+    sum_tree_values_stackless,
+)
+
+DEEP = 200000
+
+
+@stackless
+def depth_sum(n):
+    if n == 0:
+        return 0
+    return n + (yield (n - 1,))
+
+
+@stackless
+def fail_at_bottom(n):
+    if n == 0:
+        raise KeyError('дно')
+    return (yield (n - 1,))
+
+
+@stackless
+def catch_below(n, catch_at):
+    # Уровень catch_at перехватывает исключение, поднявшееся с нижних уровней
+    if n == 0:
+        raise KeyError('дно')
+    if n == catch_at:
+        try:
+            return (yield (n - 1, catch_at))
+        except KeyError:
+            return -n
+    return (yield (n - 1, catch_at))
+
+
+def chain(length):
+    """Вырожденное дерево-цепочка: каждый узел - левый потомок предыдущего"""
+    root = node = TreeNode(0)
+    for value in range(1, length):
+        node.left = TreeNode(value)
+        node = node.left
+    return root
+
+
+def sample_tree():
+    root = TreeNode(4)
+    root.left, root.right = TreeNode(2), TreeNode(6)
+    root.left.left, root.left.right = TreeNode(1), TreeNode(3)
+    root.right.right = TreeNode(7)
+    return root
+
+
+def test_deep_recursion():
+    """Тест глубины, намного большей лимита рекурсии"""
+    assert DEEP > sys.getrecursionlimit()
+    assert depth_sum(DEEP) == DEEP * (DEEP + 1) // 2
+    assert depth_sum(0) == 0
+
+
+def test_factorial_stackless():
+    """Тест факториала через stackless"""
+    for n in list(range(0, 30)) + [5000]:
+        assert factorial_stackless(n) == math.factorial(n), n
+    with pytest.raises(ValueError):
+        factorial_stackless(-1)
+
+
+def test_exception_propagation():
+    """Тест передачи исключения через все уровни и перехвата на промежуточном"""
+    with pytest.raises(KeyError):
+        fail_at_bottom(DEEP)
+    assert catch_below(100, 40) == -40
+    assert catch_below(100, 100) == -100
+
+
+def test_gc_restored():
+    """Тест: сборщик мусора выключается на глубине и включается обратно"""
+    assert gc.isenabled()
+    depth_sum(DEEP)
+    assert gc.isenabled()
+    with pytest.raises(KeyError):
+        fail_at_bottom(DEEP)
+    assert gc.isenabled()
+
+    gc.disable()
+    try:
+        depth_sum(DEEP)
+        assert not gc.isenabled()  # чужое выключение не отменяется
+    finally:
+        gc.enable()
+
+
+def test_binary_search_stackless():
+    """Тест бинарного поиска через stackless"""
+    arr = list(range(0, 200, 2))
+    for target in range(-1, 201):
+        assert binary_search_stackless(arr, target) == binary_search_iterative(arr, target)
+    assert binary_search_stackless([], 1) is None
+
+
+def test_gcd_and_power_stackless():
+    """Тест алгоритма Евклида и степени через stackless"""
+    for a in range(0, 60):
+        for b in range(0, 60):
+            assert gcd_stackless(a, b) == math.gcd(a, b)
+    fib = [1, 1]
+    while len(fib) < 300:
+        fib.append(fib[-1] + fib[-2])
+    assert gcd_stackless(fib[-1], fib[-2]) == 1  # худший случай Евклида
+    for exponent in range(0, 40):
+        assert power_stackless(3, exponent) == 3 ** exponent
+
+
+def test_tree_stackless():
+    """Тест обходов и агрегатов дерева через stackless"""
+    root = sample_tree()
+    assert tree_traversal_stackless(root, 'preorder') == tree_traversal_preorder(root)
+    assert tree_traversal_stackless(root) == tree_traversal_inorder(root)
+    assert tree_traversal_stackless(root, 'postorder') == tree_traversal_postorder(root)
+    assert tree_height_stackless(root) == 3
+    assert count_nodes_stackless(root) == 6
+    assert sum_tree_values_stackless(root) == 23
+
+    assert tree_traversal_stackless(None) == []
+    assert tree_height_stackless(None) == 0
+    assert count_nodes_stackless(None) == 0
+    assert sum_tree_values_stackless(None) == 0
+    with pytest.raises(ValueError):
+        tree_traversal_stackless(root, 'levelorder')
+
+
+def test_tree_stackless_deep():
+    """Тест вырожденного дерева глубиной больше лимита рекурсии"""
+    root = chain(DEEP)
+    assert tree_traversal_stackless(root, 'preorder') == list(range(DEEP))
+    assert tree_traversal_stackless(root) == list(range(DEEP - 1, -1, -1))
+    assert tree_height_stackless(root) == DEEP
+    assert count_nodes_stackless(root) == DEEP
+    assert sum_tree_values_stackless(root) == DEEP * (DEEP - 1) // 2
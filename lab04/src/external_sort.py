@@ -0,0 +1,166 @@
+import os
+import shutil
+import tempfile
+import time
+from typing import List, Optional
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             'lab07', 'src'))
+
+import numpy as np
+
+from heap import MinHeap
+
+_DEFAULT_FAN_IN = 16  # Число серий, сливаемых за один проход
+
+class ExternalSortStats:
+    """Статистика внешней сортировки: объем, число серий и проходов, скорость."""
+
+    def __init__(self, records: int, itemsize: int, runs: int, passes: int, seconds: float) -> None:
+        self.records = records
+        self.bytes = records * itemsize
+        self.runs = runs  # Начальные отсортированные серии
+        self.passes = passes  # Полные проходы по данным: создание серий + проходы слияния
+        self.seconds = seconds
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes / 2**20 / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (f"{self.bytes / 2**20:.0f} МБ за {self.seconds:.2f} с ({self.mb_per_s:.1f} МБ/с), "
+                f"серий: {self.runs}, проходов: {self.passes}")
+
+def _keys(block: np.ndarray, key: Optional[str]) -> np.ndarray:
+    return block[key] if key is not None else block
+
+def _sort_block(block: np.ndarray, key: Optional[str]) -> np.ndarray:
+    # Устойчивая сортировка блока; для записей - по полю key
+    if key is None:
+        return np.sort(block, kind='stable')
+    return block[np.argsort(block[key], kind='stable')]
+
+def _create_runs(input_path: str, dtype: np.dtype, key: Optional[str], run_records: int,
+                 tmp_dir: str) -> List[str]:
+    # Проход 1: чтение частями по run_records записей, сортировка в памяти, запись серий
+    runs = []
+    with open(input_path, 'rb') as f:
+        while True:
+            block = np.fromfile(f, dtype=dtype, count=run_records)
+            if not len(block):
+                break
+            path = os.path.join(tmp_dir, f'run_{len(runs)}.bin')
+            _sort_block(block, key).tofile(path)
+            runs.append(path)
+    return runs
+
+def _merge_runs(paths: List[str], output_path: str, dtype: np.dtype, key: Optional[str],
+                block_records: int) -> None:
+    """
+    Слияние k отсортированных серий блоками. В куче MinHeap лежат пары
+    (последний ключ текущего блока, номер серии). Для минимальной пары
+    (bound, run) все записи, меньшие ее в том же порядке (ключ меньше bound
+    или равен ему в серии с номером не больше run), уже можно выводить:
+    дальше в сериях идут только большие пары. Они вырезаются бинарным
+    поиском и сливаются одной векторной устойчивой сортировкой, так что
+    куча работает с блоками, а не с отдельными записями.
+    """
+    sources = [np.memmap(path, dtype=dtype, mode='r') if os.path.getsize(path) else np.empty(0, dtype)
+               for path in paths]
+    positions = [0] * len(sources)
+    blocks = [None] * len(sources)
+    versions = [0] * len(sources)  # Номер текущего блока: записи кучи от старых блоков пропускаются
+    heap = MinHeap()
+
+    def refill(run: int) -> None:
+        source, pos = sources[run], positions[run]
+        blocks[run] = np.array(source[pos:pos + block_records])  # Копия из mmap в память
+        positions[run] = pos + len(blocks[run])
+        versions[run] += 1
+        if len(blocks[run]):
+            heap.insert((_keys(blocks[run], key)[-1].item(), run, versions[run]))
+
+    for run in range(len(sources)):
+        refill(run)
+
+    with open(output_path, 'wb', buffering=1 << 20) as out:
+        while len(heap):
+            bound, run, version = heap.extract_min()
+            if version != versions[run]:
+                continue
+            pieces = []
+            exhausted = []
+            for other, block in enumerate(blocks):
+                if block is None or not len(block):
+                    continue
+                if other == run:
+                    cut = len(block)
+                else:  # Равные ключи из серий после run выводятся позже - порядок устойчив
+                    cut = np.searchsorted(_keys(block, key), bound, side='right' if other < run else 'left')
+                if cut:
+                    pieces.append(block[:cut])
+                    blocks[other] = block[cut:]
+                    if cut == len(block):
+                        exhausted.append(other)
+            # Куски идут в порядке серий, поэтому устойчивая сортировка сохраняет порядок равных записей
+            merged = _sort_block(np.concatenate(pieces), key) if len(pieces) > 1 else pieces[0]
+            out.write(memoryview(np.ascontiguousarray(merged)).cast('B'))
+            for other in exhausted:
+                refill(other)
+    del sources
+
+def external_sort(input_path: str, output_path: str, memory_limit: int = 64 * 2**20,
+                  dtype='<i8', key: Optional[str] = None, fan_in: int = _DEFAULT_FAN_IN,
+                  tmp_dir: Optional[str] = None) -> ExternalSortStats:
+    """
+    Внешняя сортировка слиянием для файлов больше оперативной памяти.
+    1. Создание серий: файл читается частями по memory_limit / 2 байт,
+       каждая часть сортируется в памяти и записывается во временный файл
+    2. Проходы слияния: группы по fan_in серий сливаются блоками через
+       кучу (см. _merge_runs), пока не останется одна серия
+    Записи фиксированной ширины задаются dtype NumPy (по умолчанию int64);
+    для структурных dtype сортировка идет по полю key и устойчива.
+    Сложность: O(n log n) сравнений, 1 + ceil(log_fan_in(серий)) проходов по диску
+    Память: O(memory_limit)
+    """
+    start = time.perf_counter()
+    dtype = np.dtype(dtype)
+    if key is None and dtype.names:
+        raise ValueError("Для структурного dtype нужно указать поле key")
+    if fan_in < 2:
+        raise ValueError("fan_in должен быть не меньше 2")
+    run_records = max(1, memory_limit // 2 // dtype.itemsize)
+    # При слиянии в памяти блоки всех серий, вырезанные куски и результат их слияния
+    block_records = max(1, memory_limit // 3 // fan_in // dtype.itemsize)
+
+    # Временные серии по умолчанию рядом с результатом: в /tmp может не хватить места
+    work_dir = tempfile.mkdtemp(prefix='external_sort_', dir=tmp_dir or os.path.dirname(os.path.abspath(output_path)))
+    try:
+        runs = _create_runs(input_path, dtype, key, run_records, work_dir)
+        initial_runs = len(runs)
+        passes = 1
+        generation = 0
+        while len(runs) > 1:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                if len(group) == 1:
+                    merged.append(group[0])
+                    continue
+                path = os.path.join(work_dir, f'merge_{generation}_{i // fan_in}.bin')
+                _merge_runs(group, path, dtype, key, block_records)
+                for run_path in group:
+                    os.remove(run_path)
+                merged.append(path)
+            runs = merged
+            passes += 1
+            generation += 1
+        if runs:
+            shutil.move(runs[0], output_path)
+        else:
+            open(output_path, 'wb').close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    records = os.path.getsize(output_path) // dtype.itemsize
+    return ExternalSortStats(records, dtype.itemsize, initial_runs, passes, time.perf_counter() - start)
@@ -0,0 +1,104 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+_PARALLEL_MIN_SIZE = 1 << 16  # Для меньших массивов запуск процессов дороже самой сортировки
+
+# Массивы в общей памяти, подключенные в рабочем процессе (заполняет _attach)
+_shared: Dict[str, Any] = {}
+
+def _attach(input_name: str, output_name: str, n: int) -> None:
+    # Инициализатор рабочего процесса: подключение к общей памяти по имени, без копирования
+    for key, name in (('input', input_name), ('output', output_name)):
+        shm = shared_memory.SharedMemory(name=name)
+        _shared[key + '_shm'] = shm
+        _shared[key] = np.ndarray((n,), dtype=np.int64, buffer=shm.buf)
+
+def _sort_chunk(lo: int, hi: int, samples: int) -> np.ndarray:
+    # Фаза 1: сортировка своей части на месте и равномерная выборка из нее
+    chunk = _shared['input'][lo:hi]
+    chunk.sort()
+    if not len(chunk):
+        return chunk[:0].copy()
+    return chunk[np.linspace(0, len(chunk) - 1, samples).astype(np.int64)].copy()
+
+def _merge_partition(offset: int, pieces: List[tuple]) -> None:
+    # Фаза 2: отсортированные куски всех частей с ключами из одного диапазона
+    # копируются подряд в выходной массив и сливаются устойчивой сортировкой: для int64
+    # это timsort, который находит готовые отсортированные куски и только сливает их
+    src, dst = _shared['input'], _shared['output']
+    end = offset
+    for lo, hi in pieces:
+        dst[end:end + hi - lo] = src[lo:hi]
+        end += hi - lo
+    if len(pieces) > 1:
+        dst[offset:end].sort(kind='stable')
+
+def _store(arr, result: np.ndarray) -> None:
+    # Результат записывается в исходный список или массив (сортировка на месте)
+    if isinstance(arr, np.ndarray):
+        arr[...] = result
+    else:
+        arr[:] = result.tolist()
+
+def parallel_sort(arr, workers: Optional[int] = None):
+    """
+    Параллельная сортировка целых чисел (int64) выборкой по регулярным
+    образцам (PSRS) в пуле процессов над общей памятью.
+    1. Массив копируется в multiprocessing.shared_memory; каждый из workers
+       процессов сортирует свою часть на месте и возвращает workers образцов
+    2. Из образцов выбираются workers - 1 разделителей; части режутся по ним
+       бинарным поиском, и каждый процесс собирает свой диапазон ключей из
+       всех частей во второй общий буфер и сливает его
+    Данные между процессами не сериализуются: передаются только границы.
+    Список сортируется на месте (как остальные сортировки), массив NumPy - тоже.
+    Списки и массивы других dtype приводятся к int64, если это возможно без
+    потерь, иначе (float, uint64, числа шире int64) сортируются np.sort
+    в одном процессе.
+    Сложность: O((n / p) log n + n / p) на процесс для равномерных данных
+    Память: O(n) - два буфера общей памяти
+    """
+    workers = workers or os.cpu_count() or 1
+    data = np.asarray(arr)
+    n = len(data)
+    if not np.can_cast(data.dtype, np.int64, 'safe'):  # Буферы общей памяти - только int64
+        workers = 1
+    if workers == 1 or n < _PARALLEL_MIN_SIZE:
+        _store(arr, np.sort(data))
+        return arr
+
+    input_shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    output_shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    try:
+        source = np.ndarray((n,), dtype=np.int64, buffer=input_shm.buf)
+        result = np.ndarray((n,), dtype=np.int64, buffer=output_shm.buf)
+        source[:] = data
+        bounds = np.linspace(0, n, workers + 1).astype(np.int64).tolist()
+        with ProcessPoolExecutor(workers, initializer=_attach,
+                                 initargs=(input_shm.name, output_shm.name, n)) as pool:
+            samples = list(pool.map(_sort_chunk, bounds[:-1], bounds[1:], [workers] * workers))
+            candidates = np.sort(np.concatenate(samples))
+            splitters = candidates[np.arange(1, workers) * len(candidates) // workers]
+
+            # cuts[c][j]..cuts[c][j + 1] - ключи диапазона j в части c
+            cuts = [[lo] + (lo + np.searchsorted(source[lo:hi], splitters, side='right')).tolist() + [hi]
+                    for lo, hi in zip(bounds[:-1], bounds[1:])]
+            offsets, pieces = [], []
+            offset = 0
+            for j in range(workers):
+                partition = [(cut[j], cut[j + 1]) for cut in cuts if cut[j] < cut[j + 1]]
+                offsets.append(offset)
+                pieces.append(partition)
+                offset += sum(hi - lo for lo, hi in partition)
+            list(pool.map(_merge_partition, offsets, pieces))
+        _store(arr, result)
+        del source, result  # Буферы нельзя закрыть, пока на них есть ссылки
+    finally:
+        input_shm.close()
+        input_shm.unlink()
+        output_shm.close()
+        output_shm.unlink()
+    return arr
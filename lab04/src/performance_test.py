@@ -1,46 +1,124 @@
-import time
 import copy
-from typing import List, Dict, Any
-from sorts import bubble_sort, selection_sort, insertion_sort, merge_sort, quick_sort
+import tracemalloc
+from typing import List, Dict, Any, Optional, Sequence
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.benchmark import benchmark, BenchmarkResult
+from common.results_store import ResultsStore
+from sorts import (bubble_sort, selection_sort, insertion_sort, merge_sort, quick_sort, hybrid_sort,
+                   merge_sort_bottom_up, counting_sort, radix_sort, bucket_sort, integer_sort)
+from parallel_sort import parallel_sort
+from external_sort import external_sort
 from generate_data import generate_all_datasets
 
+def measure_sorting_algorithm(algorithm, data: List[int], repeat: int = 3) -> BenchmarkResult:
+    # Копия входа делается перед каждым повтором вне измеряемого участка
+    return benchmark(algorithm, setup=lambda: (list(data),), repeat=repeat)
+
+def measure_peak_memory(algorithm, data: List[int]) -> int:
+    # Пиковый объем памяти, выделенной во время одного вызова (байты, без копии входа)
+    arr = list(data)
+    tracemalloc.start()
+    try:
+        algorithm(arr)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
 def test_sorting_algorithm(algorithm, data: List[int]) -> float:
-    arr_copy = copy.deepcopy(data)
-    start_time = time.time()
-    algorithm(arr_copy)
-    end_time = time.time()
-    return end_time - start_time
+    return measure_sorting_algorithm(algorithm, data).median
 
 def verify_sorting_correctness():
     test_data = [64, 34, 25, 12, 22, 11, 90]
-    algorithms = [bubble_sort, selection_sort, insertion_sort, merge_sort, quick_sort]
+    algorithms = [bubble_sort, selection_sort, insertion_sort, merge_sort, quick_sort, hybrid_sort,
+                  merge_sort_bottom_up, counting_sort, radix_sort, bucket_sort, integer_sort]
     
     for algo in algorithms:
         result = algo(copy.deepcopy(test_data))
         assert result == sorted(test_data), f"Алгоритм {algo.__name__} работает некорректно"
     print("Все алгоритмы сортируют корректно")
 
-def run_performance_tests():
+def run_performance_tests(store: Optional[ResultsStore] = None,
+                          large_sizes: Sequence[int] = (10**5, 10**6, 10**7)):
+    if store is None:
+        store = ResultsStore(lab='lab04')
     datasets = generate_all_datasets()
     algorithms = {
         'bubble_sort': bubble_sort,
         'selection_sort': selection_sort, 
         'insertion_sort': insertion_sort,
         'merge_sort': merge_sort,
-        'quick_sort': quick_sort
+        'quick_sort': quick_sort,
+        'hybrid_sort': hybrid_sort,
+        'merge_sort_bottom_up': merge_sort_bottom_up,
+        'counting_sort': counting_sort,
+        'radix_sort': radix_sort,
+        'bucket_sort': bucket_sort,
+        'integer_sort': integer_sort
     }
+    # Сортировки без сравнений дополнительно проверяются на больших размерах
+    large_algorithms = ['counting_sort', 'radix_sort', 'bucket_sort', 'integer_sort']
     
     results = {}
     
-    for algo_name, algorithm in algorithms.items():
+    def measure(algo_name, data_name, data, repeat=3):
+        result = measure_sorting_algorithm(algorithms[algo_name], data, repeat)
+        family, size = data_name.rsplit('_', 1)
+        store.record(result, algo_name, family, int(size))
+        time_taken = result.median
+        results[algo_name][data_name] = time_taken
+        peak = measure_peak_memory(algorithms[algo_name], data)
+        print(f"{algo_name} на {data_name}: {time_taken:.4f} сек, пик памяти {peak / 1024:.1f} КБ")
+    
+    for algo_name in algorithms:
         results[algo_name] = {}
         for data_name, data in datasets.items():
-            time_taken = test_sorting_algorithm(algorithm, data)
-            results[algo_name][data_name] = time_taken
-            print(f"{algo_name} на {data_name}: {time_taken:.4f} сек")
+            measure(algo_name, data_name, data)
+    
+    for size in large_sizes:
+        # Наборы одного размера создаются по очереди: 4 списка по 10^7 занимают около 1 ГБ
+        for data_name, data in generate_all_datasets([size]).items():
+            for algo_name in large_algorithms:
+                measure(algo_name, data_name, data, repeat=3 if size < 10**6 else 1)
     
     return results
 
+def run_parallel_scaling(store: Optional[ResultsStore] = None, size: int = 10**7,
+                         max_workers: Optional[int] = None) -> Dict[int, float]:
+    # Кривая масштабирования parallel_sort: время на массиве NumPy int64 для 1..N процессов
+    import numpy as np
+    if store is None:
+        store = ResultsStore(lab='lab04')
+    max_workers = max_workers or os.cpu_count() or 1
+    data = np.random.default_rng(0).integers(0, size * 10, size, dtype=np.int64)
+    scaling = {}
+    for workers in range(1, max_workers + 1):
+        result = benchmark(parallel_sort, setup=lambda: (data.copy(), workers), repeat=3)
+        store.record(result, f'parallel_sort_{workers}', 'random', size)
+        scaling[workers] = result.median
+        print(f"parallel_sort, процессов: {workers}, n = {size}: {result.median:.3f} сек "
+              f"(ускорение x{scaling[1] / result.median:.2f})")
+    return scaling
+
+def run_external_sort_test(size_mb: int = 256, memory_mb: int = 32, fan_in: int = 4) -> None:
+    # Внешняя сортировка файла int64, который в несколько раз больше лимита памяти
+    import numpy as np
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, 'input.bin')
+        output_path = os.path.join(tmp, 'output.bin')
+        rng = np.random.default_rng(0)
+        with open(input_path, 'wb') as f:
+            for _ in range(size_mb // 16):  # Вход тоже пишется частями, не больше 16 МБ в памяти
+                rng.integers(0, 2**62, 2**21, dtype=np.int64).tofile(f)
+        stats = external_sort(input_path, output_path, memory_limit=memory_mb * 2**20, fan_in=fan_in)
+        print(f"external_sort, лимит памяти {memory_mb} МБ, fan_in {fan_in}: {stats.summary()}")
+
 if __name__ == "__main__":
     verify_sorting_correctness()
-    results = run_performance_tests()
\ No newline at end of file
+    store = ResultsStore(lab='lab04')
+    results = run_performance_tests(store)
+    run_parallel_scaling(store)
+    run_external_sort_test()
+    print(f"Результаты сохранены в {store.path} (run_id {store.run_id})")
\ No newline at end of file
@@ -1,6 +1,6 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from performance_test import run_performance_tests
+from performance_test import run_performance_tests, run_parallel_scaling
 
 def plot_results(results: dict):
     sizes = [100, 1000, 5000, 10000]
@@ -28,7 +28,7 @@ def plot_data_type_comparison(results: dict, size: int = 5000):
     plt.figure(figsize=(12, 8))
     
     x = np.arange(len(data_types))
-    width = 0.15
+    width = 0.8 / len(algorithms)
     
     for i, algo in enumerate(algorithms):
         times = [results[algo][f'{data_type}_{size}'] for data_type in data_types]
@@ -37,13 +37,29 @@ def plot_data_type_comparison(results: dict, size: int = 5000):
     plt.xlabel('Тип данных')
     plt.ylabel('Время (секунды)')
     plt.title(f'Сравнение алгоритмов на разных типах данных (n={size})')
-    plt.xticks(x + width * 2, data_types)
+    plt.xticks(x + width * (len(algorithms) - 1) / 2, data_types)
     plt.legend()
     plt.grid(True, alpha=0.3)
     plt.savefig('data_type_comparison.png')
     plt.show()
 
+def plot_parallel_scaling(scaling: dict):
+    workers = sorted(scaling)
+    speedup = [scaling[1] / scaling[w] for w in workers]
+    
+    plt.figure(figsize=(12, 8))
+    plt.plot(workers, speedup, marker='o', label='parallel_sort')
+    plt.plot(workers, workers, linestyle='--', color='gray', label='Линейное ускорение')
+    plt.xlabel('Число процессов')
+    plt.ylabel('Ускорение относительно 1 процесса')
+    plt.title('Масштабирование параллельной сортировки')
+    plt.legend()
+    plt.grid(True)
+    plt.savefig('parallel_scaling.png')
+    plt.show()
+
 if __name__ == "__main__":
     results = run_performance_tests()
     plot_results(results)
-    plot_data_type_comparison(results)
\ No newline at end of file
+    plot_data_type_comparison(results)
+    plot_parallel_scaling(run_parallel_scaling())
\ No newline at end of file
@@ -1,4 +1,10 @@
-from typing import List, Any
+from bisect import bisect_right
+from typing import Any, Callable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # Без NumPy поразрядная и подсчетом работают на списках
+    np = None
 
 def bubble_sort(arr: List[int]) -> List[int]:
     """
@@ -88,4 +94,359 @@ def quick_sort(arr: List[int]) -> List[int]:
     middle = [x for x in arr if x == pivot]
     right = [x for x in arr if x > pivot]
     
-    return quick_sort(left) + middle + quick_sort(right)
\ No newline at end of file
+    return quick_sort(left) + middle + quick_sort(right)
+
+_INSERTION_CUTOFF = 24   # Подобрано замерами: ниже порога вставки быстрее разбиения
+_NINTHER_THRESHOLD = 128  # С этого размера опорный элемент - медиана девяти
+_PARTIAL_INSERTION_LIMIT = 8  # Допустимое число сдвигов при проверке почти упорядоченной части
+
+def _insertion_sort_range(arr: List[int], lo: int, hi: int) -> None:
+    """Бинарные вставки на arr[lo:hi]: сдвиг делается срезом (memmove на C)."""
+    for i in range(lo + 1, hi):
+        x = arr[i]
+        if x < arr[i - 1]:
+            pos = bisect_right(arr, x, lo, i - 1)
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = x
+
+def _partial_insertion_sort(arr: List[int], lo: int, hi: int) -> bool:
+    """
+    Сортировка вставками arr[lo:hi], прерываемая после _PARTIAL_INSERTION_LIMIT
+    вставок. True, если часть отсортирована (почти упорядоченные данные).
+    """
+    moves = 0
+    for i in range(lo + 1, hi):
+        x = arr[i]
+        if x < arr[i - 1]:
+            moves += 1
+            if moves > _PARTIAL_INSERTION_LIMIT:
+                return False
+            pos = bisect_right(arr, x, lo, i - 1)
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = x
+    return True
+
+def _median_of_three(arr: List[int], a: int, b: int, c: int) -> int:
+    """Индекс медианы из arr[a], arr[b], arr[c]."""
+    x, y, z = arr[a], arr[b], arr[c]
+    if x < y:
+        if y < z:
+            return b
+        return c if x < z else a
+    if x < z:
+        return a
+    return c if y < z else b
+
+def _heap_sort_range(arr: List[int], lo: int, hi: int) -> None:
+    """Пирамидальная сортировка arr[lo:hi] на месте (запасной вариант introsort)."""
+    n = hi - lo
+
+    def sift_down(root: int, end: int) -> None:
+        x = arr[lo + root]
+        child = 2 * root + 1
+        while child < end:
+            if child + 1 < end and arr[lo + child] < arr[lo + child + 1]:
+                child += 1
+            if not x < arr[lo + child]:
+                break
+            arr[lo + root] = arr[lo + child]
+            root = child
+            child = 2 * root + 1
+        arr[lo + root] = x
+
+    for root in range(n // 2 - 1, -1, -1):
+        sift_down(root, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        sift_down(0, end)
+
+def hybrid_sort(arr: List[int]) -> List[int]:
+    """
+    Гибридная сортировка на месте (introsort с приемами pdqsort/Timsort).
+    - Уже упорядоченный или строго убывающий массив распознается за один проход
+    - Опорный элемент - медиана трех, для больших частей - медиана девяти (ninther)
+    - Разбиение Хоара: одинаковые ключи делятся поровну, без O(n²) на повторах
+    - Если разбиение ничего не переставило, часть проверяется ограниченными вставками
+    - Части короче _INSERTION_CUTOFF сортируются бинарными вставками
+    - При глубине больше 2*log2(n) часть досортировывается пирамидальной сортировкой
+    - Явный стек вместо рекурсии: меньшая часть обрабатывается первой, стек O(log n)
+    Сложность: O(n log n) в худшем, O(n) на упорядоченных данных
+    Память: O(log n)
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    # Поиск серии: упорядоченный массив возвращается сразу, убывающий разворачивается
+    i = 1
+    while i < n and not arr[i] < arr[i - 1]:
+        i += 1
+    if i == n:
+        return arr
+    if i == 1:
+        while i < n and arr[i] < arr[i - 1]:
+            i += 1
+        if i == n:
+            arr.reverse()
+            return arr
+
+    stack = [(0, n, 2 * n.bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo > _INSERTION_CUTOFF:
+            if depth == 0:
+                _heap_sort_range(arr, lo, hi)
+                break
+            depth -= 1
+
+            size = hi - lo
+            mid = lo + size // 2
+            if size >= _NINTHER_THRESHOLD:
+                step = size // 8
+                m = _median_of_three(
+                    arr,
+                    _median_of_three(arr, lo, lo + step, lo + 2 * step),
+                    _median_of_three(arr, mid - step, mid, mid + step),
+                    _median_of_three(arr, hi - 1 - 2 * step, hi - 1 - step, hi - 1),
+                )
+            else:
+                m = _median_of_three(arr, lo, mid, hi - 1)
+            arr[lo], arr[m] = arr[m], arr[lo]
+            pivot = arr[lo]
+
+            # Разбиение Хоара: arr[lo:j+1] <= pivot <= arr[j+1:hi]
+            left, j = lo - 1, hi
+            swapped = False
+            while True:
+                left += 1
+                while arr[left] < pivot:
+                    left += 1
+                j -= 1
+                while pivot < arr[j]:
+                    j -= 1
+                if left >= j:
+                    break
+                arr[left], arr[j] = arr[j], arr[left]
+                swapped = True
+            j += 1
+
+            if not swapped and _partial_insertion_sort(arr, lo, j) and _partial_insertion_sort(arr, j, hi):
+                break
+            if j - lo < hi - j:
+                stack.append((j, hi, depth))
+                hi = j
+            else:
+                stack.append((lo, j, depth))
+                lo = j
+        else:
+            _insertion_sort_range(arr, lo, hi)
+    return arr
+
+_RUN_LENGTH = 32  # Длина начальных серий, сортируемых вставками
+_COPY_CHUNK = 4096  # Блочное копирование частями: временный срез не больше 32 КБ
+
+def _copy_range(src: List[Any], dst: List[Any], lo: int, hi: int, dst_lo: int) -> None:
+    """Копирование src[lo:hi] в dst начиная с dst_lo частями по _COPY_CHUNK."""
+    for start in range(lo, hi, _COPY_CHUNK):
+        end = min(start + _COPY_CHUNK, hi)
+        dst[dst_lo + start - lo:dst_lo + end - lo] = src[start:end]
+
+def _merge_pass(src: List[Any], dst: List[Any], width: int, n: int) -> None:
+    """Один проход: соседние серии длины width из src сливаются в dst."""
+    for lo in range(0, n, 2 * width):
+        mid = min(lo + width, n)
+        hi = min(lo + 2 * width, n)
+        if mid == hi or not src[mid] < src[mid - 1]:
+            _copy_range(src, dst, lo, hi, lo)  # Серии уже по порядку: копирование блоком
+            continue
+        i, j, k = lo, mid, lo
+        left, right = src[i], src[j]
+        while True:
+            if right < left:
+                dst[k] = right
+                j += 1
+                k += 1
+                if j == hi:
+                    _copy_range(src, dst, i, mid, k)
+                    break
+                right = src[j]
+            else:  # При равенстве берется левый элемент - сортировка устойчива
+                dst[k] = left
+                i += 1
+                k += 1
+                if i == mid:
+                    _copy_range(src, dst, j, hi, k)
+                    break
+                left = src[i]
+
+def _merge_pass_keyed(src_keys: List[Any], src: List[Any], dst_keys: List[Any], dst: List[Any],
+                      width: int, n: int) -> None:
+    """Проход слияния по ключам: элементы переставляются вместе с ключами."""
+    for lo in range(0, n, 2 * width):
+        mid = min(lo + width, n)
+        hi = min(lo + 2 * width, n)
+        if mid == hi or not src_keys[mid] < src_keys[mid - 1]:
+            _copy_range(src_keys, dst_keys, lo, hi, lo)
+            _copy_range(src, dst, lo, hi, lo)
+            continue
+        i, j = lo, mid
+        for k in range(lo, hi):
+            if j < hi and (i == mid or src_keys[j] < src_keys[i]):
+                dst_keys[k] = src_keys[j]
+                dst[k] = src[j]
+                j += 1
+            else:
+                dst_keys[k] = src_keys[i]
+                dst[k] = src[i]
+                i += 1
+
+def merge_sort_bottom_up(arr: List[Any], key: Optional[Callable[[Any], Any]] = None) -> List[Any]:
+    """
+    Восходящая сортировка слиянием на месте, без рекурсии и срезов на каждом уровне.
+    Серии длины _RUN_LENGTH сортируются вставками, затем проходы слияния с
+    удваивающейся шириной попеременно пишут из arr в один заранее выделенный
+    буфер и обратно. Сортировка устойчива; key вычисляется один раз на элемент.
+    Сложность: O(n log n) во всех случаях, O(n) на упорядоченных данных
+    Память: O(n) - один буфер (с key - еще список ключей и буфер ключей)
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    if key is None:
+        for lo in range(0, n, _RUN_LENGTH):
+            _insertion_sort_range(arr, lo, min(lo + _RUN_LENGTH, n))
+        src, dst = arr, [None] * n
+        width = _RUN_LENGTH
+        while width < n:
+            _merge_pass(src, dst, width, n)
+            src, dst = dst, src
+            width *= 2
+        if src is not arr:
+            arr[:] = src
+        return arr
+
+    keys = [key(x) for x in arr]
+    src_keys, src, dst_keys, dst = keys, arr, [None] * n, [None] * n
+    width = 1
+    while width < n:
+        _merge_pass_keyed(src_keys, src, dst_keys, dst, width, n)
+        src_keys, src, dst_keys, dst = dst_keys, dst, src_keys, src
+        width *= 2
+    if src is not arr:
+        arr[:] = src
+    return arr
+
+_COUNTING_RANGE_FACTOR = 4  # Подсчет выгоден, пока диапазон ключей не больше 4n
+_NUMPY_MIN_SIZE = 1024  # Ниже этого размера переход в NumPy и обратно не окупается
+
+def _int_range(arr: List[int]):
+    """Минимум и максимум целочисленного списка; TypeError для нецелых значений."""
+    if not all(type(x) is int for x in arr):
+        raise TypeError("Сортировка без сравнений применима только к целым числам")
+    return min(arr), max(arr)
+
+def counting_sort(arr: List[int]) -> List[int]:
+    """
+    Сортировка подсчетом для целых чисел (в том числе отрицательных).
+    Сложность: O(n + k), k = max - min + 1
+    Память: O(k)
+    """
+    if len(arr) < 2:
+        return arr
+    return _counting_sort(arr, *_int_range(arr))
+
+def _counting_sort(arr: List[int], lo: int, hi: int) -> List[int]:
+    if np is not None and len(arr) >= _NUMPY_MIN_SIZE and -2**63 <= lo and hi < 2**63:
+        counts = np.bincount(np.array(arr, dtype=np.int64) - lo, minlength=hi - lo + 1)
+        arr[:] = (np.repeat(np.arange(hi - lo + 1, dtype=np.int64), counts) + lo).tolist()
+        return arr
+    counts = [0] * (hi - lo + 1)
+    for x in arr:
+        counts[x - lo] += 1
+    pos = 0
+    for value, count in enumerate(counts, lo):
+        if count:
+            arr[pos:pos + count] = [value] * count
+            pos += count
+    return arr
+
+def radix_sort(arr: List[int]) -> List[int]:
+    """
+    Поразрядная сортировка LSD по байтам (основание 256) для целых чисел.
+    Отрицательные числа сдвигаются на минимум; проход пропускается, если
+    все элементы имеют одинаковый байт. С NumPy каждый проход - устойчивая
+    сортировка байтов (np.argsort kind='stable' для uint8 - подсчет на C)
+    и перестановка массива целиком.
+    Сложность: O(n * w), w - число байтов в max - min
+    Память: O(n)
+    """
+    if len(arr) < 2:
+        return arr
+    return _radix_sort(arr, *_int_range(arr))
+
+def _radix_sort(arr: List[int], lo: int, hi: int) -> List[int]:
+    passes = ((hi - lo).bit_length() + 7) // 8
+    if np is not None and len(arr) >= _NUMPY_MIN_SIZE and -2**63 <= lo and hi < 2**63:
+        keys = (np.array(arr, dtype=np.int64) - lo).astype(np.uint64)  # Разность меньше 2^64
+        for shift in range(0, 8 * passes, 8):
+            digits = ((keys >> np.uint64(shift)) & np.uint64(255)).astype(np.uint8)
+            if (digits == digits[0]).all():
+                continue
+            keys = keys[np.argsort(digits, kind='stable')]
+        arr[:] = (keys.astype(np.int64) + lo).tolist() if hi - lo < 2**63 else [int(x) + lo for x in keys.tolist()]
+        return arr
+
+    values = [x - lo for x in arr] if lo else list(arr)
+    for shift in range(0, 8 * passes, 8):
+        buckets = [[] for _ in range(256)]
+        for x in values:
+            buckets[x >> shift & 255].append(x)
+        if max(len(bucket) for bucket in buckets) == len(values):
+            continue
+        values = [x for bucket in buckets for x in bucket]
+    arr[:] = [x + lo for x in values] if lo else values
+    return arr
+
+def bucket_sort(arr: List[int], bucket_count: Optional[int] = None) -> List[int]:
+    """
+    Блочная сортировка: элементы раскладываются в bucket_count (по умолчанию n)
+    равных по диапазону блоков, каждый блок сортируется вставками.
+    Сложность: O(n + k) в среднем для равномерных данных, O(n²) в худшем
+    Память: O(n)
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    lo, hi = _int_range(arr)
+    if lo == hi:
+        return arr
+    count = bucket_count or n
+    buckets = [[] for _ in range(count)]
+    width = hi - lo + 1
+    for x in arr:
+        buckets[(x - lo) * count // width].append(x)  # Целочисленно: без ошибок округления
+    pos = 0
+    for bucket in buckets:
+        if bucket:
+            _insertion_sort_range(bucket, 0, len(bucket))
+            arr[pos:pos + len(bucket)] = bucket
+            pos += len(bucket)
+    return arr
+
+def integer_sort(arr: List[Any]) -> List[Any]:
+    """
+    Выбор сортировки по данным: подсчет, если диапазон ключей не больше
+    _COUNTING_RANGE_FACTOR * n; иначе поразрядная (на списках - любой
+    ширины ключей). Блочная не выбирается: на неравномерных данных
+    она деградирует до O(n²). Для нецелых данных - hybrid_sort.
+    Сложность: O(n + k) или O(n * w)
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    if not all(type(x) is int for x in arr):
+        return hybrid_sort(arr)
+    lo, hi = min(arr), max(arr)
+    if hi - lo < _COUNTING_RANGE_FACTOR * n:
+        return _counting_sort(arr, lo, hi)
+    return _radix_sort(arr, lo, hi)
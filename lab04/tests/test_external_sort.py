@@ -0,0 +1,60 @@
+"""
+Тесты для внешней сортировки
+"""
+import numpy as np
+import pytest
+
+from src.external_sort import external_sort
+
+RECORD = np.dtype([('key', '<i8'), ('index', '<i8')])
+
+
+def test_external_sort_int64(tmp_path):
+    """Тест сортировки int64 многими проходами слияния при малом лимите памяти"""
+    data = np.random.default_rng(25).integers(-1000, 1000, 5000)
+    source, target = tmp_path / 'input.bin', tmp_path / 'output.bin'
+    data.tofile(source)
+    stats = external_sort(str(source), str(target), memory_limit=4096, fan_in=2)
+    assert np.array_equal(np.fromfile(target, dtype='<i8'), np.sort(data))
+    assert stats.records == 5000
+    assert stats.runs == 20  # 4096 / 2 / 8 = 256 записей в серии
+    assert stats.passes == 1 + 5  # ceil(log2(20)) проходов слияния
+    assert not list(tmp_path.glob('external_sort_*'))  # Временные файлы удалены
+
+
+@pytest.mark.parametrize('fan_in', [2, 3, 16])
+def test_external_sort_stable_records(tmp_path, fan_in):
+    """Тест устойчивости для записей с повторяющимися ключами"""
+    rng = np.random.default_rng(fan_in)
+    records = np.zeros(3000, dtype=RECORD)
+    records['key'] = rng.integers(0, 20, len(records))  # Много равных ключей в разных сериях
+    records['index'] = np.arange(len(records))
+    source, target = tmp_path / 'input.bin', tmp_path / 'output.bin'
+    records.tofile(source)
+    external_sort(str(source), str(target), memory_limit=2048, dtype=RECORD, key='key', fan_in=fan_in)
+
+    result = np.fromfile(target, dtype=RECORD)
+    expected = records[np.argsort(records['key'], kind='stable')]
+    assert np.array_equal(result, expected)
+
+
+def test_external_sort_sorted_and_reversed(tmp_path):
+    """Тест упорядоченного и обратного входа: блоки серий исчерпываются в разном порядке"""
+    for data in (np.arange(3000, dtype='<i8'), np.arange(3000, 0, -1, dtype='<i8'), np.full(3000, 7, dtype='<i8')):
+        source, target = tmp_path / 'input.bin', tmp_path / 'output.bin'
+        data.tofile(source)
+        external_sort(str(source), str(target), memory_limit=2048, fan_in=2)
+        assert np.array_equal(np.fromfile(target, dtype='<i8'), np.sort(data))
+
+
+def test_external_sort_empty_and_errors(tmp_path):
+    """Тест пустого файла и неверных параметров"""
+    source, target = tmp_path / 'input.bin', tmp_path / 'output.bin'
+    source.write_bytes(b'')
+    stats = external_sort(str(source), str(target))
+    assert target.read_bytes() == b''
+    assert stats.records == 0
+    with pytest.raises(ValueError):
+        external_sort(str(source), str(target), dtype=RECORD)
+    with pytest.raises(ValueError):
+        external_sort(str(source), str(target), fan_in=1)
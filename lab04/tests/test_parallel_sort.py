@@ -0,0 +1,60 @@
+"""
+Тесты для параллельной сортировки
+"""
+import numpy as np
+
+from src.parallel_sort import parallel_sort, _PARALLEL_MIN_SIZE
+
+N = _PARALLEL_MIN_SIZE + 1000
+
+
+def test_parallel_sort_int64():
+    """Тест сортировки int64 в двух процессах"""
+    data = np.random.default_rng(1).integers(-10**12, 10**12, N)
+    expected = np.sort(data)
+    assert parallel_sort(data, 2) is data
+    assert np.array_equal(data, expected)
+
+
+def test_parallel_sort_list():
+    """Тест сортировки списка на месте"""
+    data = np.random.default_rng(2).integers(0, 1000, N).tolist()
+    expected = sorted(data)
+    parallel_sort(data, 2)
+    assert data == expected
+
+
+def test_parallel_sort_int32():
+    """Тест сортировки int32: приведение к int64 без потерь"""
+    data = np.random.default_rng(3).integers(-2**31, 2**31 - 1, N, dtype=np.int32)
+    expected = np.sort(data)
+    parallel_sort(data, 2)
+    assert data.dtype == np.int32
+    assert np.array_equal(data, expected)
+
+
+def test_parallel_sort_float():
+    """Тест сортировки float: данные не должны обрезаться до целых"""
+    data = np.random.default_rng(4).random(N)
+    expected = np.sort(data)
+    parallel_sort(data, 2)
+    assert np.array_equal(data, expected)
+
+
+def test_parallel_sort_float_list():
+    """Тест сортировки списка float: значения не должны обрезаться до целых"""
+    data = [1.5, 0.2, 3.7]
+    parallel_sort(data, 2)
+    assert data == [0.2, 1.5, 3.7]
+    data = np.random.default_rng(5).random(N).tolist()
+    expected = sorted(data)
+    parallel_sort(data, 2)
+    assert data == expected
+
+
+def test_parallel_sort_wide_int_list():
+    """Тест сортировки списка с числами шире int64"""
+    data = [2**70, -5, 3, -2**65] * (N // 4)
+    expected = sorted(data)
+    parallel_sort(data, 2)
+    assert data == expected
@@ -0,0 +1,210 @@
+"""
+Тесты для сортировок lab04
+"""
+import random
+
+import pytest
+
+from src import sorts
+from src.sorts import (hybrid_sort, merge_sort_bottom_up, counting_sort, radix_sort, bucket_sort,
+                       integer_sort, _heap_sort_range, _partial_insertion_sort)
+
+SIZES = [0, 1, 2, 23, 24, 25, 127, 128, 129, 1000, 5000]
+MERGE_SIZES = [0, 1, 2, 31, 32, 33, 64, 65, 1000, 5000]
+
+
+def adversarial(n, rng):
+    """Наборы, на которых ломаются наивные быстрые сортировки"""
+    half = n // 2
+    changed = list(range(n))
+    for _ in range(min(5, n)):
+        changed[rng.randrange(n)] = rng.randrange(n)
+    return {
+        'random': [rng.randrange(n) for _ in range(n)],
+        'sorted': list(range(n)),
+        'reversed': list(range(n, 0, -1)),
+        'all_equal': [7] * n,
+        'organ_pipe': list(range(half)) + list(range(n - half, 0, -1)),
+        'sawtooth': [i % 17 for i in range(n)],
+        'few_unique': [rng.randrange(3) for _ in range(n)],
+        'sorted_perturbed_tail': list(range(n - 10)) + [rng.randrange(n) for _ in range(min(10, n))],
+        'sorted_random_changes': changed,
+        'reversed_with_duplicates': sorted((rng.randrange(n // 4 + 1) for _ in range(n)), reverse=True),
+    }
+
+
+@pytest.mark.parametrize('n', SIZES)
+def test_hybrid_sort_adversarial(n):
+    """Тест hybrid_sort на неблагоприятных наборах разных размеров"""
+    rng = random.Random(n)
+    for name, data in adversarial(n, rng).items():
+        expected = sorted(data)
+        result = hybrid_sort(data)
+        assert result is data, name
+        assert data == expected, name
+
+
+def test_hybrid_sort_random_large():
+    """Тест hybrid_sort на случайных массивах с отрицательными и повторяющимися значениями"""
+    rng = random.Random(21)
+    for _ in range(20):
+        n = rng.randrange(2000, 6000)
+        data = [rng.randrange(-n, n) for _ in range(n)]
+        expected = sorted(data)
+        assert hybrid_sort(data) == expected
+
+
+def test_hybrid_sort_floats_and_strings():
+    """Тест hybrid_sort на сравнимых нецелых значениях"""
+    rng = random.Random(3)
+    floats = [rng.random() for _ in range(3000)]
+    words = [str(rng.randrange(10**6)) for _ in range(3000)]
+    assert hybrid_sort(list(floats)) == sorted(floats)
+    assert hybrid_sort(list(words)) == sorted(words)
+
+
+def test_heap_sort_range():
+    """Тест запасной пирамидальной сортировки на части массива"""
+    rng = random.Random(5)
+    for n in (1, 2, 3, 100, 3000):
+        data = [rng.randrange(100) for _ in range(n + 20)]
+        lo, hi = 10, 10 + n
+        expected = data[:lo] + sorted(data[lo:hi]) + data[hi:]
+        _heap_sort_range(data, lo, hi)
+        assert data == expected
+
+
+def test_partial_insertion_sort():
+    """Тест ограниченных вставок: почти упорядоченная часть досортировывается, иначе - отказ"""
+    data = list(range(1000))
+    data[100], data[101] = data[101], data[100]
+    assert _partial_insertion_sort(data, 0, 1000)
+    assert data == list(range(1000))
+
+    data = list(range(1000, 0, -1))
+    assert not _partial_insertion_sort(data, 0, 1000)
+    assert sorted(data) == list(range(1, 1001))
+
+
+class Keyed:
+    """Значение, сравниваемое только по ключу: индекс проверяет устойчивость"""
+
+    def __init__(self, key, index):
+        self.key = key
+        self.index = index
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def assert_stable(items, n):
+    assert [item[0] for item in items] == sorted(item[0] for item in items)
+    for a, b in zip(items, items[1:]):
+        if a[0] == b[0]:
+            assert a[1] < b[1]
+    assert sorted(item[1] for item in items) == list(range(n))
+
+
+@pytest.mark.parametrize('n', MERGE_SIZES)
+def test_merge_sort_bottom_up(n):
+    """Тест восходящей сортировки слиянием на неблагоприятных наборах"""
+    rng = random.Random(n)
+    for name, data in adversarial(n, rng).items():
+        expected = sorted(data)
+        result = merge_sort_bottom_up(data)
+        assert result is data, name
+        assert data == expected, name
+
+
+@pytest.mark.parametrize('n', MERGE_SIZES)
+def test_merge_sort_bottom_up_stable(n):
+    """Тест устойчивости без key: равные элементы сохраняют исходный порядок"""
+    rng = random.Random(n)
+    data = [Keyed(rng.randrange(5), i) for i in range(n)]
+    merge_sort_bottom_up(data)
+    assert_stable([(item.key, item.index) for item in data], n)
+
+
+@pytest.mark.parametrize('n', MERGE_SIZES)
+def test_merge_sort_bottom_up_key_stable(n):
+    """Тест устойчивости с key на кортежах (ключ, индекс)"""
+    rng = random.Random(n)
+    data = [(rng.randrange(5), i) for i in range(n)]
+    calls = []
+
+    def key(item):
+        calls.append(item)
+        return item[0]
+
+    assert merge_sort_bottom_up(data, key=key) is data
+    assert_stable(data, n)
+    assert len(calls) == (n if n > 1 else 0)  # key вычисляется один раз на элемент
+
+    reverse_sorted = [(k, i) for i, k in enumerate(sorted((rng.randrange(5) for _ in range(n)), reverse=True))]
+    merge_sort_bottom_up(reverse_sorted, key=lambda item: item[0])
+    assert_stable(reverse_sorted, n)
+
+
+INTEGER_SORTS = [counting_sort, radix_sort, bucket_sort, integer_sort]
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'lists'])
+def numpy_mode(request, monkeypatch):
+    """Запуск теста с NumPy (если установлен) и с отключенным NumPy"""
+    if not request.param:
+        monkeypatch.setattr(sorts, 'np', None)
+    return request.param
+
+
+def integer_inputs(rng):
+    n = 3000  # Больше _NUMPY_MIN_SIZE: с NumPy работают векторные ветви
+    return {
+        'small_range': [rng.randrange(100) for _ in range(n)],
+        'negative': [rng.randrange(-5000, 5000) for _ in range(n)],
+        'wide': [rng.randrange(-2**40, 2**40) for _ in range(n)],
+        'int64_limits': [rng.choice([-2**63, 2**63 - 1, 0, rng.randrange(-2**63, 2**63)]) for _ in range(n)],
+        'wider_than_int64': [rng.randrange(-2**70, 2**70) for _ in range(n)],
+        'all_equal': [-3] * n,
+        'short': [5, -1, 2**65, 0, -2**65, 5],
+    }
+
+
+@pytest.mark.parametrize('sort', INTEGER_SORTS, ids=lambda sort: sort.__name__)
+def test_integer_sorts(sort, numpy_mode):
+    """Тест сортировок без сравнений: отрицательные, широкие и выходящие за int64 значения"""
+    rng = random.Random(23)
+    for name, data in integer_inputs(rng).items():
+        if sort is counting_sort and name in ('wide', 'int64_limits', 'wider_than_int64', 'short'):
+            continue  # Массив счетчиков на весь диапазон не поместится в память
+        expected = sorted(data)
+        assert sort(data) is data, name
+        assert data == expected, name
+
+
+@pytest.mark.parametrize('sort', INTEGER_SORTS, ids=lambda sort: sort.__name__)
+def test_integer_sorts_small_inputs(sort):
+    """Тест пустого и одноэлементного входа"""
+    assert sort([]) == []
+    assert sort([42]) == [42]
+
+
+@pytest.mark.parametrize('sort', [counting_sort, radix_sort, bucket_sort], ids=lambda sort: sort.__name__)
+def test_integer_sorts_reject_non_integers(sort):
+    """Тест: сортировки без сравнений принимают только целые числа"""
+    with pytest.raises(TypeError):
+        sort([1, 2.5, 3])
+
+
+def test_integer_sort_fallback_and_selection(numpy_mode, monkeypatch):
+    """Тест выбора в integer_sort: нецелые данные и широкий диапазон с выбросом"""
+    data = [3.5, -1.0, 2.25]
+    assert integer_sort(data) == [-1.0, 2.25, 3.5]
+
+    def no_bucket_sort(arr, bucket_count=None):
+        raise AssertionError("integer_sort не должна выбирать блочную сортировку")
+
+    monkeypatch.setattr(sorts, 'bucket_sort', no_bucket_sort)
+    rng = random.Random(4)
+    data = [rng.randrange(10**6) for _ in range(2000)] + [2**40]
+    expected = sorted(data)
+    assert integer_sort(data) == expected
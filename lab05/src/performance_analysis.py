@@ -2,11 +2,14 @@
 Модуль для анализа производительности хеш-таблиц.
 """
 
-import time
 import matplotlib.pyplot as plt
-from typing import List, Dict
+from typing import Callable, List, Dict
 import random
 import string
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.benchmark import benchmark
 
 from hash_table_chaining import HashTableChaining
 from hash_table_open_addressing import HashTableOpenAddressing
@@ -15,6 +18,22 @@ def generate_random_string(length: int = 10) -> str:
     """Генерация случайной строки."""
     return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
 
+def insert_keys(table, keys: List[str]) -> None:
+    """Вставка всех ключей в таблицу."""
+    for i, key in enumerate(keys):
+        table.insert(key, i)
+
+def measure_insert_time(make_table: Callable, num_operations: int) -> float:
+    """
+    Медианное время вставки num_operations случайных ключей в новую таблицу.
+    Таблица и ключи создаются заново перед каждым повтором вне измеряемого участка.
+    """
+    result = benchmark(
+        insert_keys,
+        setup=lambda: (make_table(), [generate_random_string() for _ in range(num_operations)])
+    )
+    return result.median
+
 def analyze_insert_performance() -> Dict[str, List[float]]:
     """
     Анализ производительности операций вставки для разных коэффициентов заполнения.
@@ -30,28 +49,19 @@ def analyze_insert_performance() -> Dict[str, List[float]]:
     
     for lf in load_factors:
         # Тестирование метода цепочек
-        start_time = time.time()
-        ht_chain = HashTableChaining(load_factor=0.9)  # Высокий load factor для тестирования
-        for i in range(num_operations):
-            key = generate_random_string()
-            ht_chain.insert(key, i)
-        results['chaining'].append(time.time() - start_time)
+        results['chaining'].append(measure_insert_time(
+            lambda: HashTableChaining(load_factor=0.9),  # Высокий load factor для тестирования
+            num_operations))
         
         # Тестирование линейного пробирования
-        start_time = time.time()
-        ht_linear = HashTableOpenAddressing(probing_method='linear', load_factor=lf)
-        for i in range(num_operations):
-            key = generate_random_string()
-            ht_linear.insert(key, i)
-        results['linear_probing'].append(time.time() - start_time)
+        results['linear_probing'].append(measure_insert_time(
+            lambda: HashTableOpenAddressing(probing_method='linear', load_factor=lf),
+            num_operations))
         
         # Тестирование двойного хеширования
-        start_time = time.time()
-        ht_double = HashTableOpenAddressing(probing_method='double', load_factor=lf)
-        for i in range(num_operations):
-            key = generate_random_string()
-            ht_double.insert(key, i)
-        results['double_hashing'].append(time.time() - start_time)
+        results['double_hashing'].append(measure_insert_time(
+            lambda: HashTableOpenAddressing(probing_method='double', load_factor=lf),
+            num_operations))
     
     return results
 
@@ -1,8 +1,10 @@
 import time
 import random
+import tracemalloc
 import matplotlib.pyplot as plt
 from typing import List, Tuple, Optional
-from binary_search_tree import BinarySearchTree, TreeNode
+from binary_search_tree import BinarySearchTree, TreeNode, ArrayBinarySearchTree
+from tree_traversal import iterative_inorder
 import os
 import math
 
@@ -120,6 +122,52 @@ def plot_time_complexity(sizes: List[int], balanced_times: List[float], degenera
     plt.savefig('pics/time_vs_elements.png')
     plt.close()
 
+def compare_array_tree(size: int = 10**6, searches: int = 100000):
+    """Сравнение дерева из TreeNode и ArrayBinarySearchTree: память на узел, поиск, высота, обход"""
+    elements = list(range(size))
+    tracemalloc.start()
+    root = generate_balanced_tree(elements)
+    node_bytes = tracemalloc.get_traced_memory()[0]
+    array_tree = ArrayBinarySearchTree.from_nodes(root)
+    array_bytes = tracemalloc.get_traced_memory()[0] - node_bytes
+    tracemalloc.stop()
+
+    bst = BinarySearchTree()
+    targets = [random.choice(elements) for _ in range(searches)]
+    operations = [
+        ('Поиск', lambda: [bst.search_iterative(root, t) for t in targets],
+         lambda: [array_tree.search(t) for t in targets]),
+        ('Высота', lambda: bst.height_iterative(root), array_tree.height),
+        ('In-order обход', lambda: iterative_inorder(root), array_tree.inorder),
+    ]
+    print(f"\nTreeNode и ArrayBinarySearchTree, {size} узлов:")
+    print(f"Память: {node_bytes / size:.1f} и {array_bytes / size:.1f} байт/узел")
+    for name, run_nodes, run_array in operations:
+        start_time = time.perf_counter()
+        run_nodes()
+        nodes_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        run_array()
+        array_time = time.perf_counter() - start_time
+        print(f"{name}: {nodes_time:.4f}s и {array_time:.4f}s")
+
+def compare_cached_aggregates(size: int = 10**5, queries: int = 20):
+    """Вставка и запросы размера/высоты/суммы: обычное дерево и дерево с кэшем агрегатов"""
+    elements = random.sample(range(size * 10), size)
+    print(f"\nАгрегаты поддерева, {size} элементов, {queries} запросов:")
+    for name, bst in (('Без кэша', BinarySearchTree()), ('С кэшем', BinarySearchTree(augmented=True))):
+        root = None
+        start_time = time.perf_counter()
+        for elem in elements:
+            root = bst.insert_iterative(root, elem)
+        insert_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for _ in range(queries):
+            bst.size(root), bst.height(root), bst.subtree_sum(root)
+        query_time = time.perf_counter() - start_time
+        print(f"{name}: вставка {insert_time:.4f}s, запросы {query_time:.4f}s")
+
 def main():
     """Основная функция анализа"""
     print("Анализ производительности BST...")
@@ -151,5 +199,8 @@ def main():
     print(f"Максимальный элемент: {bst.find_max_iterative(root).value}")
     print(f"Является корректным BST: {bst.is_valid_bst_iterative(root)}")
 
+    compare_array_tree()
+    compare_cached_aggregates()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
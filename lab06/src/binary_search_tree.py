@@ -1,4 +1,5 @@
-from typing import Optional, List
+from array import array
+from typing import Optional, List, Tuple
 
 class TreeNode:
     """Узел бинарного дерева поиска"""
@@ -7,23 +8,52 @@ class TreeNode:
         self.left: Optional['TreeNode'] = None
         self.right: Optional['TreeNode'] = None
 
+class AugmentedTreeNode(TreeNode):
+    """Узел BST с кэшем агрегатов поддерева: размер, высота и сумма значений"""
+    def __init__(self, value: int):
+        super().__init__(value)
+        self.size = 1
+        self.height = 1
+        self.total = value
+
+    def update(self) -> None:
+        """Пересчет кэша по кэшам потомков. Сложность: O(1)"""
+        left, right = self.left, self.right
+        self.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+        self.height = 1 + max(left.height if left else 0, right.height if right else 0)
+        self.total = self.value + (left.total if left else 0) + (right.total if right else 0)
+
 class BinarySearchTree:
     """Реализация бинарного дерева поиска"""
+
+    def __init__(self, augmented: bool = False):
+        """
+        augmented=True: вставка создает AugmentedTreeNode, а вставка и удаление
+        обновляют кэш агрегатов на пути от корня, и запросы size/height/subtree_sum
+        выполняются за O(1).
+        """
+        self.augmented = augmented
     
     def insert_iterative(self, root: Optional[TreeNode], value: int) -> TreeNode:
         """
         Итеративная вставка элемента в BST.
         Сложность: O(h) в худшем случае, O(log n) в среднем для сбалансированного дерева
         """
-        new_node = TreeNode(value)
+        new_node = AugmentedTreeNode(value) if self.augmented else TreeNode(value)
         if root is None:
             return new_node
             
         current = root
         parent = None
+        path = []
         
         while current:
             parent = current
+            if self.augmented:
+                # Размер и сумма меняются на всем пути одинаково - сразу при спуске
+                current.size += 1
+                current.total += value
+                path.append(current)
             if value < current.value:
                 current = current.left
             else:
@@ -33,9 +63,120 @@ class BinarySearchTree:
             parent.left = new_node
         else:
             parent.right = new_node
+
+        # Высота пересчитывается снизу вверх, пока она меняется
+        height = 1
+        for node in reversed(path):
+            if node.height > height:
+                break
+            node.height = height + 1
+            height += 1
             
         return root
 
+    def delete_iterative(self, root: Optional[TreeNode], value: int) -> Optional[TreeNode]:
+        """
+        Итеративное удаление одного элемента из BST (узел с двумя потомками
+        заменяется значением преемника). Возвращает новый корень.
+        Сложность: O(h) в худшем случае, O(log n) в среднем для сбалансированного дерева
+        """
+        path = []
+        current = root
+        while current and current.value != value:
+            path.append(current)
+            current = current.left if value < current.value else current.right
+        if current is None:
+            return root
+
+        if current.left and current.right:
+            # Значение преемника переносится в узел, удаляется сам преемник
+            path.append(current)
+            successor = current.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            current.value = successor.value
+            current = successor
+
+        child = current.left if current.left else current.right
+        parent = path[-1] if path else None
+        if parent is None:
+            root = child
+        elif parent.left is current:
+            parent.left = child
+        else:
+            parent.right = child
+
+        if self.augmented:
+            for node in reversed(path):
+                node.update()
+        return root
+
+    def size(self, root: Optional[TreeNode]) -> int:
+        """
+        Количество узлов поддерева: из кэша за O(1) или обходом за O(n)
+        """
+        if root is None:
+            return 0
+        if isinstance(root, AugmentedTreeNode):
+            return root.size
+        count, stack = 0, [root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(child for child in (node.left, node.right) if child)
+        return count
+
+    def height(self, root: Optional[TreeNode]) -> int:
+        """
+        Высота поддерева: из кэша за O(1) или через height_iterative за O(n)
+        """
+        if isinstance(root, AugmentedTreeNode):
+            return root.height
+        return self.height_iterative(root)
+
+    def subtree_sum(self, root: Optional[TreeNode]) -> int:
+        """
+        Сумма значений поддерева: из кэша за O(1) или обходом за O(n)
+        """
+        if root is None:
+            return 0
+        if isinstance(root, AugmentedTreeNode):
+            return root.total
+        total, stack = 0, [root]
+        while stack:
+            node = stack.pop()
+            total += node.value
+            stack.extend(child for child in (node.left, node.right) if child)
+        return total
+
+    def check_augmented(self, root: Optional[TreeNode]) -> bool:
+        """
+        Проверка кэша агрегатов: все узлы - AugmentedTreeNode, и size/height/total
+        совпадают с пересчитанными заново (итеративный post-order).
+        Сложность: O(n)
+        """
+        if root is None:
+            return True
+        empty = (0, 0, 0)
+        actual = {}  # Проверенный узел -> (размер, высота, сумма)
+        stack = [(root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not isinstance(node, AugmentedTreeNode):
+                return False
+            if not children_done:
+                stack.append((node, True))
+                stack.extend((child, False) for child in (node.left, node.right) if child)
+                continue
+            left = actual.pop(node.left) if node.left else empty
+            right = actual.pop(node.right) if node.right else empty
+            expected = (1 + left[0] + right[0], 1 + max(left[1], right[1]), node.value + left[2] + right[2])
+            if (node.size, node.height, node.total) != expected:
+                return False
+            actual[node] = expected
+        return True
+
     def search_iterative(self, root: Optional[TreeNode], value: int) -> Optional[TreeNode]:
         """
         Итеративный поиск элемента в BST.
@@ -134,4 +275,114 @@ class BinarySearchTree:
                     lines.extend(self.print_tree(root.right, level + 1, "R--- "))
                 else:
                     lines.append(" " * ((level + 1) * 4) + "R--- None")
-        return lines
\ No newline at end of file
+        return lines
+
+NIL = -1  # Отсутствующий потомок в ArrayBinarySearchTree
+
+class ArrayBinarySearchTree:
+    """
+    Дерево поиска в трех параллельных массивах array('q'): values, left, right
+    (индексы потомков, NIL - нет потомка). Узлы лежат в порядке прямого обхода,
+    корень - узел 0, поэтому потомки всегда правее родителя.
+    24 байта на узел вместо объекта TreeNode.
+    Та же схема, что у ArrayTree из лабораторной 3, но лабораторные
+    самодостаточны и друг от друга не импортируются.
+    """
+
+    def __init__(self) -> None:
+        self.values = array('q')
+        self.left = array('q')
+        self.right = array('q')
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @classmethod
+    def from_nodes(cls, root: Optional[TreeNode]) -> 'ArrayBinarySearchTree':
+        """
+        Построение из дерева TreeNode (итеративно).
+        Сложность: O(n)
+        """
+        tree = cls()
+        stack = [(root, NIL, False)] if root is not None else []
+        while stack:
+            node, parent, is_right = stack.pop()
+            index = len(tree.values)
+            tree.values.append(node.value)
+            tree.left.append(NIL)
+            tree.right.append(NIL)
+            if parent != NIL:
+                (tree.right if is_right else tree.left)[parent] = index
+            if node.right is not None:
+                stack.append((node.right, index, True))
+            if node.left is not None:
+                stack.append((node.left, index, False))
+        return tree
+
+    def to_nodes(self) -> Optional[TreeNode]:
+        """
+        Обратное преобразование в дерево TreeNode.
+        Сложность: O(n)
+        """
+        nodes = [TreeNode(value) for value in self.values]
+        for node, left, right in zip(nodes, self.left, self.right):
+            if left != NIL:
+                node.left = nodes[left]
+            if right != NIL:
+                node.right = nodes[right]
+        return nodes[0] if nodes else None
+
+    def search(self, value: int) -> int:
+        """
+        Поиск элемента, возвращает индекс узла или NIL.
+        Сложность: O(h)
+        """
+        values, left, right = self.values, self.left, self.right
+        current = 0 if values else NIL
+        while current != NIL:
+            current_value = values[current]
+            if value == current_value:
+                return current
+            current = left[current] if value < current_value else right[current]
+        return current
+
+    def __contains__(self, value: int) -> bool:
+        return self.search(value) != NIL
+
+    def inorder(self) -> List[int]:
+        """
+        Итеративный in-order обход со стеком индексов.
+        Сложность: O(n)
+        """
+        result = []
+        stack = []
+        current = 0 if self.values else NIL
+        while current != NIL or stack:
+            while current != NIL:
+                stack.append(current)
+                current = self.left[current]
+            current = stack.pop()
+            result.append(self.values[current])
+            current = self.right[current]
+        return result
+
+    def aggregates(self) -> Tuple[int, int, int]:
+        """
+        Количество узлов, высота и сумма значений за один проход справа налево:
+        высоты поддеревьев потомков к этому моменту уже посчитаны.
+        Сложность: O(n)
+        """
+        n = len(self.values)
+        heights = [0] * (n + 1)  # heights[NIL] - высота пустого поддерева
+        total = 0
+        for i in range(n - 1, -1, -1):
+            heights[i] = 1 + max(heights[self.left[i]], heights[self.right[i]])
+            total += self.values[i]
+        return n, heights[0] if n else 0, total
+
+    def height(self) -> int:
+        """
+        Высота дерева (один проход по массивам).
+        Сложность: O(n)
+        """
+        return self.aggregates()[1]
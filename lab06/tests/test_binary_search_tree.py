@@ -0,0 +1,106 @@
+"""
+Тесты для бинарного дерева поиска
+"""
+import random
+
+from src.binary_search_tree import BinarySearchTree, AugmentedTreeNode, ArrayBinarySearchTree, TreeNode, NIL
+
+
+def naive_aggregates(node):
+    """Размер, высота и сумма поддерева, пересчитанные рекурсивно без кэша"""
+    if node is None:
+        return 0, 0, 0
+    left = naive_aggregates(node.left)
+    right = naive_aggregates(node.right)
+    return 1 + left[0] + right[0], 1 + max(left[1], right[1]), node.value + left[2] + right[2]
+
+
+def all_nodes(root):
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(child for child in (node.left, node.right) if child)
+
+
+def test_augmented_random_operations():
+    """Тест кэша агрегатов на случайных последовательностях вставок и удалений"""
+    rng = random.Random(6)
+    for _ in range(20):
+        bst = BinarySearchTree(augmented=True)
+        root = None
+        values = []
+        for _ in range(300):
+            if values and rng.random() < 0.4:
+                value = rng.choice(values)
+                values.remove(value)
+                root = bst.delete_iterative(root, value)
+            else:
+                value = rng.randrange(100)  # Повторы тоже проверяются
+                values.append(value)
+                root = bst.insert_iterative(root, value)
+            assert bst.check_augmented(root)
+            assert (bst.size(root), bst.height(root), bst.subtree_sum(root)) == naive_aggregates(root)
+            assert bst.size(root) == len(values)
+            assert bst.subtree_sum(root) == sum(values)
+        for node in all_nodes(root):
+            assert (node.size, node.height, node.total) == naive_aggregates(node)
+
+
+def test_delete_missing_value():
+    """Тест удаления отсутствующего значения: дерево и кэш не меняются"""
+    bst = BinarySearchTree(augmented=True)
+    root = None
+    for value in (5, 3, 8):
+        root = bst.insert_iterative(root, value)
+    root = bst.delete_iterative(root, 7)
+    assert bst.check_augmented(root)
+    assert (bst.size(root), bst.height(root), bst.subtree_sum(root)) == (3, 2, 16)
+
+
+def test_check_augmented_detects_stale_cache():
+    """Тест: check_augmented находит устаревший кэш и обычные узлы"""
+    bst = BinarySearchTree(augmented=True)
+    root = None
+    for value in (5, 3, 8, 1):
+        root = bst.insert_iterative(root, value)
+    assert isinstance(root, AugmentedTreeNode)
+    root.left.total += 1
+    assert not bst.check_augmented(root)
+    root.left.total -= 1
+    assert bst.check_augmented(root)
+
+    plain = BinarySearchTree()
+    plain_root = plain.insert_iterative(None, 1)
+    assert not bst.check_augmented(plain_root)
+    assert bst.check_augmented(None)
+
+
+def test_plain_tree_aggregates():
+    """Тест агрегатов обходом для дерева без кэша"""
+    bst = BinarySearchTree()
+    root = None
+    for value in (5, 3, 8, 1, 4):
+        root = bst.insert_iterative(root, value)
+    assert (bst.size(root), bst.height(root), bst.subtree_sum(root)) == naive_aggregates(root)
+
+
+def test_array_tree_search():
+    """Тест ArrayBinarySearchTree: поиск, обход и обратное преобразование"""
+    bst = BinarySearchTree()
+    root = None
+    values = random.Random(15).sample(range(1000), 200)
+    for value in values:
+        root = bst.insert_iterative(root, value)
+    tree = ArrayBinarySearchTree.from_nodes(root)
+    assert len(tree) == 200
+    assert tree.inorder() == sorted(values)
+    assert tree.aggregates() == (200, bst.height(root), sum(values))
+    for value in values:
+        assert tree.values[tree.search(value)] == value
+        assert value in tree
+    assert tree.search(1000) == NIL and -1 not in tree
+    nodes = tree.to_nodes()
+    assert isinstance(nodes, TreeNode)
+    assert bst.is_valid_bst_iterative(nodes)
+    assert ArrayBinarySearchTree.from_nodes(None).search(1) == NIL
@@ -1,15 +1,40 @@
-import time
 import random
 import matplotlib.pyplot as plt
-from typing import List, Callable
+from typing import Any, List, Callable
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.benchmark import benchmark
+from common.results_store import ResultsStore
 from heap import MinHeap
 from heapsort import heapsort, heapsort_inplace
 
-def measure_time(func: Callable, *args) -> float:
-    """Измерение времени выполнения функции"""
-    start = time.perf_counter()
-    func(*args)
-    return time.perf_counter() - start
+results_store = ResultsStore(lab='lab07')
+
+def measure_time(func: Callable, *args, setup: Callable = None, name: str = None, size: int = None) -> float:
+    """
+    Медианное время выполнения функции (setup готовит свежие аргументы к каждому повтору).
+    Распределение времени сохраняется в хранилище результатов.
+    """
+    result = benchmark(func, *args, setup=setup, name=name)
+    results_store.record(result, family='random', size=size)
+    return result.median
+
+def insert_all(heap: MinHeap, data: List[Any]) -> None:
+    """Последовательная вставка элементов в кучу"""
+    for x in data:
+        heap.insert(x)
+
+def extract_all(heap: MinHeap) -> None:
+    """Извлечение всех элементов из кучи"""
+    while len(heap) > 0:
+        heap.extract_min()
+
+def filled_heap(data: List[Any]) -> MinHeap:
+    """Куча, заполненная элементами data"""
+    heap = MinHeap()
+    heap.build_heap(data)
+    return heap
 
 def analyze_heap_operations() -> None:
     """Анализ производительности операций кучи"""
@@ -18,19 +43,15 @@ def analyze_heap_operations() -> None:
     extract_times = []
     
     for size in sizes:
-        heap = MinHeap()
+        data = [random.randint(1, 10000) for _ in range(size)]
         
         # Измерение времени вставки
-        start = time.perf_counter()
-        for i in range(size):
-            heap.insert(random.randint(1, 10000))
-        insert_times.append(time.perf_counter() - start)
+        insert_times.append(measure_time(insert_all, setup=lambda: (MinHeap(), data),
+                                         name='heap_insert', size=size))
         
         # Измерение времени извлечения
-        start = time.perf_counter()
-        while len(heap) > 0:
-            heap.extract_min()
-        extract_times.append(time.perf_counter() - start)
+        extract_times.append(measure_time(extract_all, setup=lambda: (filled_heap(data),),
+                                          name='heap_extract_min', size=size))
     
     # Построение графика
     plt.figure(figsize=(10, 6))
@@ -54,12 +75,12 @@ def compare_heap_build_methods() -> None:
         data = [random.randint(1, 10000) for _ in range(size)]
         
         # Последовательная вставка
-        heap = MinHeap()
-        sequential_times.append(measure_time(lambda: [heap.insert(x) for x in data]))
+        sequential_times.append(measure_time(insert_all, setup=lambda: (MinHeap(), data),
+                                             name='sequential_insert', size=size))
         
         # Построение кучи из массива
-        heap = MinHeap()
-        build_heap_times.append(measure_time(heap.build_heap, data))
+        build_heap_times.append(measure_time(lambda heap: heap.build_heap(data), setup=lambda: (MinHeap(),),
+                                             name='build_heap', size=size))
     
     # Построение графика
     plt.figure(figsize=(10, 6))
@@ -84,14 +105,13 @@ def compare_sorting_algorithms() -> None:
         data = [random.randint(1, 10000) for _ in range(size)]
         
         # Heapsort
-        heapsort_times.append(measure_time(heapsort, data.copy()))
+        heapsort_times.append(measure_time(heapsort, data, size=size))
         
-        # In-place Heapsort
-        data_copy = data.copy()
-        heapsort_inplace_times.append(measure_time(heapsort_inplace, data_copy))
+        # In-place Heapsort (сортирует вход, поэтому копия к каждому повтору)
+        heapsort_inplace_times.append(measure_time(heapsort_inplace, setup=lambda: (data.copy(),), size=size))
         
         # Built-in sort
-        builtin_sort_times.append(measure_time(sorted, data.copy()))
+        builtin_sort_times.append(measure_time(sorted, data, size=size))
     
     # Построение графика
     plt.figure(figsize=(10, 6))
@@ -113,4 +133,5 @@ if __name__ == "__main__":
     analyze_heap_operations()
     compare_heap_build_methods()
     compare_sorting_algorithms()
-    print("Графики сохранены в папке pics/")
\ No newline at end of file
+    print("Графики сохранены в папке pics/")
+    print(f"Результаты сохранены в {results_store.path} (run_id {results_store.run_id})")
\ No newline at end of file
@@ -2,37 +2,45 @@
 Сравнительный анализ алгоритмов ДП
 """
 
+import os
+import random
+import sys
 import time
 import matplotlib.pyplot as plt
 from typing import List, Tuple
-from dynamic_programming import fibonacci_memo, fibonacci_tabular, knapsack_01
+from dynamic_programming import (fibonacci_memo, fibonacci_tabular, fibonacci_fast_doubling,
+                                 fibonacci_matrix, fibonacci_batch, knapsack_01)
 
-def compare_fibonacci() -> Tuple[List[float], List[float]]:
-    """Сравнение времени выполнения нисходящего и восходящего подходов для Фибоначчи."""
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.benchmark import benchmark
+
+def compare_fibonacci() -> Tuple[List[float], List[float], List[float], List[int]]:
+    """Сравнение времени выполнения нисходящего, восходящего подходов и быстрого удвоения для Фибоначчи."""
     sizes = list(range(1, 101, 5))
     times_memo = []
     times_tabular = []
+    times_doubling = []
     
     for n in sizes:
         # Нисходящий подход
-        start = time.time()
-        fibonacci_memo(n)
-        times_memo.append(time.time() - start)
+        times_memo.append(benchmark(fibonacci_memo, n, number=100).median)
         
         # Восходящий подход  
-        start = time.time()
-        fibonacci_tabular(n)
-        times_tabular.append(time.time() - start)
+        times_tabular.append(benchmark(fibonacci_tabular, n, number=100).median)
+
+        # Быстрое удвоение, O(log n)
+        times_doubling.append(benchmark(fibonacci_fast_doubling, n, number=100).median)
     
-    return times_memo, times_tabular, sizes
+    return times_memo, times_tabular, times_doubling, sizes
 
 def plot_fibonacci_comparison() -> None:
     """Построение графика сравнения времени выполнения для Фибоначчи."""
-    times_memo, times_tabular, sizes = compare_fibonacci()
+    times_memo, times_tabular, times_doubling, sizes = compare_fibonacci()
     
     plt.figure(figsize=(10, 6))
     plt.plot(sizes, times_memo, label='Нисходящий (мемоизация)', marker='o')
     plt.plot(sizes, times_tabular, label='Восходящий (табличный)', marker='s')
+    plt.plot(sizes, times_doubling, label='Быстрое удвоение', marker='^')
     plt.xlabel('n')
     plt.ylabel('Время (секунды)')
     plt.title('Сравнение времени выполнения для чисел Фибоначчи')
@@ -41,6 +49,33 @@ def plot_fibonacci_comparison() -> None:
     plt.savefig('pics/fibonacci_comparison.png')
     plt.close()
 
+def fibonacci_scalability() -> dict:
+    """Время вычисления F(n) для больших n: точное значение и по модулю 10^9 + 7."""
+    sizes = [10**3, 10**4, 3 * 10**4, 10**5, 10**6, 10**7]
+    limits = {'Восходящий (табличный)': 3 * 10**4,  # Таблица из n больших чисел
+              'Матричный': 10**6}
+    algorithms = [('Восходящий (табличный)', fibonacci_tabular),
+                  ('Матричный', fibonacci_matrix),
+                  ('Быстрое удвоение', fibonacci_fast_doubling)]
+    timings = {}
+    for name, func in algorithms:
+        points = [n for n in sizes if n <= limits.get(name, sizes[-1])]
+        timings[name] = (points, [benchmark(func, n, repeat=3 if n < 10**6 else 1, warmup=0).median
+                                  for n in points])
+
+    # F(n) mod m для n ~ 10^18: по одному и пакетом
+    mod = 10**9 + 7
+    rng = random.Random(0)
+    batch_sizes = [10, 100, 1000, 10000, 100000]
+    single, batch = [], []
+    for count in batch_sizes:
+        ns = [rng.randrange(10**18) for _ in range(count)]
+        single.append(benchmark(lambda: [fibonacci_fast_doubling(n, mod) for n in ns], repeat=3).median)
+        batch.append(benchmark(fibonacci_batch, ns, mod, repeat=3).median)
+    timings['mod: по одному'] = (batch_sizes, single)
+    timings['mod: fibonacci_batch'] = (batch_sizes, batch)
+    return timings
+
 def scalability_analysis() -> None:
     """Анализ масштабируемости алгоритмов ДП."""
     capacities = [10, 20, 50, 100, 200]
@@ -50,19 +85,36 @@ def scalability_analysis() -> None:
         weights = list(range(1, capacity // 2 + 1))
         values = [w * 2 for w in weights]
         
-        start = time.time()
+        start = time.perf_counter()
         knapsack_01(weights, values, capacity)
-        times_knapsack.append(time.time() - start)
+        times_knapsack.append(time.perf_counter() - start)
+
+    timings = fibonacci_scalability()
     
-    plt.figure(figsize=(10, 6))
-    plt.plot(capacities, times_knapsack, label='Задача о рюкзаке', marker='o')
-    plt.xlabel('Вместимость рюкзака')
-    plt.ylabel('Время (секунды)')
-    plt.title('Масштабируемость алгоритма рюкзака')
-    plt.legend()
-    plt.grid(True)
-    plt.savefig('pics/scalability_analysis.png')
-    plt.close()
+    fig, (ax_knapsack, ax_fib, ax_mod) = plt.subplots(1, 3, figsize=(18, 6))
+    ax_knapsack.plot(capacities, times_knapsack, label='Задача о рюкзаке', marker='o')
+    ax_knapsack.set_xlabel('Вместимость рюкзака')
+    ax_knapsack.set_ylabel('Время (секунды)')
+    ax_knapsack.set_title('Масштабируемость алгоритма рюкзака')
+
+    for name in ('Восходящий (табличный)', 'Матричный', 'Быстрое удвоение'):
+        ax_fib.loglog(*timings[name], label=name, marker='o')
+    ax_fib.set_xlabel('n')
+    ax_fib.set_ylabel('Время (секунды)')
+    ax_fib.set_title('Точное F(n)')
+
+    for name in ('mod: по одному', 'mod: fibonacci_batch'):
+        ax_mod.loglog(*timings[name], label=name, marker='o')
+    ax_mod.set_xlabel('Количество запросов n ~ 10^18')
+    ax_mod.set_ylabel('Время (секунды)')
+    ax_mod.set_title('F(n) mod 10^9 + 7')
+
+    for ax in (ax_knapsack, ax_fib, ax_mod):
+        ax.legend()
+        ax.grid(True)
+    fig.tight_layout()
+    fig.savefig('pics/scalability_analysis.png')
+    plt.close(fig)
 
 if __name__ == "__main__":
     plot_fibonacci_comparison()
@@ -2,7 +2,9 @@
 Реализация алгоритмов динамического программирования
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional
+
+import numpy as np
 
 def fibonacci_naive(n: int) -> int:
     """Наивная рекурсивная реализация Фибоначчи. Сложность O(2^n)."""
@@ -31,6 +33,81 @@ def fibonacci_tabular(n: int) -> int:
         dp[i] = dp[i-1] + dp[i-2]
     return dp[n]
 
+def fibonacci_fast_doubling(n: int, mod: Optional[int] = None) -> int:
+    """
+    Фибоначчи быстрым удвоением по битам n от старшего к младшему, без таблицы.
+    Сложность O(log n) умножений, при mod - O(log n) операций над числами меньше mod.
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    if mod is not None:
+        # F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+        a, b = 0, 1 % mod
+        for bit in bin(n)[2:]:
+            c = a * (2 * b - a) % mod
+            d = (a * a + b * b) % mod
+            a, b = (d, (c + d) % mod) if bit == '1' else (c, d)
+        return a
+    if n == 0:
+        return 0
+
+    # Для больших чисел через числа Люка: F(2k) = F(k)L(k), L(2k) = L(k)^2 - 2(-1)^k -
+    # одно умножение и один квадрат на бит вместо трех умножений
+    f, l, sign = 0, 2, 1  # F(k), L(k), (-1)^k
+    bits = bin(n)[2:]
+    for bit in bits[:-1]:
+        f, l = f * l, l * l - 2 * sign
+        sign = 1
+        if bit == '1':
+            f, l = (f + l) >> 1, (5 * f + l) >> 1
+            sign = -1
+    # Последний, самый дорогой шаг: L уже не нужно, F(2k+1) = F(k+1)L(k) - (-1)^k
+    if bits[-1] == '1':
+        return ((f + l) >> 1) * l - sign
+    return f * l
+
+def fibonacci_matrix(n: int, mod: Optional[int] = None) -> int:
+    """Фибоначчи возведением матрицы [[1, 1], [1, 0]] в степень n. Сложность O(log n) умножений."""
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+
+    def multiply(x, y):
+        result = (x[0] * y[0] + x[1] * y[2], x[0] * y[1] + x[1] * y[3],
+                  x[2] * y[0] + x[3] * y[2], x[2] * y[1] + x[3] * y[3])
+        return tuple(v % mod for v in result) if mod is not None else result
+
+    result, base = (1, 0, 0, 1), (1, 1, 1, 0)
+    while n:
+        if n & 1:
+            result = multiply(result, base)
+        base = multiply(base, base)
+        n >>= 1
+    return result[1] % mod if mod is not None else result[1]
+
+def fibonacci_batch(ns: Iterable[int], mod: Optional[int] = None) -> List[int]:
+    """
+    F(n) для многих n сразу. При mod < 2^32 и n < 2^64 удвоение идет одновременно
+    для всех n векторами NumPy (произведения остатков помещаются в uint64),
+    иначе (и на малых пакетах) каждое n считается fibonacci_fast_doubling.
+    Сложность O(m log max(n)).
+    """
+    ns = list(ns)
+    # На малых пакетах накладные расходы NumPy на каждый бит больше выигрыша
+    if mod is None or len(ns) < 64 or mod > 1 << 32 or min(ns) < 0 or max(ns) >= 1 << 64:
+        return [fibonacci_fast_doubling(n, mod) for n in ns]
+
+    m = np.uint64(mod)
+    n_arr = np.array(ns, dtype=np.uint64)
+    a = np.zeros(len(ns), dtype=np.uint64)
+    b = np.ones(len(ns), dtype=np.uint64) % m
+    # Ведущие нулевые биты коротких n не меняют пару (F(0), F(1))
+    for shift in range(max(ns).bit_length() - 1, -1, -1):
+        c = a * ((2 * b + m - a) % m) % m
+        d = (a * a % m + b * b % m) % m
+        odd = ((n_arr >> np.uint64(shift)) & np.uint64(1)).astype(bool)
+        a, b = np.where(odd, d, c), np.where(odd, (c + d) % m, d)
+    return a.tolist()
+
 def knapsack_01(weights: List[int], values: List[int], capacity: int) -> int:
     """
     Задача о рюкзаке 0-1. 
@@ -97,6 +174,8 @@ if __name__ == "__main__":
     print(f"Наивный: {fibonacci_naive(10)}")
     print(f"Мемоизация: {fibonacci_memo(10)}")
     print(f"Табличный: {fibonacci_tabular(10)}")
+    print(f"Быстрое удвоение: {fibonacci_fast_doubling(10)}")
+    print(f"F(10^18) mod 10^9+7: {fibonacci_fast_doubling(10**18, 10**9 + 7)}")
     
     print("\nРюкзак 0-1:")
     weights = [2, 3, 4, 5]
@@ -0,0 +1,57 @@
+"""
+Тесты для чисел Фибоначчи за O(log n)
+"""
+import random
+
+import pytest
+
+from src.dynamic_programming import (fibonacci_tabular, fibonacci_fast_doubling, fibonacci_matrix,
+                                     fibonacci_batch)
+
+MOD = 10**9 + 7
+
+
+def fibonacci_list(n, mod=None):
+    values = [0, 1]
+    for _ in range(n - 1):
+        values.append(values[-1] + values[-2] if mod is None else (values[-1] + values[-2]) % mod)
+    return values[:n + 1]
+
+
+def test_fast_doubling_exact():
+    """Тест точных значений: малые n и обе ветви последнего бита"""
+    expected = fibonacci_list(3000)
+    for n in range(3001):
+        assert fibonacci_fast_doubling(n) == expected[n], n
+        assert fibonacci_matrix(n) == expected[n], n
+    assert fibonacci_fast_doubling(10**4) == fibonacci_tabular(10**4)
+    assert fibonacci_fast_doubling(10**4 + 1) == fibonacci_tabular(10**4 + 1)
+
+
+@pytest.mark.parametrize('mod', [1, 2, 10, MOD, 2**32, 2**61 - 1])
+def test_fast_doubling_mod(mod):
+    """Тест вычислений по модулю, включая mod = 1"""
+    expected = fibonacci_list(1000, mod)
+    for n in range(1001):
+        assert fibonacci_fast_doubling(n, mod) == expected[n] % mod, n
+    for n in (10**18, 2**64 - 1, 2**64 + 5):
+        assert fibonacci_fast_doubling(n, mod) == fibonacci_matrix(n, mod)
+
+
+def test_negative_n():
+    """Тест отрицательного n"""
+    with pytest.raises(ValueError):
+        fibonacci_fast_doubling(-1)
+    with pytest.raises(ValueError):
+        fibonacci_matrix(-1)
+
+
+@pytest.mark.parametrize('mod', [None, 7, MOD, 2**32, 2**32 + 1])
+def test_batch(mod):
+    """Тест пакетного режима: векторная ветвь NumPy и поэлементная"""
+    rng = random.Random(12)
+    top = 2**64 if mod else 2000  # без модуля F(n) растет линейно по длине n
+    ns = [0, 1, 2, top - 1] + [rng.randrange(top) for _ in range(200)]
+    assert fibonacci_batch(ns, mod) == [fibonacci_fast_doubling(n, mod) for n in ns]
+    assert fibonacci_batch(ns[:10], mod) == [fibonacci_fast_doubling(n, mod) for n in ns[:10]]
+    assert fibonacci_batch([], mod) == []
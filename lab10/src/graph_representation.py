@@ -1,7 +1,5 @@
 from typing import List, Dict, Set, Any
 import time
-import matplotlib.pyplot as plt
-import numpy as np
 import sys
 
 class AdjacencyMatrix:
@@ -90,6 +88,9 @@ class AdjacencyList:
 
 def compare_representations():
     """Сравнение производительности представлений графов."""
+    # Импорт внутри функции: модули с алгоритмами не должны тянуть matplotlib при загрузке
+    import matplotlib.pyplot as plt
+
     sizes = [10, 50, 100, 200, 500]
     matrix_times = []
     list_times = []
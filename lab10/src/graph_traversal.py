@@ -1,7 +1,6 @@
 from typing import List, Set
 from collections import deque
 import time
-import matplotlib.pyplot as plt
 import random
 from graph_representation import AdjacencyList, AdjacencyMatrix
 
@@ -83,6 +82,8 @@ def bfs_adjacency_matrix(graph: AdjacencyMatrix, start: int) -> List[int]:
 
 def compare_traversal_performance():
     """Сравнение производительности алгоритмов обхода."""
+    import matplotlib.pyplot as plt
+
     sizes = [10, 50, 100, 200, 500]
     bfs_times = []
     dfs_recursive_times = []
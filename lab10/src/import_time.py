@@ -0,0 +1,53 @@
+"""Замер времени импорта модулей с алгоритмами на графах (python -X importtime)."""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+MODULES = ['graph_representation', 'graph_traversal', 'shortest_path']
+
+
+def measure_import_time(modules: List[str]) -> Dict[str, int]:
+    """
+    Импорт модулей в отдельном процессе с флагом -X importtime.
+
+    Returns:
+        Накопленное время импорта каждого модуля в микросекундах
+    """
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    code = 'import ' + ', '.join(modules)
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=src_dir, capture_output=True, text=True, check=True
+    )
+
+    # Строки вида "import time:  self [us] | cumulative | name"
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        parts = [part.strip() for part in line[len('import time:'):].split('|')]
+        if parts[2] in modules:
+            times[parts[2]] = int(parts[1])
+    return times
+
+
+def main(runs: int = 5) -> None:
+    """Медианное время импорта модулей и, для сравнения, matplotlib.pyplot."""
+    samples = {name: [] for name in MODULES + ['matplotlib.pyplot']}
+    for _ in range(runs):
+        for name, value in measure_import_time(MODULES).items():
+            samples[name].append(value)
+        for name, value in measure_import_time(['matplotlib.pyplot']).items():
+            samples[name].append(value)
+
+    print(f"Время импорта (медиана из {runs} запусков, холодный процесс):")
+    for name, values in samples.items():
+        if values:
+            values.sort()
+            print(f"  {name:22s} {values[len(values) // 2] / 1000:8.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,6 @@ import heapq
 from typing import List, Tuple
 import random
 import time
-import matplotlib.pyplot as plt
 from graph_representation import AdjacencyList
 
 def dijkstra(graph: AdjacencyList, start: int) -> List[float]:
@@ -74,6 +73,8 @@ def topological_sort(graph: AdjacencyList) -> List[int]:
 
 def analyze_dijkstra_performance():
     """Анализ производительности алгоритма Дейкстры."""
+    import matplotlib.pyplot as plt
+
     sizes = [10, 50, 100, 200, 500]
     times = []
     
@@ -1,7 +1,11 @@
-import time
 import random
 import matplotlib.pyplot as plt
 import numpy as np
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.benchmark import benchmark
+from common.results_store import ResultsStore
 from prefix_function import prefix_function
 from kmp_search import kmp_search
 from z_function import z_function
@@ -25,16 +29,15 @@ def generate_test_strings(length: int, pattern_length: int) -> tuple[str, str]:
     return text, pattern
 
 
-def measure_time(func, *args, repetitions: int = 10) -> float:
-    """Измерение среднего времени выполнения функции."""
-    times = []
-    for _ in range(repetitions):
-        start_time = time.perf_counter()
-        func(*args)
-        end_time = time.perf_counter()
-        times.append(end_time - start_time)
-    
-    return sum(times) / len(times)
+results_store = ResultsStore(lab='lab11')
+
+
+def measure_time(func, *args, repetitions: int = 10, name: str = None,
+                 family: str = '', size: int = None) -> float:
+    """Измерение медианного времени выполнения функции с сохранением в хранилище результатов."""
+    result = benchmark(func, *args, repeat=repetitions, name=name)
+    results_store.record(result, family=family, size=size)
+    return result.median
 
 
 def compare_algorithms():
@@ -53,7 +56,8 @@ def compare_algorithms():
         text, pattern = generate_test_strings(length, pattern_length)
         
         for name, algorithm in algorithms:
-            time_taken = measure_time(algorithm, text, pattern)
+            time_taken = measure_time(algorithm, text, pattern, name=name,
+                                      family='random_abc', size=length)
             results[name].append(time_taken)
             print(f"{name}: длина текста {length}, время {time_taken:.6f} сек")
     
@@ -88,7 +92,8 @@ def analyze_text_length_impact():
         text = 'a' * length + pattern
         
         for name, algorithm in algorithms:
-            time_taken = measure_time(algorithm, text, pattern)
+            time_taken = measure_time(algorithm, text, pattern, name=name,
+                                      family='repeated_a', size=length)
             results[name].append(time_taken)
     
     # Построение графика
@@ -122,7 +127,8 @@ def analyze_pattern_length_impact():
         text, pattern = generate_test_strings(text_length, p_length)
         
         for name, algorithm in algorithms:
-            time_taken = measure_time(algorithm, text, pattern)
+            time_taken = measure_time(algorithm, text, pattern, name=name,
+                                      family='pattern_length', size=p_length)
             results[name].append(time_taken)
     
     # Построение графика
@@ -152,4 +158,5 @@ if __name__ == "__main__":
     print("Анализ влияния длины паттерна...")
     analyze_pattern_length_impact()
     
-    print("Графики сохранены в папку pics/")
\ No newline at end of file
+    print("Графики сохранены в папку pics/")
+    print(f"Результаты сохранены в {results_store.path} (run_id {results_store.run_id})")
\ No newline at end of file